@@ -0,0 +1,100 @@
+"""Benchmark worker startup with and without create_all.
+
+Boots a number of workers at once, the way uvicorn or a replica rollout does,
+and times how long it takes until every worker has finished its startup.
+Before migrations, each worker's startup ran ``Base.metadata.create_all``,
+which opens a connection and checks the catalog for every table. Now startup
+only enters the app lifespan.
+
+The database must already be migrated (``alembic upgrade head``). The app
+lifespan uses the database configured in the app settings (``POSTGRES_*``), so
+``--database-url`` should point at the same database.
+
+Usage:
+    python -m benchmarks.bench_app_startup --workers 8
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from functools import partial
+
+from fastapi import FastAPI
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.app.api import router
+from src.app.core.config import settings
+from src.app.core.db.database import DATABASE_URL, Base
+from src.app.core.setup import create_application
+
+
+async def create_all_startup(database_url: str) -> None:
+    """Start a worker the previous way: create_all on a fresh engine."""
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+
+async def lifespan_startup() -> None:
+    """Start a worker the current way: enter the app lifespan."""
+    app: FastAPI = create_application(router=router, settings=settings)
+    async with app.router.lifespan_context(app):
+        pass
+
+
+async def measure(
+    startup: Callable[[], Awaitable[None]],
+    workers: int,
+    repeat: int,
+) -> float:
+    """Return the best wall time for all workers to finish starting up."""
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await asyncio.gather(*[startup() for _ in range(workers)])
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+async def check_migrated(database_url: str) -> None:
+    """Exit if the database schema has not been created yet."""
+    engine = create_async_engine(database_url)
+    async with engine.connect() as conn:
+        tables = await conn.run_sync(lambda sync: inspect(sync).get_table_names())
+    await engine.dispose()
+
+    missing = set(Base.metadata.tables) - set(tables)
+    if missing:
+        msg = f"Database is not migrated, run `alembic upgrade head` (missing: {', '.join(sorted(missing))})."
+        raise SystemExit(msg)
+
+
+async def main(database_url: str, workers: int, repeat: int) -> None:
+    """Run the app startup benchmark."""
+    await check_migrated(database_url)
+
+    results = {
+        "create_all": await measure(
+            partial(create_all_startup, database_url), workers, repeat
+        ),
+        "lifespan": await measure(lifespan_startup, workers, repeat),
+    }
+
+    print(f"{'startup':<12}{'workers':>8}{'best (ms)':>12}{'per worker (ms)':>18}")
+    for name, best in results.items():
+        print(f"{name:<12}{workers:>8}{best * 1e3:>12.1f}{best / workers * 1e3:>18.2f}")
+    saving = 1 - results["lifespan"] / results["create_all"]
+    print(f"Startup time saved: {saving:.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.database_url, args.workers, args.repeat))
@@ -0,0 +1,75 @@
+"""Benchmark CIDR overlap detection.
+
+Compares the sorted interval sweep used by template validation against
+checking every pair of networks with ``IPv4Network.overlaps``. Networks are
+random /28 subnets of 10.0.0.0/8, so a few of them collide.
+
+Usage:
+    python -m benchmarks.bench_cidr_overlap --sizes 1000 5000 10000
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Sequence
+from ipaddress import IPv4Network
+from itertools import combinations
+
+from src.app.validators.network import find_overlapping_networks
+
+
+def pairwise_overlaps(networks: Sequence[IPv4Network]) -> list[tuple[int, int]]:
+    """Find overlapping networks by comparing every pair."""
+    return [
+        (i, j)
+        for (i, a), (j, b) in combinations(enumerate(networks), 2)
+        if a.overlaps(b)
+    ]
+
+
+def measure(
+    find: Callable[[Sequence[IPv4Network]], list[tuple[int, int]]],
+    networks: Sequence[IPv4Network],
+) -> tuple[float, int]:
+    """Time one overlap search and count the pairs found."""
+    start = time.perf_counter()
+    overlaps = find(networks)
+    return time.perf_counter() - start, len(overlaps)
+
+
+def main(sizes: list[int], max_pairwise: int, seed: int) -> None:
+    """Run the CIDR overlap benchmark."""
+    rng = random.Random(seed)
+    print(f"{'subnets':>8}{'overlaps':>10}{'sweep (ms)':>12}{'pairwise (ms)':>15}")
+    for size in sizes:
+        networks = [
+            IPv4Network((0x0A000000 + rng.randrange(1 << 20) * 16, 28))
+            for _ in range(size)
+        ]
+
+        sweep_time, found = measure(find_overlapping_networks, networks)
+        if size <= max_pairwise:
+            pairwise_time, pairwise_found = measure(pairwise_overlaps, networks)
+            assert pairwise_found == found
+            pairwise = f"{pairwise_time * 1000:>15.1f}"
+        else:
+            pairwise = f"{'skipped':>15}"
+
+        print(f"{size:>8}{found:>10}{sweep_time * 1000:>12.1f}{pairwise}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 5_000, 10_000, 100_000]
+    )
+    parser.add_argument(
+        "--max-pairwise",
+        type=int,
+        default=5_000,
+        help="Largest size to also check pair by pair (quadratic)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    main(args.sizes, args.max_pairwise, args.seed)
@@ -0,0 +1,77 @@
+"""Benchmark cold start of a process importing the app settings and the app.
+
+Every worker and test process imports the settings. They used to resolve the
+app version from git (a subprocess) and create the CDKTF temp dir at import
+time. Now both happen on first use. Importing the app still needs the version
+(for the OpenAPI docs): without the build time version file it is resolved
+from git once per commit and cached on disk. Each variant is timed in fresh
+interpreters, which is what a worker boot pays.
+
+Usage:
+    python -m benchmarks.bench_cold_start --runs 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# The import-time work the settings did before, replayed ahead of the import
+EAGER_STARTUP = """
+import os, tempfile
+from setuptools_scm import get_version
+get_version()
+os.rmdir(tempfile.mkdtemp(prefix=".openlabs-cdktf-"))
+import src.app.core.config
+"""
+
+LAZY_STARTUP = "import src.app.core.config"
+
+# The app, with the version resolved from git (the version cache is dropped)
+APP_GIT_VERSION = """
+from src.app.utils.version_utils import VERSION_CACHE_FILE
+VERSION_CACHE_FILE.unlink(missing_ok=True)
+import src.app.main
+"""
+
+# The app, with the version cached by an earlier process
+APP_CACHED_VERSION = "import src.app.main"
+
+VARIANTS = {
+    "import-time git + temp dir": EAGER_STARTUP,
+    "lazy": LAZY_STARTUP,
+    "app, version from git": APP_GIT_VERSION,
+    "app, cached version": APP_CACHED_VERSION,
+}
+
+
+def cold_start(code: str) -> float:
+    """Time a fresh interpreter running the code, in milliseconds."""
+    start = time.perf_counter()
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-W", "ignore", "-c", code],
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main(runs: int) -> None:
+    """Run the cold start benchmark."""
+    print(f"{'variant':<28}{'median (ms)':>13}{'min (ms)':>10}")
+    for name, code in VARIANTS.items():
+        cold_start(code)  # Warm the OS file cache
+        times = [cold_start(code) for _ in range(runs)]
+        print(f"{name:<28}{statistics.median(times):>13.1f}{min(times):>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Processes per variant")
+    args = parser.parse_args()
+
+    main(args.runs)
@@ -0,0 +1,83 @@
+"""Benchmark host validation of large subnet templates.
+
+Compares validating a subnet, which checks the host rules of all its hosts
+in one batched pass, against validating the same hosts one by one with the
+per-host field validators (the path taken for invalid hosts).
+
+Usage:
+    python -m benchmarks.bench_host_validation --sizes 1000 10000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from src.app.schemas.template_host_schema import TemplateHostBaseSchema
+from src.app.schemas.template_subnet_schema import TemplateSubnetBaseSchema
+
+host_list_adapter = TypeAdapter(list[TemplateHostBaseSchema])
+
+
+def subnet_payload(size: int) -> dict[str, Any]:
+    """Build a valid subnet template payload with the given number of hosts."""
+    return {
+        "cidr": "10.0.0.0/16",
+        "name": "bench-subnet",
+        "hosts": [
+            {
+                "hostname": f"bench-host-{i}.example.com",
+                "os": "debian_11",
+                "spec": "tiny",
+                "size": 8,
+                "tags": ["web", "linux"],
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def validate_batched(payload: dict[str, Any]) -> None:
+    """Validate the subnet, batching the host rules."""
+    TemplateSubnetBaseSchema.model_validate(payload)
+
+
+def validate_per_host(payload: dict[str, Any]) -> None:
+    """Validate every host with its own field validators."""
+    hosts = host_list_adapter.validate_python(payload["hosts"])
+    assert len({host.hostname for host in hosts}) == len(hosts)
+
+
+def measure(
+    validate: Callable[[dict[str, Any]], None], payload: dict[str, Any], repeat: int
+) -> float:
+    """Get the best of several validation times in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate(payload)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(sizes: list[int], repeat: int) -> None:
+    """Run the host validation benchmark."""
+    print(f"{'hosts':>8}{'batched (ms)':>14}{'per host (ms)':>15}{'speedup':>9}")
+    for size in sizes:
+        payload = subnet_payload(size)
+        batched = measure(validate_batched, payload, repeat)
+        per_host = measure(validate_per_host, payload, repeat)
+        print(f"{size:>8}{batched:>14.1f}{per_host:>15.1f}{per_host / batched:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Runs per size, best one is reported"
+    )
+    args = parser.parse_args()
+
+    main(args.sizes, args.repeat)
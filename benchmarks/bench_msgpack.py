@@ -0,0 +1,114 @@
+"""Benchmark JSON vs. MessagePack encoding of range templates.
+
+Compares the payload size of a range template in both formats, the server
+side cost of encoding the response (as done by `PydanticJSONResponse`) and
+the client side cost of decoding it.
+
+Usage:
+    python -m benchmarks.bench_msgpack --sizes 100 1000 10000
+"""
+
+import argparse
+import json
+import time
+import uuid
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import msgpack
+from pydantic_core import to_json, to_jsonable_python
+
+from src.app.schemas.template_range_schema import TemplateRangeSchema
+
+
+def range_template(size: int) -> TemplateRangeSchema:
+    """Build a range template with the given number of hosts."""
+    return TemplateRangeSchema.model_validate(
+        {
+            "id": str(uuid.uuid4()),
+            "provider": "aws",
+            "name": "bench-range",
+            "vnc": False,
+            "vpn": False,
+            "vpcs": [
+                {
+                    "id": str(uuid.uuid4()),
+                    "cidr": "10.0.0.0/16",
+                    "name": "bench-vpc",
+                    "subnets": [
+                        {
+                            "id": str(uuid.uuid4()),
+                            "cidr": "10.0.0.0/16",
+                            "name": "bench-subnet",
+                            "hosts": [
+                                {
+                                    "id": str(uuid.uuid4()),
+                                    "hostname": f"bench-host-{i}",
+                                    "os": "debian_11",
+                                    "spec": "tiny",
+                                    "size": 8,
+                                    "tags": ["web", "linux"],
+                                }
+                                for i in range(size)
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+
+
+def encode_msgpack(template: TemplateRangeSchema) -> bytes:
+    """Encode a template to MessagePack the way `PydanticJSONResponse` does."""
+    body: bytes = msgpack.packb(to_jsonable_python(template))
+    return body
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Get the best of several run times in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main(sizes: list[int], repeat: int) -> None:
+    """Run the encoding benchmark."""
+    print(
+        f"{'hosts':>8}{'format':>9}{'size (KiB)':>12}"
+        f"{'encode (ms)':>13}{'decode (ms)':>13}"
+    )
+    for size in sizes:
+        template = range_template(size)
+        encoders: dict[str, Callable[[], bytes]] = {
+            "json": partial(to_json, template),
+            "msgpack": partial(encode_msgpack, template),
+        }
+        decoders: dict[str, Callable[[bytes], Any]] = {
+            "json": json.loads,
+            "msgpack": msgpack.unpackb,
+        }
+
+        for name, encode in encoders.items():
+            body = encode()
+            encode_time = measure(encode, repeat)
+            decode_time = measure(partial(decoders[name], body), repeat)
+            print(
+                f"{size:>8}{name:>9}{len(body) / 1024:>12.1f}"
+                f"{encode_time:>13.2f}{decode_time:>13.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument(
+        "--repeat", type=int, default=10, help="Runs per size, best one is reported"
+    )
+    args = parser.parse_args()
+
+    main(args.sizes, args.repeat)
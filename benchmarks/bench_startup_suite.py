@@ -0,0 +1,349 @@
+"""Benchmark suite for import time and time to first request.
+
+Every measurement runs in a fresh interpreter, the way a worker boots:
+
+- import time of ``src.app.main`` per module (from ``python -X importtime``),
+  summed by top-level package
+- time to import the app, to run its lifespan startup, and to serve the
+  first ``/health/ping``
+- time to run the lifespan startup and serve the first template GET after
+  import (needs the database configured in ``.env``, skip with ``--skip-db``)
+- time to import cdktf and synthesize the first deploy stack, with
+  terraform stubbed out (nothing is applied)
+
+Results are appended to ``benchmarks/results/startup_suite.jsonl`` with the
+commit they were measured on, and compared against the previous record (or
+the latest record of ``--compare-to``), so regressions show up across
+commits.
+
+Usage:
+    python -m benchmarks.bench_startup_suite --runs 5
+    python -m benchmarks.bench_startup_suite --compare-to 1a2b3c4
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+RESULTS_FILE = PROJECT_ROOT / "benchmarks" / "results" / "startup_suite.jsonl"
+
+PING_ROUTE = "/api/v1/health/ping"
+TEMPLATE_ROUTE = "/api/v1/templates/ranges"
+
+# Modules listed individually in the results, by cumulative import time
+SLOWEST_IMPORTS = 20
+
+
+def elapsed_ms(start: float) -> float:
+    """Get the milliseconds elapsed since a perf_counter() start."""
+    return (time.perf_counter() - start) * 1000
+
+
+async def first_request(name: str, route: str) -> dict[str, float]:
+    """Start the app and serve one GET request from it, in milliseconds.
+
+    ASGITransport does not send lifespan events, so the app is started and
+    shut down through its lifespan context, as a server would. The startup
+    is timed apart from the request, the shutdown is not timed.
+    """
+    import httpx
+
+    from src.app.main import app
+
+    start = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        lifespan_ms = elapsed_ms(start)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            start = time.perf_counter()
+            response = await client.get(route)
+            request_ms = elapsed_ms(start)
+
+    if response.status_code >= 500:
+        msg = f"GET {route} failed with {response.status_code}."
+        raise RuntimeError(msg)
+    return {f"{name}_lifespan_ms": lifespan_ms, f"first_{name}_ms": request_ms}
+
+
+def measure_first_ping() -> dict[str, float]:
+    """Import the app, start it and serve the first ping."""
+    start = time.perf_counter()
+    import src.app.main
+
+    import_ms = elapsed_ms(start)
+    return {
+        "import_main_ms": import_ms,
+        **asyncio.run(first_request("ping", PING_ROUTE)),
+    }
+
+
+def measure_first_template_get() -> dict[str, float]:
+    """Import and start the app and serve the first template GET from the database."""
+    return asyncio.run(first_request("template_get", TEMPLATE_ROUTE))
+
+
+def measure_first_deploy_synth() -> dict[str, float]:
+    """Import cdktf and synthesize the first deploy stack, without terraform."""
+    from src.app.schemas.template_range_schema import (
+        TemplateRangeSchema,
+    )
+    from src.app.utils.cdktf_utils import create_cdktf_dir
+
+    cyber_range = TemplateRangeSchema.model_validate(
+        {
+            "id": str(uuid.uuid4()),
+            "provider": "aws",
+            "name": "bench-range",
+            "vnc": False,
+            "vpn": False,
+            "vpcs": [
+                {
+                    "id": str(uuid.uuid4()),
+                    "cidr": "10.0.0.0/16",
+                    "name": "bench-vpc",
+                    "subnets": [
+                        {
+                            "id": str(uuid.uuid4()),
+                            "cidr": "10.0.1.0/24",
+                            "name": "bench-subnet",
+                            "hosts": [
+                                {
+                                    "id": str(uuid.uuid4()),
+                                    "hostname": f"bench-host-{i}",
+                                    "os": "debian_11",
+                                    "spec": "tiny",
+                                    "size": 8,
+                                    "tags": [],
+                                }
+                                for i in range(5)
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    )
+    cdktf_dir = create_cdktf_dir()
+
+    start = time.perf_counter()
+    from src.app.core.cdktf.aws.aws import create_aws_stack
+
+    import_ms = elapsed_ms(start)
+    try:
+        create_aws_stack(cyber_range, cdktf_dir, uuid.uuid4())
+        synth_ms = elapsed_ms(start) - import_ms
+    finally:
+        shutil.rmtree(cdktf_dir, ignore_errors=True)
+
+    return {"import_cdktf_ms": import_ms, "first_deploy_synth_ms": synth_ms}
+
+
+MEASUREMENTS: dict[str, Callable[[], dict[str, float]]] = {
+    "ping": measure_first_ping,
+    "template_get": measure_first_template_get,
+    "deploy_synth": measure_first_deploy_synth,
+}
+
+
+def run_measurement(name: str) -> dict[str, float]:
+    """Run a measurement in a fresh interpreter."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "ignore",
+            "-m",
+            "benchmarks.bench_startup_suite",
+            "--measure",
+            name,
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Last line, anything before it is output of the measured code
+    metrics: dict[str, float] = json.loads(result.stdout.strip().splitlines()[-1])
+    return metrics
+
+
+def import_times() -> tuple[dict[str, float], dict[str, float]]:
+    """Import the app in a fresh interpreter with ``-X importtime``.
+
+    Returns
+    -------
+        tuple[dict[str, float], dict[str, float]]: Self import time summed by
+            top-level package, and cumulative import time of every module,
+            both in milliseconds.
+
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-W",
+            "ignore",
+            "-X",
+            "importtime",
+            "-c",
+            "import src.app.main",
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    packages: dict[str, float] = defaultdict(float)
+    modules: dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        module = module.strip()
+        package = "src" if module.startswith("src.") else module.split(".")[0]
+        packages[package] += int(self_us) / 1000
+        modules[module] = int(cumulative_us) / 1000
+
+    return dict(packages), modules
+
+
+def medians(
+    samples: dict[str, list[float]], limit: int | None = None
+) -> dict[str, float]:
+    """Get the median of each sample list, largest first, up to a limit."""
+    values = sorted(
+        ((name, statistics.median(values)) for name, values in samples.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    return {name: round(value, 2) for name, value in values[:limit]}
+
+
+def git_commit() -> str:
+    """Get the current commit, marked dirty if the tree has changes."""
+    commit = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+    dirty = subprocess.run(
+        ["git", "diff", "--quiet", "HEAD"], cwd=PROJECT_ROOT, check=False
+    ).returncode
+    return f"{commit}-dirty" if dirty else commit
+
+
+def load_baseline(results_file: Path, commit: str | None) -> dict[str, Any] | None:
+    """Get the latest stored record, of the given commit if any."""
+    if not results_file.exists():
+        return None
+
+    baseline = None
+    with results_file.open(encoding="utf-8") as file:
+        for line in file:
+            record = json.loads(line)
+            if commit is None or record["commit"].startswith(commit):
+                baseline = record
+    return baseline
+
+
+def print_results(record: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    """Print the results, with the change from the baseline if any."""
+    base_metrics = baseline["metrics"] if baseline else {}
+    base_packages = baseline["import_packages_ms"] if baseline else {}
+    label = f"  vs. {baseline['commit']}" if baseline else ""
+
+    def row(name: str, value: float, base: float | None) -> str:
+        change = f"{(value - base) / base:>+10.1%}" if base else ""
+        return f"{name:<28}{value:>12.1f}{change}"
+
+    print(f"{'metric (median ms)':<28}{'value':>12}{label}")
+    for name, value in record["metrics"].items():
+        print(row(name, value, base_metrics.get(name)))
+
+    print(f"\n{'import by package (self ms)':<28}{'value':>12}{label}")
+    for name, value in list(record["import_packages_ms"].items())[:10]:
+        print(row(name, value, base_packages.get(name)))
+
+    print(f"\n{'slowest imports (cumul. ms)':<28}{'value':>12}")
+    for name, value in list(record["slowest_imports_ms"].items())[:10]:
+        print(row(name, value, None))
+
+
+def main(runs: int, skip_db: bool, compare_to: str | None, save: bool) -> None:
+    """Run the startup benchmark suite."""
+    names = [name for name in MEASUREMENTS if not (skip_db and name == "template_get")]
+
+    samples: dict[str, list[float]] = defaultdict(list)
+    package_samples: dict[str, list[float]] = defaultdict(list)
+    module_samples: dict[str, list[float]] = defaultdict(list)
+    for _ in range(runs):
+        for name in names:
+            for metric, value in run_measurement(name).items():
+                samples[metric].append(value)
+
+        packages, modules = import_times()
+        for package, value in packages.items():
+            package_samples[package].append(value)
+        for module, value in modules.items():
+            module_samples[module].append(value)
+
+    record = {
+        "commit": git_commit(),
+        "date": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "runs": runs,
+        "metrics": {
+            metric: round(statistics.median(values), 2)
+            for metric, values in samples.items()
+        },
+        "import_packages_ms": medians(package_samples),
+        "slowest_imports_ms": medians(module_samples, SLOWEST_IMPORTS),
+    }
+
+    print_results(record, load_baseline(RESULTS_FILE, compare_to))
+
+    if save:
+        RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with RESULTS_FILE.open("a", encoding="utf-8") as file:
+            file.write(json.dumps(record) + "\n")
+        print(f"\nSaved to {RESULTS_FILE.relative_to(PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh processes per step")
+    parser.add_argument(
+        "--skip-db", action="store_true", help="Skip steps that need the database"
+    )
+    parser.add_argument(
+        "--compare-to", help="Commit to compare against, defaults to the last record"
+    )
+    parser.add_argument(
+        "--no-save", dest="save", action="store_false", help="Do not store results"
+    )
+    parser.add_argument("--measure", choices=MEASUREMENTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(MEASUREMENTS[args.measure]()))
+    else:
+        main(args.runs, args.skip_db, args.compare_to, args.save)
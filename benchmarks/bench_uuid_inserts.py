@@ -0,0 +1,95 @@
+"""Benchmark UUID4 vs. UUID7 primary key inserts.
+
+Inserts rows in small batches, the way templates are created, into a
+temporary table keyed like the template tables (UUID primary key plus an
+indexed parent UUID). Compares insert throughput and the resulting size of
+the primary-key index. Random UUID4 keys land on random index pages and
+split them, while time-ordered UUID7 keys append to the rightmost page.
+
+Usage:
+    python -m benchmarks.bench_uuid_inserts --rows 200000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.app.core.db.database import DATABASE_URL
+from src.app.utils.uuid_utils import uuid7
+
+
+async def measure(
+    conn: AsyncConnection,
+    id_factory: Callable[[], uuid.UUID],
+    rows: int,
+    batch_size: int,
+) -> dict[str, Any]:
+    """Insert rows with IDs from a factory and report throughput and index size."""
+    await conn.execute(
+        text(
+            "CREATE TEMPORARY TABLE bench_ids "
+            "(id uuid PRIMARY KEY, parent_id uuid, name text NOT NULL)"
+        )
+    )
+    await conn.execute(text("CREATE INDEX ON bench_ids (parent_id)"))
+
+    parent_id = id_factory()
+    start = time.perf_counter()
+    for offset in range(0, rows, batch_size):
+        await conn.execute(
+            text("INSERT INTO bench_ids VALUES (:id, :parent_id, :name)"),
+            [
+                {"id": id_factory(), "parent_id": parent_id, "name": f"row-{i}"}
+                for i in range(offset, min(offset + batch_size, rows))
+            ],
+        )
+    elapsed = time.perf_counter() - start
+
+    index_bytes = await conn.scalar(text("SELECT pg_relation_size('bench_ids_pkey')"))
+    await conn.execute(text("DROP TABLE bench_ids"))
+
+    return {
+        "rows_per_s": rows / elapsed,
+        "index_kib": index_bytes / 1024,
+    }
+
+
+async def main(database_url: str, rows: int, batch_size: int) -> None:
+    """Run the UUID insert benchmark."""
+    engine = create_async_engine(database_url)
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            results = {
+                "uuid4": await measure(conn, uuid.uuid4, rows, batch_size),
+                "uuid7": await measure(conn, uuid7, rows, batch_size),
+            }
+        finally:
+            await trans.rollback()
+    await engine.dispose()
+
+    print(f"{'ids':<8}{'rows':>10}{'rows/s':>12}{'pkey index (KiB)':>19}")
+    for name, stats in results.items():
+        print(
+            f"{name:<8}{rows:>10}{stats['rows_per_s']:>12.0f}"
+            f"{stats['index_kib']:>19.0f}"
+        )
+    speedup = results["uuid7"]["rows_per_s"] / results["uuid4"]["rows_per_s"]
+    shrink = 1 - results["uuid7"]["index_kib"] / results["uuid4"]["index_kib"]
+    print(f"UUID7 insert throughput: {speedup:.2f}x, index size saved: {shrink:.0%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.database_url, args.rows, args.batch_size))
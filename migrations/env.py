@@ -0,0 +1,100 @@
+"""Alembic migration environment for the OpenLabsX API."""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.app.core.db.database import DATABASE_URL, Base
+
+# Import every model so its table is registered on the metadata
+from src.app.models.template_host_model import TemplateHostModel  # noqa: F401
+from src.app.models.template_range_model import TemplateRangeModel  # noqa: F401
+from src.app.models.template_subnet_model import TemplateSubnetModel  # noqa: F401
+from src.app.models.template_vpc_model import TemplateVPCModel  # noqa: F401
+
+config = context.config
+
+# Skip logging setup when run programmatically (e.g. from tests)
+if config.config_file_name is not None and config.attributes.get(
+    "configure_logger", True
+):
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def get_database_url() -> str:
+    """Get the URL of the database to migrate.
+
+    Returns
+    -------
+        str: `-x database_url=...` if passed, then `sqlalchemy.url` from the
+            config, then the app's database URL.
+
+    """
+    x_args = context.get_x_argument(as_dictionary=True)
+    return x_args.get(
+        "database_url", config.get_main_option("sqlalchemy.url", DATABASE_URL)
+    )
+
+
+def run_migrations_offline() -> None:
+    """Emit migration SQL to stdout without connecting to a database."""
+    context.configure(
+        url=get_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """Run migrations on a connection.
+
+    Args:
+    ----
+        connection (Connection): Database connection.
+
+    Returns:
+    -------
+        None
+
+    """
+    context.configure(connection=connection, target_metadata=target_metadata)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    """Run migrations with a single short-lived async connection."""
+    engine = create_async_engine(get_database_url(), poolclass=pool.NullPool)
+
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await engine.dispose()
+
+
+def run_migrations_online() -> None:
+    """Run migrations against a database."""
+    # Reuse a connection passed in programmatically (e.g. from tests)
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
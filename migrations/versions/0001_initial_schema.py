@@ -0,0 +1,104 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 09:18:56.391214
+
+Databases created by the previous startup `create_all` already match this
+revision and only need `alembic stamp 0001`.
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "range_templates",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column(
+            "provider", sa.Enum("AWS", "AZURE", name="openlabsprovider"), nullable=False
+        ),
+        sa.Column("vnc", sa.Boolean(), nullable=False),
+        sa.Column("vpn", sa.Boolean(), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "vpc_templates",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("cidr", postgresql.CIDR(), nullable=False),
+        sa.Column("range_id", sa.UUID(), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["range_id"], ["range_templates.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "subnet_templates",
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("cidr", postgresql.CIDR(), nullable=False),
+        sa.Column("vpc_id", sa.UUID(), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["vpc_id"], ["vpc_templates.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "host_templates",
+        sa.Column("hostname", sa.String(), nullable=False),
+        sa.Column(
+            "os",
+            sa.Enum(
+                "DEBIAN_11",
+                "DEBIAN_12",
+                "UBUNTU_20",
+                "UBUNTU_22",
+                "UBUNTU_24",
+                "SUSE_12",
+                "SUSE_15",
+                "KALI",
+                "WINDOWS_2016",
+                "WINDOWS_2019",
+                "WINDOWS_2022",
+                name="openlabsos",
+            ),
+            nullable=False,
+        ),
+        sa.Column(
+            "spec",
+            sa.Enum("TINY", "SMALL", "MEDIUM", "LARGE", "HUGE", name="openlabsspec"),
+            nullable=False,
+        ),
+        sa.Column("size", sa.Integer(), nullable=False),
+        sa.Column("subnet_id", sa.UUID(), nullable=True),
+        sa.Column("tags", postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["subnet_id"], ["subnet_templates.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("host_templates")
+    op.drop_table("subnet_templates")
+    op.drop_table("vpc_templates")
+    op.drop_table("range_templates")
+
+    bind = op.get_bind()
+    for enum_name in ("openlabsos", "openlabsspec", "openlabsprovider"):
+        sa.Enum(name=enum_name).drop(bind, checkfirst=True)
@@ -0,0 +1,77 @@
+"""Index template hierarchy foreign keys
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 09:21:09.250758
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | Sequence[str] | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_host_templates_standalone",
+        "host_templates",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("subnet_id IS NULL"),
+    )
+    op.create_index(
+        op.f("ix_host_templates_subnet_id"),
+        "host_templates",
+        ["subnet_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_subnet_templates_standalone",
+        "subnet_templates",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("vpc_id IS NULL"),
+    )
+    op.create_index(
+        op.f("ix_subnet_templates_vpc_id"), "subnet_templates", ["vpc_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_vpc_templates_range_id"), "vpc_templates", ["range_id"], unique=False
+    )
+    op.create_index(
+        "ix_vpc_templates_standalone",
+        "vpc_templates",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("range_id IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_vpc_templates_standalone",
+        table_name="vpc_templates",
+        postgresql_where=sa.text("range_id IS NULL"),
+    )
+    op.drop_index(op.f("ix_vpc_templates_range_id"), table_name="vpc_templates")
+    op.drop_index(op.f("ix_subnet_templates_vpc_id"), table_name="subnet_templates")
+    op.drop_index(
+        "ix_subnet_templates_standalone",
+        table_name="subnet_templates",
+        postgresql_where=sa.text("vpc_id IS NULL"),
+    )
+    op.drop_index(op.f("ix_host_templates_subnet_id"), table_name="host_templates")
+    op.drop_index(
+        "ix_host_templates_standalone",
+        table_name="host_templates",
+        postgresql_where=sa.text("subnet_id IS NULL"),
+    )
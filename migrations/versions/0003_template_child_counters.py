@@ -0,0 +1,101 @@
+"""Add nested template counters
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 13:02:41.518204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | Sequence[str] | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "subnet_templates",
+        sa.Column("host_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "vpc_templates",
+        sa.Column("subnet_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "vpc_templates",
+        sa.Column("host_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "range_templates",
+        sa.Column("vpc_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "range_templates",
+        sa.Column("subnet_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.add_column(
+        "range_templates",
+        sa.Column("host_count", sa.Integer(), server_default="0", nullable=False),
+    )
+
+    # Backfill bottom-up, each level summing the counters of the level below
+    op.execute(
+        """
+        UPDATE subnet_templates AS s
+        SET host_count = c.hosts
+        FROM (
+            SELECT subnet_id, count(*) AS hosts
+            FROM host_templates
+            WHERE subnet_id IS NOT NULL
+            GROUP BY subnet_id
+        ) AS c
+        WHERE s.id = c.subnet_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE vpc_templates AS v
+        SET subnet_count = c.subnets, host_count = c.hosts
+        FROM (
+            SELECT vpc_id, count(*) AS subnets, sum(host_count) AS hosts
+            FROM subnet_templates
+            WHERE vpc_id IS NOT NULL
+            GROUP BY vpc_id
+        ) AS c
+        WHERE v.id = c.vpc_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE range_templates AS r
+        SET vpc_count = c.vpcs, subnet_count = c.subnets, host_count = c.hosts
+        FROM (
+            SELECT
+                range_id,
+                count(*) AS vpcs,
+                sum(subnet_count) AS subnets,
+                sum(host_count) AS hosts
+            FROM vpc_templates
+            WHERE range_id IS NOT NULL
+            GROUP BY range_id
+        ) AS c
+        WHERE r.id = c.range_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("range_templates", "host_count")
+    op.drop_column("range_templates", "subnet_count")
+    op.drop_column("range_templates", "vpc_count")
+    op.drop_column("vpc_templates", "host_count")
+    op.drop_column("vpc_templates", "subnet_count")
+    op.drop_column("subnet_templates", "host_count")
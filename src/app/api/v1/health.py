@@ -1,4 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
+
+from ...core.db.database import async_engine, read_engine
+from ...core.db.pool import MeteredAsyncQueuePool
+from ...core.db.query_stats import route_query_metrics
+from ...core.db.statements import statement_cache
+from ...schemas.pool_schema import PoolStatsSchema
+from ...schemas.query_stats_schema import RouteQueryStatsSchema
+from ...schemas.statement_cache_schema import StatementCacheStatsSchema
 
 router = APIRouter(prefix="/health")
 
@@ -13,3 +21,56 @@ async def ping_check() -> dict[str, str]:
 
     """
     return {"msg": "pong"}
+
+
+@router.get("/pool", tags=["health"])
+async def pool_stats() -> dict[str, PoolStatsSchema]:
+    """Get database connection pool statistics for this worker process.
+
+    Returns
+    -------
+        dict[str, PoolStatsSchema]: Current pool usage and cumulative checkout
+            timings of the primary, and of the read replica if configured.
+
+    """
+    engines = {"primary": async_engine}
+    if read_engine is not async_engine:
+        engines["read"] = read_engine
+
+    stats: dict[str, PoolStatsSchema] = {}
+    for name, engine in engines.items():
+        pool = engine.pool
+        if not isinstance(pool, MeteredAsyncQueuePool):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Connection pool statistics are not available.",
+            )
+        stats[name] = pool.stats()
+
+    return stats
+
+
+@router.get("/statements", tags=["health"])
+async def statement_cache_stats() -> StatementCacheStatsSchema:
+    """Get prepared statement cache settings and warm-up for this worker process.
+
+    Returns
+    -------
+        StatementCacheStatsSchema: Statement cache size, pooling mode and the
+            number of connections warmed at startup.
+
+    """
+    return statement_cache.stats()
+
+
+@router.get("/queries", tags=["health"])
+async def query_stats() -> list[RouteQueryStatsSchema]:
+    """Get per-route SQL query statistics for this worker process.
+
+    Returns
+    -------
+        list[RouteQueryStatsSchema]: Query counts and timings for every route
+            requested since the worker started.
+
+    """
+    return route_query_metrics.snapshot()
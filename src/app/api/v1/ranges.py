@@ -1,3 +1,5 @@
+import logging
+import time
 import uuid
 from typing import Any
 
@@ -8,6 +10,9 @@ from ...core.config import settings
 from ...core.db.database import async_get_db
 from ...crud.crud_range_templates import get_range_template
 from ...schemas.template_range_schema import TemplateRangeID, TemplateRangeSchema
+from ...utils.cdktf_utils import get_cdktf_dir
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ranges", tags=["ranges"])
 
@@ -21,6 +26,7 @@ async def deploy_range_from_template(
     # Import CDKTF dependencies to avoid long import times
     from ...core.cdktf.aws.aws import create_aws_stack, deploy_infrastructure
 
+    load_start = time.perf_counter()
     ranges: list[TemplateRangeSchema] = []
     for range_id in range_ids:
         range_model = await get_range_template(db, range_id)
@@ -28,12 +34,17 @@ async def deploy_range_from_template(
             TemplateRangeSchema.model_validate(range_model, from_attributes=True)
         )
 
+    # Return the connection to the pool before the long-running terraform work
+    await db.close()
+    hold_time = time.perf_counter() - load_start
+    log_msg = f"Deploy released its database connection after {hold_time:.3f}s."
+    logger.info(log_msg)
+
+    cdktf_dir = get_cdktf_dir(settings.CDKTF_DIR)
     for deploy_range in ranges:
         deployed_range_id = uuid.uuid4()
-        stack_name = create_aws_stack(
-            deploy_range, settings.CDKTF_DIR, deployed_range_id
-        )
-        state_file = deploy_infrastructure(settings.CDKTF_DIR, stack_name)
+        stack_name = create_aws_stack(deploy_range, cdktf_dir, deployed_range_id)
+        state_file = deploy_infrastructure(cdktf_dir, stack_name)
 
         if not state_file:
             raise HTTPException(
@@ -41,6 +52,7 @@ async def deploy_range_from_template(
                 detail="Failed to read terraform state file.",
             )
         # deployed_range_obj = DeployedRange(deployed_range_id, range_template, state_file, range_template.provider, account: OpenLabsAccount, cloud_account_id: uuid/int) OpenLabsAccount --> Provider --> Cloud Account ID --> AWS Creds
-        # save(db, deployed_range_obj)
+        # Save with a fresh short-lived session, not the closed one above:
+        # async with local_session() as status_db: save(status_db, deployed_range_obj)
 
     return {"deployed": True}
@@ -1,30 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from typing import Annotated, Any
+
+import msgpack
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
-from ...core.db.database import async_get_db
+from ...core.config import settings
+from ...core.db.database import async_get_db, async_get_read_db
+from ...core.middleware.read_your_writes import read_only
+from ...core.negotiation import MsgPackRequest, MsgPackRoute
+from ...core.responses import PydanticJSONResponse
+from ...core.uploads import LimitedRequestStream, read_body, read_range_template
 from ...crud.crud_host_templates import (
     create_host_template,
     delete_host_template,
     get_host_template,
     get_host_template_headers,
+    get_host_template_schema,
 )
 from ...crud.crud_range_templates import (
     create_range_template,
     delete_range_template,
     get_range_template,
     get_range_template_headers,
+    get_range_template_schema,
 )
 from ...crud.crud_subnet_templates import (
     create_subnet_template,
     delete_subnet_template,
     get_subnet_template,
     get_subnet_template_headers,
+    get_subnet_template_schema,
 )
 from ...crud.crud_vpc_templates import (
     create_vpc_template,
     delete_vpc_template,
     get_vpc_template,
     get_vpc_template_headers,
+    get_vpc_template_schema,
 )
 from ...schemas.template_host_schema import (
     TemplateHostBaseSchema,
@@ -43,21 +57,140 @@ from ...schemas.template_subnet_schema import (
     TemplateSubnetID,
     TemplateSubnetSchema,
 )
+from ...schemas.template_validation_schema import (
+    TemplateValidationErrorSchema,
+    TemplateValidationSchema,
+)
 from ...schemas.template_vpc_schema import (
     TemplateVPCBaseSchema,
     TemplateVPCHeaderSchema,
     TemplateVPCID,
     TemplateVPCSchema,
 )
-from ...validators.id import is_valid_uuid4
+from ...utils.cache_utils import LRUCache, content_digest
+from ...utils.depth_utils import nested_exclude
+from ...validators.id import is_valid_uuid
+
+router = APIRouter(prefix="/templates", tags=["templates"], route_class=MsgPackRoute)
+
+# Documents the range template body of endpoints that read the raw request
+RANGE_TEMPLATE_BODY = {
+    "requestBody": {
+        "content": {
+            media_type: {
+                "schema": {"$ref": "#/components/schemas/TemplateRangeBaseSchema"}
+            }
+            for media_type in ("application/json", "application/msgpack")
+        },
+        "required": True,
+    }
+}
+
+# Verdicts of validated range templates by content digest
+validation_cache: LRUCache[bytes, TemplateValidationSchema] = LRUCache(
+    settings.VALIDATION_CACHE_SIZE
+)
+
+
+def validate_range_template(document: Any) -> TemplateValidationSchema:  # noqa: ANN401
+    """Run the full range template validation on a decoded request body.
+
+    Args:
+    ----
+        document (Any): Decoded request body.
+
+    Returns:
+    -------
+        TemplateValidationSchema: Whether the template is valid and its errors.
+
+    """
+    try:
+        TemplateRangeBaseSchema.model_validate(document)
+    except ValidationError as e:
+        return TemplateValidationSchema(
+            valid=False,
+            errors=[
+                TemplateValidationErrorSchema(
+                    loc=list(error["loc"]), msg=error["msg"], type=error["type"]
+                )
+                for error in e.errors(include_url=False)
+            ],
+        )
+    return TemplateValidationSchema(valid=True)
+
+
+@router.post(
+    "/validate",
+    response_model=TemplateValidationSchema,
+    responses={
+        status.HTTP_422_UNPROCESSABLE_ENTITY: {"model": TemplateValidationSchema}
+    },
+    openapi_extra=RANGE_TEMPLATE_BODY,
+)
+@read_only
+async def validate_range_template_endpoint(request: Request) -> PydanticJSONResponse:
+    """Validate a range template without saving it.
+
+    Runs the same validation and size limit as uploading the range template.
+    Verdicts are cached by the canonical JSON content, so validating the same
+    template again (even reformatted, with reordered keys or sent as
+    MessagePack) is a hash lookup.
+
+    Args:
+    ----
+        request (Request): Request with an OpenLabs range template body.
 
-router = APIRouter(prefix="/templates", tags=["templates"])
+    Returns:
+    -------
+        PydanticJSONResponse: Validation verdict, with status 422 if invalid.
+
+    """
+    body = await read_body(LimitedRequestStream(request, settings.MAX_TEMPLATE_SIZE))
+    if isinstance(request, MsgPackRequest):
+        body_format, decode = "msgpack", msgpack.unpackb
+    else:
+        body_format, decode = "json", json.loads
+
+    try:
+        document = decode(body)
+    except (ValueError, msgpack.UnpackException) as e:
+        # Not decodable, rejected without caching
+        verdict = TemplateValidationSchema(
+            valid=False,
+            errors=[
+                TemplateValidationErrorSchema(
+                    loc=[], msg=f"Invalid body: {e}", type=f"{body_format}_invalid"
+                )
+            ],
+        )
+    else:
+        try:
+            digest: bytes | None = content_digest(document)
+        except TypeError:
+            digest = None  # MessagePack binary values, validated without caching
+
+        cached = validation_cache.get(digest) if digest else None
+        if cached is None:
+            verdict = validate_range_template(document)
+            if digest:
+                validation_cache.set(digest, verdict)
+        else:
+            verdict = cached
+
+    return PydanticJSONResponse(
+        verdict,
+        status_code=(
+            status.HTTP_200_OK
+            if verdict.valid
+            else status.HTTP_422_UNPROCESSABLE_ENTITY
+        ),
+    )
 
 
-@router.get("/ranges")
+@router.get("/ranges", response_model=list[TemplateRangeHeaderSchema])
 async def get_range_template_headers_endpoint(
-    db: AsyncSession = Depends(async_get_db),  # noqa: B008
-) -> list[TemplateRangeHeaderSchema]:
+    db: AsyncSession = Depends(async_get_read_db),  # noqa: B008
+) -> PydanticJSONResponse:
     """Get a list of range template headers.
 
     Args:
@@ -66,7 +199,7 @@ async def get_range_template_headers_endpoint(
 
     Returns:
     -------
-        list[TemplateRangeID]: List of range template headers.
+        PydanticJSONResponse: List of range template headers.
 
     """
     range_headers = await get_range_template_headers(db)
@@ -77,35 +210,51 @@ async def get_range_template_headers_endpoint(
             detail="Unable to find any range templates!",
         )
 
-    return [
-        TemplateRangeHeaderSchema.model_validate(header, from_attributes=True)
-        for header in range_headers
-    ]
+    return PydanticJSONResponse(range_headers)
 
 
-@router.get("/ranges/{range_id}")
+@router.get("/ranges/{range_id}", response_model=TemplateRangeSchema)
 async def get_range_template_endpoint(
-    range_id: str, db: AsyncSession = Depends(async_get_db)  # noqa: B008
-) -> TemplateRangeSchema:
+    range_id: str,
+    depth: Annotated[
+        int | None,
+        Query(
+            ge=0,
+            le=3,
+            description=(
+                "Number of nested levels (VPCs, subnets, hosts) to return. "
+                "Defaults to all. Levels past it are left out of the response, "
+                "although the response schema marks them required."
+            ),
+        ),
+    ] = None,
+    db: AsyncSession = Depends(async_get_read_db),  # noqa: B008
+) -> PydanticJSONResponse:
     """Get a range template.
 
+    With `depth`, nested levels past it are left out of the response (e.g.
+    `vpcs` at depth 0), although the response schema marks them required.
+
     Args:
     ----
         range_id (str): ID of the range.
+        depth (Optional[int]): Number of nested levels to return. Defaults to all.
         db (AsyncSession): Async database connection.
 
     Returns:
     -------
-        TemplateRangeSchema: Range template data from database.
+        PydanticJSONResponse: Range template data from database.
 
     """
-    if not is_valid_uuid4(range_id):
+    if not is_valid_uuid(range_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ID provided is not a valid UUID4.",
+            detail="ID provided is not a valid UUID.",
         )
 
-    range_template = await get_range_template(db, TemplateRangeID(id=range_id))
+    range_template = await get_range_template_schema(
+        db, TemplateRangeID(id=range_id), depth
+    )
 
     if not range_template:
         raise HTTPException(
@@ -113,28 +262,40 @@ async def get_range_template_endpoint(
             detail=f"Range with id: {range_id} not found!",
         )
 
-    return TemplateRangeSchema.model_validate(range_template, from_attributes=True)
+    return PydanticJSONResponse(
+        range_template, exclude=nested_exclude(["vpcs", "subnets", "hosts"], depth)
+    )
 
 
-@router.post("/ranges")
+@router.post(
+    "/ranges", response_model=TemplateRangeID, openapi_extra=RANGE_TEMPLATE_BODY
+)
 async def upload_range_template_endpoint(
-    range_template: TemplateRangeBaseSchema,
+    request: Request,
     db: AsyncSession = Depends(async_get_db),  # noqa: B008
-) -> TemplateRangeID:
+) -> PydanticJSONResponse:
     """Upload a range template.
 
+    JSON bodies are parsed and validated as they stream in, so large ranges
+    are never held in memory as one JSON document. MessagePack bodies are
+    decoded whole. Bodies over the configured maximum template size are
+    rejected with 413.
+
     Args:
     ----
-        range_template (TemplateRangeBaseSchema): OpenLabs compliant range template object.
+        request (Request): Request with an OpenLabs compliant range template body.
         db (AsynSession): Async database connection.
 
     Returns:
     -------
-        TemplateRangeID: Identity of the range template.
+        PydanticJSONResponse: Identity of the range template.
 
     """
+    range_template = await read_range_template(request, settings.MAX_TEMPLATE_SIZE)
     created_range = await create_range_template(db, range_template)
-    return TemplateRangeID.model_validate(created_range, from_attributes=True)
+    return PydanticJSONResponse(
+        TemplateRangeID.model_validate(created_range, from_attributes=True)
+    )
 
 
 @router.delete("/ranges/{range_id}")
@@ -153,11 +314,11 @@ async def delete_range_template_endpoint(
         bool: True if successfully deleted. False otherwise.
 
     """
-    # Invalid UUID4 ID
-    if not is_valid_uuid4(range_id):
+    # Invalid UUID ID
+    if not is_valid_uuid(range_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ID provided is not a valid UUID4.",
+            detail="ID provided is not a valid UUID.",
         )
 
     range_template = await get_range_template(db, TemplateRangeID(id=range_id))
@@ -179,11 +340,11 @@ async def delete_range_template_endpoint(
     return await delete_range_template(db, range_template)
 
 
-@router.get("/vpcs")
+@router.get("/vpcs", response_model=list[TemplateVPCHeaderSchema])
 async def get_vpc_template_headers_endpoint(
     standalone_only: bool = True,
-    db: AsyncSession = Depends(async_get_db),  # noqa: B008
-) -> list[TemplateVPCHeaderSchema]:
+    db: AsyncSession = Depends(async_get_read_db),  # noqa: B008
+) -> PydanticJSONResponse:
     """Get a list of vpc template headers.
 
     Args:
@@ -193,7 +354,7 @@ async def get_vpc_template_headers_endpoint(
 
     Returns:
     -------
-        list[TemplateVPCID]: List of vpc template headers.
+        PydanticJSONResponse: List of vpc template headers.
 
     """
     vpc_headers = await get_vpc_template_headers(db, standalone_only=standalone_only)
@@ -204,35 +365,49 @@ async def get_vpc_template_headers_endpoint(
             detail=f"Unable to find any{" standalone" if standalone_only else ""} vpc templates!",
         )
 
-    return [
-        TemplateVPCHeaderSchema.model_validate(header, from_attributes=True)
-        for header in vpc_headers
-    ]
+    return PydanticJSONResponse(vpc_headers)
 
 
-@router.get("/vpcs/{vpc_id}")
+@router.get("/vpcs/{vpc_id}", response_model=TemplateVPCSchema)
 async def get_vpc_template_endpoint(
-    vpc_id: str, db: AsyncSession = Depends(async_get_db)  # noqa: B008
-) -> TemplateVPCSchema:
+    vpc_id: str,
+    depth: Annotated[
+        int | None,
+        Query(
+            ge=0,
+            le=2,
+            description=(
+                "Number of nested levels (subnets, hosts) to return. "
+                "Defaults to all. Levels past it are left out of the response, "
+                "although the response schema marks them required."
+            ),
+        ),
+    ] = None,
+    db: AsyncSession = Depends(async_get_read_db),  # noqa: B008
+) -> PydanticJSONResponse:
     """Get a VPC template.
 
+    With `depth`, nested levels past it are left out of the response (e.g.
+    `subnets` at depth 0), although the response schema marks them required.
+
     Args:
     ----
         vpc_id (str): ID of the VPC template.
+        depth (Optional[int]): Number of nested levels to return. Defaults to all.
         db (AsyncSession): Async database connection.
 
     Returns:
     -------
-        TemplateVPCSchema: Template VPC data from database.
+        PydanticJSONResponse: Template VPC data from database.
 
     """
-    if not is_valid_uuid4(vpc_id):
+    if not is_valid_uuid(vpc_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ID provided is not a valid UUID4.",
+            detail="ID provided is not a valid UUID.",
         )
 
-    vpc_template = await get_vpc_template(db, TemplateVPCID(id=vpc_id))
+    vpc_template = await get_vpc_template_schema(db, TemplateVPCID(id=vpc_id), depth)
 
     if not vpc_template:
         raise HTTPException(
@@ -240,14 +415,16 @@ async def get_vpc_template_endpoint(
             detail=f"VPC with id: {vpc_id} not found!",
         )
 
-    return TemplateVPCSchema.model_validate(vpc_template, from_attributes=True)
+    return PydanticJSONResponse(
+        vpc_template, exclude=nested_exclude(["subnets", "hosts"], depth)
+    )
 
 
-@router.post("/vpcs")
+@router.post("/vpcs", response_model=TemplateVPCID)
 async def upload_vpc_template_endpoint(
     vpc_template: TemplateVPCBaseSchema,
     db: AsyncSession = Depends(async_get_db),  # noqa: B008
-) -> TemplateVPCID:
+) -> PydanticJSONResponse:
     """Upload a VPC template.
 
     Args:
@@ -257,11 +434,13 @@ async def upload_vpc_template_endpoint(
 
     Returns:
     -------
-        TemplateVPCID: Identity of the VPC template.
+        PydanticJSONResponse: Identity of the VPC template.
 
     """
     created_vpc = await create_vpc_template(db, vpc_template)
-    return TemplateVPCID.model_validate(created_vpc, from_attributes=True)
+    return PydanticJSONResponse(
+        TemplateVPCID.model_validate(created_vpc, from_attributes=True)
+    )
 
 
 @router.delete("/vpcs/{vpc_id}")
@@ -280,11 +459,11 @@ async def delete_vpc_template_endpoint(
         bool: True if successfully deleted. False otherwise.
 
     """
-    # Invalid UUID4 ID
-    if not is_valid_uuid4(vpc_id):
+    # Invalid UUID ID
+    if not is_valid_uuid(vpc_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ID provided is not a valid UUID4.",
+            detail="ID provided is not a valid UUID.",
         )
 
     vpc_template = await get_vpc_template(db, TemplateVPCID(id=vpc_id))
@@ -306,11 +485,11 @@ async def delete_vpc_template_endpoint(
     return await delete_vpc_template(db, vpc_template)
 
 
-@router.get("/subnets")
+@router.get("/subnets", response_model=list[TemplateSubnetHeaderSchema])
 async def get_subnet_template_headers_endpoint(
     standalone_only: bool = True,
-    db: AsyncSession = Depends(async_get_db),  # noqa: B008
-) -> list[TemplateSubnetHeaderSchema]:
+    db: AsyncSession = Depends(async_get_read_db),  # noqa: B008
+) -> PydanticJSONResponse:
     """Get a list of subnet template headers.
 
     Args:
@@ -320,7 +499,7 @@ async def get_subnet_template_headers_endpoint(
 
     Returns:
     -------
-        list[TemplateSubnetHeaderSchema]: List of subnet template headers.
+        PydanticJSONResponse: List of subnet template headers.
 
     """
     subnet_headers = await get_subnet_template_headers(
@@ -333,35 +512,51 @@ async def get_subnet_template_headers_endpoint(
             detail=f"Unable to find any{" standalone" if standalone_only else ""} subnet templates!",
         )
 
-    return [
-        TemplateSubnetHeaderSchema.model_validate(header, from_attributes=True)
-        for header in subnet_headers
-    ]
+    return PydanticJSONResponse(subnet_headers)
 
 
-@router.get("/subnets/{subnet_id}")
+@router.get("/subnets/{subnet_id}", response_model=TemplateSubnetSchema)
 async def get_subnet_template_endpoint(
-    subnet_id: str, db: AsyncSession = Depends(async_get_db)  # noqa: B008
-) -> TemplateSubnetSchema:
+    subnet_id: str,
+    depth: Annotated[
+        int | None,
+        Query(
+            ge=0,
+            le=1,
+            description=(
+                "Number of nested levels (hosts) to return. "
+                "Defaults to all. Levels past it are left out of the response, "
+                "although the response schema marks them required."
+            ),
+        ),
+    ] = None,
+    db: AsyncSession = Depends(async_get_read_db),  # noqa: B008
+) -> PydanticJSONResponse:
     """Get a subnet template.
 
+    With `depth`, nested levels past it are left out of the response (e.g.
+    `hosts` at depth 0), although the response schema marks them required.
+
     Args:
     ----
         subnet_id (str): ID of the subnet.
+        depth (Optional[int]): Number of nested levels to return. Defaults to all.
         db (AsyncSession): Async database connection.
 
     Returns:
     -------
-        TemplateSubnetSchema: Subnet data from database.
+        PydanticJSONResponse: Subnet data from database.
 
     """
-    if not is_valid_uuid4(subnet_id):
+    if not is_valid_uuid(subnet_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ID provided is not a valid UUID4.",
+            detail="ID provided is not a valid UUID.",
         )
 
-    subnet_template = await get_subnet_template(db, TemplateSubnetID(id=subnet_id))
+    subnet_template = await get_subnet_template_schema(
+        db, TemplateSubnetID(id=subnet_id), depth
+    )
 
     if not subnet_template:
         raise HTTPException(
@@ -369,14 +564,16 @@ async def get_subnet_template_endpoint(
             detail=f"Subnet with id: {subnet_id} not found!",
         )
 
-    return TemplateSubnetSchema.model_validate(subnet_template, from_attributes=True)
+    return PydanticJSONResponse(
+        subnet_template, exclude=nested_exclude(["hosts"], depth)
+    )
 
 
-@router.post("/subnets")
+@router.post("/subnets", response_model=TemplateSubnetID)
 async def upload_subnet_template_endpoint(
     subnet_template: TemplateSubnetBaseSchema,
     db: AsyncSession = Depends(async_get_db),  # noqa: B008
-) -> TemplateSubnetID:
+) -> PydanticJSONResponse:
     """Upload a subnet template.
 
     Args:
@@ -386,11 +583,20 @@ async def upload_subnet_template_endpoint(
 
     Returns:
     -------
-        TemplateSubnetID: Identity of the subnet template.
+        PydanticJSONResponse: Identity of the subnet template.
 
     """
+    if subnet_template.cidr is None:
+        # Only subnets inside a VPC template get a CIDR allocated
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Standalone subnet templates need a CIDR.",
+        )
+
     created_subnet = await create_subnet_template(db, subnet_template)
-    return TemplateSubnetID.model_validate(created_subnet, from_attributes=True)
+    return PydanticJSONResponse(
+        TemplateSubnetID.model_validate(created_subnet, from_attributes=True)
+    )
 
 
 @router.delete("/subnets/{subnet_id}")
@@ -409,11 +615,11 @@ async def delete_subnet_template_endpoint(
         bool: True if successfully deleted. False otherwise.
 
     """
-    # Invalid UUID4 ID
-    if not is_valid_uuid4(subnet_id):
+    # Invalid UUID ID
+    if not is_valid_uuid(subnet_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ID provided is not a valid UUID4.",
+            detail="ID provided is not a valid UUID.",
         )
 
     subnet_template = await get_subnet_template(db, TemplateSubnetID(id=subnet_id))
@@ -435,11 +641,11 @@ async def delete_subnet_template_endpoint(
     return await delete_subnet_template(db, subnet_template)
 
 
-@router.get("/hosts")
+@router.get("/hosts", response_model=list[TemplateHostSchema])
 async def get_host_template_headers_endpoint(
     standalone_only: bool = True,
-    db: AsyncSession = Depends(async_get_db),  # noqa: B008
-) -> list[TemplateHostSchema]:
+    db: AsyncSession = Depends(async_get_read_db),  # noqa: B008
+) -> PydanticJSONResponse:
     """Get a list of host template headers.
 
     Args:
@@ -449,7 +655,7 @@ async def get_host_template_headers_endpoint(
 
     Returns:
     -------
-        list[TemplateHostID]: List of host template UUIDs.
+        PydanticJSONResponse: List of host template UUIDs.
 
     """
     host_headers = await get_host_template_headers(db, standalone_only=standalone_only)
@@ -460,16 +666,13 @@ async def get_host_template_headers_endpoint(
             detail=f"Unable to find any{" standalone" if standalone_only else ""} host templates!",
         )
 
-    return [
-        TemplateHostSchema.model_validate(header, from_attributes=True)
-        for header in host_headers
-    ]
+    return PydanticJSONResponse(host_headers)
 
 
-@router.get("/hosts/{host_id}")
+@router.get("/hosts/{host_id}", response_model=TemplateHostSchema)
 async def get_host_template_endpoint(
-    host_id: str, db: AsyncSession = Depends(async_get_db)  # noqa: B008
-) -> TemplateHostSchema:
+    host_id: str, db: AsyncSession = Depends(async_get_read_db)  # noqa: B008
+) -> PydanticJSONResponse:
     """Get a host template.
 
     Args:
@@ -479,16 +682,16 @@ async def get_host_template_endpoint(
 
     Returns:
     -------
-        TemplateHostSchema: Host data from database.
+        PydanticJSONResponse: Host data from database.
 
     """
-    if not is_valid_uuid4(host_id):
+    if not is_valid_uuid(host_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ID provided is not a valid UUID4.",
+            detail="ID provided is not a valid UUID.",
         )
 
-    host_template = await get_host_template(db, TemplateHostID(id=host_id))
+    host_template = await get_host_template_schema(db, TemplateHostID(id=host_id))
 
     if not host_template:
         raise HTTPException(
@@ -496,14 +699,14 @@ async def get_host_template_endpoint(
             detail=f"Host template with id: {host_id} not found!",
         )
 
-    return TemplateHostSchema.model_validate(host_template, from_attributes=True)
+    return PydanticJSONResponse(host_template)
 
 
-@router.post("/hosts")
+@router.post("/hosts", response_model=TemplateHostID)
 async def upload_host_template_endpoint(
     host_template: TemplateHostBaseSchema,
     db: AsyncSession = Depends(async_get_db),  # noqa: B008
-) -> TemplateHostID:
+) -> PydanticJSONResponse:
     """Upload a host template.
 
     Args:
@@ -513,11 +716,13 @@ async def upload_host_template_endpoint(
 
     Returns:
     -------
-        TemplateHostID: Identity of the subnet template.
+        PydanticJSONResponse: Identity of the subnet template.
 
     """
     created_host = await create_host_template(db, host_template)
-    return TemplateHostSchema.model_validate(created_host, from_attributes=True)
+    return PydanticJSONResponse(
+        TemplateHostID.model_validate(created_host, from_attributes=True)
+    )
 
 
 @router.delete("/hosts/{host_id}")
@@ -536,11 +741,11 @@ async def delete_host_template_endpoint(
         bool: True if successfully deleted. False otherwise.
 
     """
-    # Invalid UUID4 ID
-    if not is_valid_uuid4(host_id):
+    # Invalid UUID ID
+    if not is_valid_uuid(host_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="ID provided is not a valid UUID4.",
+            detail="ID provided is not a valid UUID.",
         )
 
     host_template = await get_host_template(db, TemplateHostID(id=host_id))
@@ -1,3 +1,4 @@
+import json
 import os
 import subprocess
 import uuid
@@ -8,6 +9,9 @@ from cdktf import App
 from ....schemas.template_range_schema import TemplateRangeSchema
 from .aws_stack import AWSStack
 
+# Written next to the synthesized stack, mapping VPC, subnet and hostname to IP
+HOST_IPS_FILE = "host_ips.json"
+
 
 def deploy_infrastructure(
     stack_dir: str, stack_name: str
@@ -105,8 +109,12 @@ def create_aws_stack(
     """
     stack_name = cyber_range.name + "-" + str(deployed_range_id)
     app = App(outdir=tmp_dir)
-    AWSStack(app, stack_name, cyber_range, tmp_dir)
+    stack = AWSStack(app, stack_name, cyber_range, tmp_dir)
 
     app.synth()
 
+    # Hosts have static private IPs, so the address map is known before deploy
+    host_ips_file = Path(f"{tmp_dir}/stacks/{stack_name}/{HOST_IPS_FILE}")
+    host_ips_file.write_text(json.dumps(stack.host_ips, indent=2), encoding="utf-8")
+
     return stack_name
@@ -19,6 +19,11 @@ from constructs import Construct
 from ....enums.operating_systems import AWS_OS_MAP
 from ....enums.specs import AWS_SPEC_MAP
 from ....schemas.template_range_schema import TemplateRangeSchema
+from ....utils.cidr_utils import (
+    CIDRAllocator,
+    allocate_jump_box_subnet,
+    host_addresses,
+)
 
 
 class AWSStack(TerraformStack):
@@ -48,6 +53,10 @@ class AWSStack(TerraformStack):
         """
         super().__init__(scope, cdktfid)
 
+        # Private IP of every host by VPC, subnet and hostname. Known at synth
+        # time since the instances are created with static private IPs.
+        self.host_ips: dict[str, dict[str, dict[str, str]]] = {}
+
         LocalBackend(
             self,
             path=str(Path(f"{tmp_dir}/stacks/{cdktfid}/terraform.{cdktfid}.tfstate")),
@@ -66,6 +75,7 @@ class AWSStack(TerraformStack):
         )
 
         for vpc in cyber_range.vpcs:
+            vpc_host_ips = self.host_ips.setdefault(vpc.name, {})
 
             # Step 1: Create a VPC
             new_vpc = Vpc(
@@ -77,16 +87,11 @@ class AWSStack(TerraformStack):
                 tags={"Name": vpc.name},
             )
 
-            # Function to derive a subnet CIDR from the VPC CIDR
-            def modify_cidr(vpc_cidr: str, new_third_octet: int) -> str:
-                ip_part, prefix = vpc_cidr.split("/")
-                octets = ip_part.split(".")
-                octets[2] = str(new_third_octet)  # Change the third octet
-                octets[3] = "0"  # Explicitly set the fourth octet to 0
-                return f"{'.'.join(octets)}/24"  # Convert back to CIDR
-
-            # Generate the new subnet CIDR with third octet = 99
-            public_subnet_cidr = modify_cidr(str(vpc.cidr), 99)
+            # Place the jump box subnet in address space no template subnet uses
+            allocator = CIDRAllocator(vpc.cidr)
+            for subnet in vpc.subnets:
+                allocator.reserve(subnet.cidr)
+            public_subnet_cidr = str(allocate_jump_box_subnet(allocator))
 
             # Step 2: Create a Public Subnet for the Jump Box
             public_subnet = Subnet(
@@ -253,9 +258,12 @@ class AWSStack(TerraformStack):
                     subnet_id=new_subnet.id,
                     route_table_id=private_route_table.id,
                 )
-                for (
-                    host
-                ) in subnet.hosts:  # Create specified instances in the given subnet
+                subnet_host_ips = vpc_host_ips.setdefault(subnet.name, {})
+                private_ips = host_addresses(subnet.cidr, len(subnet.hosts))
+                for host, private_ip in zip(
+                    subnet.hosts, private_ips, strict=True
+                ):  # Create specified instances in the given subnet
+                    subnet_host_ips[host.hostname] = str(private_ip)
                     Instance(
                         self,
                         f"{host.hostname}-{vpc.name}",
@@ -264,6 +272,7 @@ class AWSStack(TerraformStack):
                         ],  # WIll need to grab from update OpenLabsRange object
                         instance_type=AWS_SPEC_MAP[host.spec],
                         subnet_id=new_subnet.id,
+                        private_ip=str(private_ip),
                         vpc_security_group_ids=[private_sg.id],
                         key_name=key_pair.key_name,  # Use the generated key pair
                         tags={"Name": f"{host.hostname}-{vpc.name}"},
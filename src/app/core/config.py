@@ -1,10 +1,10 @@
 import os
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
-from setuptools_scm import get_version
 from starlette.config import Config
 
-from ..utils.cdktf_utils import create_cdktf_dir
+from ..validators.id import SUPPORTED_UUID_VERSIONS
 
 current_file_dir = os.path.dirname(os.path.realpath(__file__))
 env_path = os.path.join(current_file_dir, "..", "..", "..", ".env")
@@ -18,9 +18,8 @@ class AppSettings(BaseSettings):
     APP_DESCRIPTION: str | None = config(
         "APP_DESCRIPTION", default="OpenLabsX backend API."
     )
-    APP_VERSION: str | None = config(
-        "APP_VERSION", default=get_version()
-    )  # Latest tagged release
+    # Resolved on first use (build time version file or latest tagged release)
+    APP_VERSION: str | None = config("APP_VERSION", default=None)
     LICENSE_NAME: str | None = config("LICENSE", default="GPLv3")
     LICENSE_URL: str | None = config(
         "LICENSE_URL",
@@ -29,11 +28,62 @@ class AppSettings(BaseSettings):
     CONTACT_NAME: str | None = config("CONTACT_NAME", default="OpenLabsX Support")
     CONTACT_EMAIL: str | None = config("CONTACT_EMAIL", default="support@openlabsx.com")
 
+    # Adds debugging details (e.g. SQL query counts) to responses
+    DEBUG: bool = config("DEBUG", cast=bool, default=False)
+
+    # Version of new object IDs: 4 (random) or 7 (time-ordered)
+    UUID_VERSION: int = config("UUID_VERSION", cast=int, default=4)
+
+    # Verdicts of /templates/validate kept per worker, by template content
+    VALIDATION_CACHE_SIZE: int = config("VALIDATION_CACHE_SIZE", cast=int, default=1024)
+
+    # Largest range template upload accepted, in bytes
+    MAX_TEMPLATE_SIZE: int = config("MAX_TEMPLATE_SIZE", cast=int, default=32 << 20)
+
+    @field_validator("UUID_VERSION")
+    @classmethod
+    def validate_uuid_version(cls, version: int) -> int:
+        """Check that new object IDs use a supported UUID version.
+
+        Args:
+        ----
+            version (int): Configured UUID version.
+
+        Returns:
+        -------
+            int: Configured UUID version.
+
+        """
+        if version not in SUPPORTED_UUID_VERSIONS:
+            msg = (
+                f"UUID_VERSION must be one of {SUPPORTED_UUID_VERSIONS}, got {version}."
+            )
+            raise ValueError(msg)
+        return version
+
 
 class CDKTFSettings(BaseSettings):
     """CDKTF settings."""
 
-    CDKTF_DIR: str = config("CDKTF_DIR", default=create_cdktf_dir())
+    # Created on first use, a new temp dir per process if not set
+    CDKTF_DIR: str | None = config("CDKTF_DIR", default=None)
+
+
+class CompressionSettings(BaseSettings):
+    """Response compression settings."""
+
+    COMPRESSION_MINIMUM_SIZE: int = config("COMPRESSION_MINIMUM_SIZE", default=1024)
+    COMPRESSION_CACHE_SIZE: int = config("COMPRESSION_CACHE_SIZE", default=128)
+    COMPRESSION_GZIP_LEVEL: int = config("COMPRESSION_GZIP_LEVEL", default=6)
+    COMPRESSION_ZSTD_LEVEL: int = config("COMPRESSION_ZSTD_LEVEL", default=3)
+
+
+class LoggingSettings(BaseSettings):
+    """Logging settings."""
+
+    LOG_LEVEL: str = config("LOG_LEVEL", default="INFO")
+    # One JSON object per record instead of text lines
+    LOG_JSON: bool = config("LOG_JSON", cast=bool, default=False)
 
 
 class DatabaseSettings(BaseSettings):
@@ -59,8 +109,47 @@ class PostgresSettings(DatabaseSettings):
     )
     POSTGRES_URL: str | None = config("POSTGRES_URL", default=None)
 
+    # Connection pool (per worker process)
+    POSTGRES_POOL_SIZE: int = config("POSTGRES_POOL_SIZE", default=5)
+    POSTGRES_MAX_OVERFLOW: int = config("POSTGRES_MAX_OVERFLOW", default=10)
+    POSTGRES_POOL_PRE_PING: bool = config("POSTGRES_POOL_PRE_PING", default=False)
+    POSTGRES_POOL_RECYCLE: int = config(
+        "POSTGRES_POOL_RECYCLE", default=-1
+    )  # Seconds, -1 never recycles
+    POSTGRES_POOL_TIMEOUT: float = config("POSTGRES_POOL_TIMEOUT", default=30.0)
+
+    # asyncpg prepared statements cached per connection (0 disables the cache)
+    POSTGRES_STATEMENT_CACHE_SIZE: int = config(
+        "POSTGRES_STATEMENT_CACHE_SIZE", cast=int, default=100
+    )
+    # Behind a transaction pooling proxy (e.g. PgBouncer): no statement cache
+    # and unique statement names, as server connections change every transaction
+    POSTGRES_TRANSACTION_POOLING: bool = config(
+        "POSTGRES_TRANSACTION_POOLING", cast=bool, default=False
+    )
+    # Prepare the hot statements on the pooled connections at startup, each
+    # connection given up (left cold) after the timeout in seconds
+    POSTGRES_WARM_STATEMENTS: bool = config(
+        "POSTGRES_WARM_STATEMENTS", cast=bool, default=False
+    )
+    POSTGRES_WARM_TIMEOUT: float = config(
+        "POSTGRES_WARM_TIMEOUT", cast=float, default=5.0
+    )
+
+    # Optional read replica (user:password@server:port/db) for GET endpoints
+    POSTGRES_READ_URI: str | None = config("POSTGRES_READ_URI", default=None)
+    POSTGRES_READ_AFTER_WRITE_SECONDS: int = config(
+        "POSTGRES_READ_AFTER_WRITE_SECONDS", cast=int, default=5
+    )  # Clients read from the primary this long after a write
+
 
-class Settings(AppSettings, PostgresSettings, CDKTFSettings):
+class Settings(
+    AppSettings,
+    PostgresSettings,
+    CDKTFSettings,
+    CompressionSettings,
+    LoggingSettings,
+):
     """FastAPI app settings."""
 
     pass
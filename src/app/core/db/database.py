@@ -1,10 +1,13 @@
-from typing import AsyncGenerator
+import uuid
+from typing import Any, AsyncGenerator, Callable
 
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import DeclarativeBase, MappedAsDataclass
 
 from ..config import settings
+from .pool import MeteredAsyncQueuePool
 
 
 class Base(DeclarativeBase, MappedAsDataclass):
@@ -17,15 +20,129 @@ DATABASE_URI = settings.POSTGRES_URI
 DATABASE_PREFIX = settings.POSTGRES_ASYNC_PREFIX
 DATABASE_URL = f"{DATABASE_PREFIX}{DATABASE_URI}"
 
-async_engine = create_async_engine(DATABASE_URL, echo=False, future=True)
+# Set after a write: the client reads from the primary until it expires
+READ_PRIMARY_COOKIE = "openlabsx_read_primary"
+
+
+def statement_connect_args(
+    cache_size: int, transaction_pooling: bool
+) -> dict[str, Any]:
+    """Get asyncpg connect arguments for prepared statement handling.
+
+    Args:
+    ----
+        cache_size (int): Prepared statements cached per connection.
+        transaction_pooling (bool): Connect through a transaction pooling proxy,
+            which can hand each transaction a different server connection.
+
+    Returns:
+    -------
+        dict[str, Any]: Connect arguments for `create_async_engine`.
+
+    """
+    if transaction_pooling:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            # Names must not collide with statements other clients left on
+            # the shared server connections
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+
+    return {"prepared_statement_cache_size": cache_size}
+
+
+def create_pooled_engine(url: str) -> AsyncEngine:
+    """Create an async engine with the configured connection pool and statement cache.
+
+    Args:
+    ----
+        url (str): Async database URL.
+
+    Returns:
+    -------
+        AsyncEngine: Engine with a metered connection pool.
+
+    """
+    return create_async_engine(
+        url,
+        echo=False,
+        future=True,
+        poolclass=MeteredAsyncQueuePool,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+        connect_args=statement_connect_args(
+            settings.POSTGRES_STATEMENT_CACHE_SIZE,
+            settings.POSTGRES_TRANSACTION_POOLING,
+        ),
+    )
+
+
+async_engine = create_pooled_engine(DATABASE_URL)
 
 local_session = async_sessionmaker(
     bind=async_engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Read-only queries use the replica when one is configured
+read_engine = (
+    create_pooled_engine(f"{DATABASE_PREFIX}{settings.POSTGRES_READ_URI}")
+    if settings.POSTGRES_READ_URI
+    else async_engine
+)
+
+read_session = (
+    async_sessionmaker(bind=read_engine, class_=AsyncSession, expire_on_commit=False)
+    if read_engine is not async_engine
+    else local_session
+)
+
 
 async def async_get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Yield async Postgres session."""
+    """Yield async Postgres session.
+
+    The session is lazy: it only checks out a pooled connection when the first
+    statement runs, so requests rejected before touching the database (invalid
+    IDs, request validation errors) never use the pool.
+    """
     async_session = local_session
     async with async_session() as db:
         yield db
+
+
+def read_db_dependency(
+    primary_session: async_sessionmaker[AsyncSession],
+    replica_session: async_sessionmaker[AsyncSession],
+) -> Callable[[Request], AsyncGenerator[AsyncSession, None]]:
+    """Create a dependency yielding sessions for read-only endpoints.
+
+    Clients that wrote recently (see `READ_PRIMARY_COOKIE`) read from the
+    primary so they see their own writes despite replication lag.
+
+    Args:
+    ----
+        primary_session (async_sessionmaker[AsyncSession]): Primary session factory.
+        replica_session (async_sessionmaker[AsyncSession]): Replica session factory.
+
+    Returns:
+    -------
+        Callable[[Request], AsyncGenerator[AsyncSession, None]]: FastAPI dependency.
+
+    """
+
+    async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+        if READ_PRIMARY_COOKIE in request.cookies:
+            async_session = primary_session
+        else:
+            async_session = replica_session
+        async with async_session() as db:
+            yield db
+
+    return get_read_db
+
+
+# Yield async Postgres session for GET endpoints (replica if configured)
+async_get_read_db = read_db_dependency(local_session, read_session)
@@ -0,0 +1,108 @@
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+from sqlalchemy.pool.base import PoolProxiedConnection
+
+from ...schemas.pool_schema import PoolStatsSchema
+
+# Connection record info key holding the pool and time of the checkout
+CHECKOUT_KEY = "openlabsx_checkout"
+
+
+def _record_checkin(
+    dbapi_connection: Any,  # noqa: ANN401
+    record: ConnectionPoolEntry,
+) -> None:
+    """Record how long a returned connection was held, on the pool it came from.
+
+    A connection checked out before `dispose()` is recorded on the old pool,
+    as recreated pools share the listener of the pool they replace.
+    """
+    checkout = record.info.pop(CHECKOUT_KEY, None)
+    if checkout is not None:
+        pool, checkout_time = checkout
+        pool.record_checkin(checkout_time)
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait and connection hold times."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize pool and its counters.
+
+        Takes the same arguments as `AsyncAdaptedQueuePool` so the pool can be
+        recreated by the engine.
+        """
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+        self.checkins = 0
+        self.hold_time_total = 0.0
+        self.hold_time_max = 0.0
+        # Recreated pools (after `dispose()`) inherit the old pool's listeners
+        if _record_checkin not in self.dispatch.checkin:
+            event.listen(self, "checkin", _record_checkin)
+
+    def connect(self) -> PoolProxiedConnection:
+        """Check out a connection, timing how long the caller waited for it.
+
+        Wait time includes opening a new connection when the pool has room to
+        grow, and the pre-ping if enabled.
+
+        Returns
+        -------
+            PoolProxiedConnection: Checked out connection.
+
+        """
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            wait_time = time.perf_counter() - start
+            self.wait_time_total += wait_time
+            self.wait_time_max = max(self.wait_time_max, wait_time)
+
+        self.checkouts += 1
+        connection.info[CHECKOUT_KEY] = (self, time.perf_counter())
+        return connection
+
+    def record_checkin(self, checkout_time: float) -> None:
+        """Record a connection returned to the pool.
+
+        Args:
+        ----
+            checkout_time (float): perf_counter() time of the checkout.
+
+        """
+        hold_time = time.perf_counter() - checkout_time
+        self.checkins += 1
+        self.hold_time_total += hold_time
+        self.hold_time_max = max(self.hold_time_max, hold_time)
+
+    def stats(self) -> PoolStatsSchema:
+        """Get a snapshot of the pool's usage.
+
+        Returns
+        -------
+            PoolStatsSchema: Current pool usage and cumulative timings.
+
+        """
+        return PoolStatsSchema(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=self.overflow(),
+            checkouts=self.checkouts,
+            timeouts=self.timeouts,
+            wait_time_avg=self.wait_time_total / max(self.checkouts + self.timeouts, 1),
+            wait_time_max=self.wait_time_max,
+            hold_time_avg=self.hold_time_total / max(self.checkins, 1),
+            hold_time_max=self.hold_time_max,
+        )
@@ -0,0 +1,144 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+
+from ...schemas.query_stats_schema import RouteQueryStatsSchema
+
+# Connection info key holding start times of the statements being executed
+QUERY_START_KEY = "openlabsx_query_start"
+
+
+class QueryStats:
+    """Number of SQL statements executed and their total duration."""
+
+    def __init__(self, parent: "QueryStats | None" = None) -> None:
+        """Initialize query stats.
+
+        Args:
+        ----
+            parent (Optional[QueryStats]): Enclosing stats that also receive
+                every recorded statement.
+
+        """
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record an executed statement here and in all enclosing stats.
+
+        Args:
+        ----
+            duration (float): Statement execution time in seconds.
+
+        Returns:
+        -------
+            None
+
+        """
+        stats: QueryStats | None = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats = stats.parent
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the SQL statements executed in the current context.
+
+    Trackers nest: statements are counted by every active tracker. The
+    context is shared with the greenlets SQLAlchemy runs async drivers in.
+
+    Returns
+    -------
+        Iterator[QueryStats]: Stats updated as statements are executed.
+
+    """
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(conn: Connection, *args: Any) -> None:  # noqa: ANN401
+    """Remember when a statement started executing."""
+    if _current_stats.get() is not None:
+        conn.info.setdefault(QUERY_START_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn: Connection, *args: Any) -> None:  # noqa: ANN401
+    """Record a finished statement in the active query stats."""
+    stats = _current_stats.get()
+    start_times = conn.info.get(QUERY_START_KEY)
+    if stats is not None and start_times:
+        stats.record(time.perf_counter() - start_times.pop())
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_query_timer(context: ExceptionContext) -> None:
+    """Drop the start time of a statement that failed."""
+    if context.connection is not None:
+        start_times = context.connection.info.get(QUERY_START_KEY)
+        if start_times:
+            start_times.pop()
+
+
+class RouteQueryMetrics:
+    """Per-route totals of the SQL statements issued by requests."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._routes: dict[str, RouteQueryStatsSchema] = {}
+
+    def record(self, route: str, stats: QueryStats) -> None:
+        """Add a finished request's query stats to its route's totals.
+
+        Args:
+        ----
+            route (str): Route path template (e.g. /api/v1/templates/ranges/{range_id}).
+            stats (QueryStats): Query stats of the request.
+
+        Returns:
+        -------
+            None
+
+        """
+        totals = self._routes.get(route)
+        if totals is None:
+            totals = RouteQueryStatsSchema(route=route)
+            self._routes[route] = totals
+
+        totals.requests += 1
+        totals.queries += stats.count
+        totals.query_time += stats.duration
+        totals.max_queries = max(totals.max_queries, stats.count)
+
+    def snapshot(self) -> list[RouteQueryStatsSchema]:
+        """Get a copy of the current per-route totals.
+
+        Returns
+        -------
+            list[RouteQueryStatsSchema]: Totals for every route seen, sorted by route.
+
+        """
+        return [self._routes[route].model_copy() for route in sorted(self._routes)]
+
+    def clear(self) -> None:
+        """Reset all totals."""
+        self._routes.clear()
+
+
+route_query_metrics = RouteQueryMetrics()
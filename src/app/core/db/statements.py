@@ -0,0 +1,118 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from ...schemas.statement_cache_schema import StatementCacheStatsSchema
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Query run on a session to prepare its statements
+HotQuery = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class StatementCache:
+    """Per-connection asyncpg prepared statement cache of an engine's pool."""
+
+    def __init__(self, size: int, transaction_pooling: bool) -> None:
+        """Initialize statement cache state.
+
+        Args:
+        ----
+            size (int): Prepared statements cached per connection.
+            transaction_pooling (bool): Connected through a transaction pooling
+                proxy, so statements are never cached.
+
+        """
+        self.size = 0 if transaction_pooling else size
+        self.transaction_pooling = transaction_pooling
+        # Engine name -> connections warmed
+        self.warmed_connections: dict[str, int] = {}
+        self.warmed_statements = 0
+
+    async def warm(
+        self,
+        engine: AsyncEngine,
+        queries: Sequence[HotQuery],
+        connections: int,
+        name: str = "primary",
+        timeout: float | None = None,
+    ) -> None:
+        """Prepare the hot statements on pooled connections ahead of requests.
+
+        Each connection caches its own statements, so the statements are run
+        on several connections at once to fill the pool with warm ones.
+        Failures and timeouts are logged and leave the connection cold.
+
+        Args:
+        ----
+            engine (AsyncEngine): Engine whose pooled connections to warm.
+            queries (Sequence[HotQuery]): Hot queries to run on each connection.
+            connections (int): Number of connections to warm (e.g. pool size).
+            name (str): Engine name the warmed connections are reported under.
+            timeout (Optional[float]): Seconds allowed per connection.
+
+        Returns:
+        -------
+            None
+
+        """
+        if self.size <= 0:
+            return
+
+        async def warm_connection() -> None:
+            async with (
+                asyncio.timeout(timeout),
+                engine.connect() as conn,
+                AsyncSession(bind=conn) as db,
+            ):
+                for query in queries:
+                    await query(db)
+
+        results = await asyncio.gather(
+            *(warm_connection() for _ in range(connections)), return_exceptions=True
+        )
+
+        warmed = 0
+        for result in results:
+            # TimeoutError is an OSError
+            if isinstance(result, SQLAlchemyError | OSError):
+                logger.warning("Failed to warm prepared statements: %r", result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                warmed += 1
+
+        self.warmed_connections[name] = warmed
+        if warmed:
+            self.warmed_statements = len(queries)
+        logger.info(
+            "Prepared %d hot statements on %d %s connections.",
+            len(queries),
+            warmed,
+            name,
+        )
+
+    def stats(self) -> StatementCacheStatsSchema:
+        """Get the statement cache settings and warm-up results.
+
+        Returns
+        -------
+            StatementCacheStatsSchema: Statement cache stats of this worker.
+
+        """
+        return StatementCacheStatsSchema(
+            cache_size=self.size,
+            transaction_pooling=self.transaction_pooling,
+            warmed_connections=self.warmed_connections,
+            warmed_statements=self.warmed_statements,
+        )
+
+
+statement_cache = StatementCache(
+    settings.POSTGRES_STATEMENT_CACHE_SIZE, settings.POSTGRES_TRANSACTION_POOLING
+)
@@ -1,20 +1,205 @@
+import copy
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import threading
+import time
+from datetime import UTC, datetime
+from io import TextIOWrapper
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import SimpleQueue
 
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
-
 LOG_FILE_PATH = os.path.join(LOG_DIR, "app.log")
 
 LOGGING_LEVEL = logging.INFO
 LOGGING_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-logging.basicConfig(level=LOGGING_LEVEL, format=LOGGING_FORMAT)
 
-file_handler = RotatingFileHandler(LOG_FILE_PATH, maxBytes=10485760, backupCount=5)
-file_handler.setLevel(LOGGING_LEVEL)
-file_handler.setFormatter(logging.Formatter(LOGGING_FORMAT))
+class LazyRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler creating its log file and dir on the first record."""
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int) -> None:
+        """Initialize handler without touching the filesystem.
+
+        Args:
+        ----
+            filename (str): Path to the log file.
+            max_bytes (int): Size at which the log file is rotated.
+            backup_count (int): Number of rotated log files kept.
+
+        """
+        super().__init__(
+            filename, maxBytes=max_bytes, backupCount=backup_count, delay=True
+        )
+
+    def _open(self) -> TextIOWrapper:
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+class LocalQueueHandler(QueueHandler):
+    """Queue handler for a listener in the same process.
+
+    The stock handler formats each record on the logging thread and drops its
+    exception and stack info, as queued records may be pickled. Here records
+    stay in process, so only the message arguments are merged (they may
+    change after the call) and formatting is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments into a copy of the record.
+
+        Args:
+        ----
+            record (logging.LogRecord): Log record.
+
+        Returns:
+        -------
+            logging.LogRecord: Record to queue, with its exception and stack
+                info kept.
+
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats log records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record as JSON.
+
+        Args:
+        ----
+            record (logging.LogRecord): Log record.
+
+        Returns:
+        -------
+            str: JSON object with the time, level, logger and message.
+
+        """
+        entry = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets through at most a number of records per period, per logger.
+
+    Meant for loggers reporting bad client input (e.g. invalid IDs sent by
+    scanners), where every request could otherwise produce a log record.
+    The first record let through after a period with dropped records tells
+    how many were dropped.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0) -> None:
+        """Initialize rate limit filter.
+
+        Args:
+        ----
+            rate (int): Records let through per period and logger.
+            period (float): Length of a period in seconds.
+
+        """
+        super().__init__()
+        self.rate = rate
+        self.period = period
+        self._lock = threading.Lock()
+        # Logger name -> (period start, records in period, records dropped)
+        self._windows: dict[str, tuple[float, int, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Check if a record is within the rate limit of its logger.
+
+        Args:
+        ----
+            record (logging.LogRecord): Log record.
+
+        Returns:
+        -------
+            bool: True if the record should be logged. False otherwise.
+
+        """
+        now = time.monotonic()
+        with self._lock:
+            start, count, dropped = self._windows.get(record.name, (now, 0, 0))
+            if now - start >= self.period:
+                start, count = now, 0
+
+            if count >= self.rate:
+                self._windows[record.name] = (start, count, dropped + 1)
+                return False
+            self._windows[record.name] = (start, count + 1, 0)
+
+        if dropped:
+            record.msg = f"{record.getMessage()} ({dropped} similar records dropped)"
+            record.args = None
+        return True
+
+
+def configure_logging(
+    json_format: bool = False, level: int | str = LOGGING_LEVEL
+) -> QueueListener:
+    """Send log records to the console and log file from a background thread.
+
+    Loggers only put records on an unbounded queue, so logging never blocks
+    request handling on file I/O or rotation. A listener thread formats and
+    writes them.
+
+    Args:
+    ----
+        json_format (bool): Write records as JSON objects instead of text.
+        level (int | str): Minimum level (or level name) of the records logged.
+
+    Returns:
+    -------
+        QueueListener: Started listener, to stop on shutdown (flushing the
+            queued records).
+
+    """
+    formatter = JSONFormatter() if json_format else logging.Formatter(LOGGING_FORMAT)
+    handlers: list[logging.Handler] = [
+        logging.StreamHandler(),
+        LazyRotatingFileHandler(LOG_FILE_PATH, max_bytes=10485760, backup_count=5),
+    ]
+    for handler in handlers:
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+
+    log_queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(LocalQueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_logging(listener: QueueListener) -> None:
+    """Write the queued records and detach the queue from the root logger.
+
+    Args:
+    ----
+        listener (QueueListener): Listener returned by `configure_logging()`.
+
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        if isinstance(handler, QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
 
-logging.getLogger("").addHandler(file_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
@@ -0,0 +1 @@
+"""ASGI middleware for the OpenLabsX API."""
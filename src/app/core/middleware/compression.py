@@ -0,0 +1,146 @@
+import gzip
+import hashlib
+
+import zstandard
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...utils.cache_utils import LRUCache
+from ...utils.header_utils import parse_accept
+
+# Preferred encoding first when the client weights them equally
+SUPPORTED_ENCODINGS = ("zstd", "gzip")
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    """Pick the best supported content encoding from an Accept-Encoding header.
+
+    Args:
+    ----
+        accept_encoding (str): Value of the Accept-Encoding request header.
+
+    Returns:
+    -------
+        Optional[str]: Supported encoding with the highest weight. None if the
+            client does not accept any supported encoding.
+
+    """
+    weights: dict[str, float] = {}
+    for coding, weight in parse_accept(accept_encoding):
+        if coding == "*":
+            for encoding in SUPPORTED_ENCODINGS:
+                weights.setdefault(encoding, weight)
+        elif coding in SUPPORTED_ENCODINGS:
+            weights[coding] = weight
+
+    accepted = [enc for enc in SUPPORTED_ENCODINGS if weights.get(enc, 0.0) > 0]
+    if not accepted:
+        return None
+
+    # max() keeps the first (preferred) encoding on ties
+    return max(accepted, key=lambda enc: weights[enc])
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/zstd compression for large, non-streaming responses.
+
+    Compressed bodies are cached by a digest of the uncompressed body, so a hot
+    template that renders to the same bytes is only compressed once.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        cache_size: int = 128,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+    ) -> None:
+        """Initialize compression middleware.
+
+        Args:
+        ----
+            app (ASGIApp): Wrapped ASGI application.
+            minimum_size (int): Smallest body size in bytes that gets compressed.
+            cache_size (int): Max number of compressed bodies to cache.
+            gzip_level (int): Gzip compression level.
+            zstd_level (int): Zstandard compression level.
+
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.zstd_compressor = zstandard.ZstdCompressor(level=zstd_level)
+        self.cache: LRUCache[tuple[bytes, str], bytes] = LRUCache(cache_size)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Compress the response if the client accepts a supported encoding."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body: bytes = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+
+            # Leave streaming, small and already encoded responses untouched
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = self.compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress a response body, reusing a cached result when possible.
+
+        Args:
+        ----
+            body (bytes): Uncompressed response body.
+            encoding (str): Content encoding to apply.
+
+        Returns:
+        -------
+            bytes: Compressed response body.
+
+        """
+        key = (hashlib.blake2b(body, digest_size=16).digest(), encoding)
+        compressed = self.cache.get(key)
+        if compressed is None:
+            if encoding == "zstd":
+                compressed = self.zstd_compressor.compress(body)
+            else:
+                compressed = gzip.compress(body, self.gzip_level, mtime=0)
+            self.cache.set(key, compressed)
+        return compressed
@@ -0,0 +1,78 @@
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..db.query_stats import RouteQueryMetrics, route_query_metrics, track_queries
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time"
+
+
+def route_template(scope: Scope) -> str | None:
+    """Get the path template of the route that handled a request.
+
+    Args:
+    ----
+        scope (Scope): ASGI scope of the request after routing.
+
+    Returns:
+    -------
+        Optional[str]: Route path template (e.g. /api/v1/templates/ranges/{range_id})
+            or None if no route matched.
+
+    """
+    route = scope.get("route")
+    if not isinstance(route, Route):
+        return None
+
+    root_path: str = scope.get("root_path", "")
+    return root_path + route.path_format
+
+
+class QueryStatsMiddleware:
+    """Count the SQL statements each request issues and how long they take.
+
+    Totals are recorded per route. In debug mode the request's own count and
+    time (in milliseconds) are also returned as response headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        debug_headers: bool = False,
+        metrics: RouteQueryMetrics = route_query_metrics,
+    ) -> None:
+        """Initialize query stats middleware.
+
+        Args:
+        ----
+            app (ASGIApp): Wrapped ASGI application.
+            debug_headers (bool): Add query count and time response headers.
+            metrics (RouteQueryMetrics): Per-route totals to record requests in.
+
+        """
+        self.app = app
+        self.debug_headers = debug_headers
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Track the queries issued while handling the request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start" and self.debug_headers:
+                    headers = MutableHeaders(scope=message)
+                    headers[QUERY_COUNT_HEADER] = str(stats.count)
+                    headers[QUERY_TIME_HEADER] = f"{stats.duration * 1000:.3f}"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                route_path = route_template(scope)
+                if route_path is not None:
+                    self.metrics.record(route_path, stats)
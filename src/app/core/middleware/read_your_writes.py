@@ -0,0 +1,83 @@
+from collections.abc import Callable
+from http.cookies import SimpleCookie
+from typing import Any, TypeVar
+
+from starlette import status
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..db.database import READ_PRIMARY_COOKIE
+
+# Methods that never write, so never pin a client to the primary
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+# Endpoints that write nothing despite their method (see `read_only`)
+READ_ONLY_ENDPOINTS: set[Callable[..., Any]] = set()
+
+
+def read_only(endpoint: EndpointT) -> EndpointT:
+    """Mark an endpoint as not writing, so it never pins clients to the primary.
+
+    For endpoints using a write method (e.g. POST) to only compute a result.
+    Apply below the route decorator.
+
+    Args:
+    ----
+        endpoint (EndpointT): Endpoint function.
+
+    Returns:
+    -------
+        EndpointT: The same endpoint function.
+
+    """
+    READ_ONLY_ENDPOINTS.add(endpoint)
+    return endpoint
+
+
+class ReadYourWritesMiddleware:
+    """Pin clients to the primary database for a while after they write.
+
+    Successful writes set a short-lived cookie. While it is present, read-only
+    endpoints use the primary instead of a replica that may still lag behind.
+    Endpoints marked with `read_only` never set it.
+    """
+
+    def __init__(self, app: ASGIApp, max_age: int = 5) -> None:
+        """Initialize read-your-writes middleware.
+
+        Args:
+        ----
+            app (ASGIApp): Wrapped ASGI application.
+            max_age (int): Seconds to read from the primary after a write.
+
+        """
+        self.app = app
+        self.max_age = max_age
+
+        cookie: SimpleCookie = SimpleCookie()
+        cookie[READ_PRIMARY_COOKIE] = "1"
+        cookie[READ_PRIMARY_COOKIE]["max-age"] = max_age
+        cookie[READ_PRIMARY_COOKIE]["path"] = "/"
+        cookie[READ_PRIMARY_COOKIE]["httponly"] = True
+        cookie[READ_PRIMARY_COOKIE]["samesite"] = "lax"
+        self.set_cookie = cookie.output(header="").strip()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Set the primary read cookie on successful write responses."""
+        if scope["type"] != "http" or scope["method"] in READ_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < status.HTTP_400_BAD_REQUEST
+                and scope.get("endpoint") not in READ_ONLY_ENDPOINTS
+            ):
+                headers = MutableHeaders(scope=message)
+                headers.append("Set-Cookie", self.set_cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
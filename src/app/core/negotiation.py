@@ -0,0 +1,122 @@
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
+from typing import Any
+
+import msgpack
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.datastructures import MutableHeaders
+
+from ..utils.header_utils import parse_accept
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Also sent by older MessagePack clients
+_MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+# Media type of the response body negotiated for the current request
+response_media_type: ContextVar[str] = ContextVar(
+    "response_media_type", default=JSON_MEDIA_TYPE
+)
+
+
+def select_media_type(accept: str) -> str:
+    """Pick JSON or MessagePack from an Accept header.
+
+    Args:
+    ----
+        accept (str): Value of the Accept request header.
+
+    Returns:
+    -------
+        str: MessagePack if the client weights it higher than JSON, JSON
+            otherwise (including when the client accepts neither).
+
+    """
+    weights = {JSON_MEDIA_TYPE: 0.0, MSGPACK_MEDIA_TYPE: 0.0}
+    for media_range, weight in parse_accept(accept):
+        if media_range in _MSGPACK_ALIASES:
+            weights[MSGPACK_MEDIA_TYPE] = max(weights[MSGPACK_MEDIA_TYPE], weight)
+        elif media_range in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            weights[JSON_MEDIA_TYPE] = max(weights[JSON_MEDIA_TYPE], weight)
+
+    if weights[MSGPACK_MEDIA_TYPE] > weights[JSON_MEDIA_TYPE]:
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def is_msgpack(content_type: str | None) -> bool:
+    """Check if a Content-Type header is MessagePack.
+
+    Args:
+    ----
+        content_type (Optional[str]): Value of the Content-Type header.
+
+    Returns:
+    -------
+        bool: True if the body is MessagePack. False otherwise.
+
+    """
+    if not content_type:
+        return False
+    return content_type.partition(";")[0].strip().lower() in _MSGPACK_ALIASES
+
+
+class MsgPackRequest(Request):
+    """Request with a MessagePack body, decoded where FastAPI expects JSON.
+
+    The Content-Type seen by FastAPI is rewritten to JSON so request bodies
+    are validated against the same schemas, while `json()` decodes the
+    MessagePack body. Endpoints reading the raw body check for this class.
+    """
+
+    async def json(self) -> Any:  # noqa: ANN401
+        """Decode the MessagePack body.
+
+        Returns
+        -------
+            Any: Decoded body.
+
+        """
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body())
+        return self._json
+
+
+class MsgPackRoute(APIRoute):
+    """Route negotiating JSON or MessagePack request and response bodies.
+
+    Responses built with `PydanticJSONResponse` are encoded in the media type
+    negotiated through the Accept header. Error responses stay JSON.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        """Wrap the route handler with content negotiation.
+
+        Returns
+        -------
+            Callable[[Request], Coroutine[Any, Any, Response]]: Route handler.
+
+        """
+        route_handler = super().get_route_handler()
+
+        async def negotiating_route_handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                scope = dict(request.scope)
+                headers = MutableHeaders(scope=scope)
+                headers["content-type"] = JSON_MEDIA_TYPE
+                request = MsgPackRequest(scope, request.receive)
+
+            token = response_media_type.set(
+                select_media_type(request.headers.get("accept", ""))
+            )
+            try:
+                response = await route_handler(request)
+            finally:
+                response_media_type.reset(token)
+
+            response.headers.add_vary_header("Accept")
+            return response
+
+        return negotiating_route_handler
@@ -0,0 +1,68 @@
+from typing import Any, Mapping
+
+import msgpack
+from fastapi.responses import JSONResponse
+from pydantic.main import IncEx
+from pydantic_core import to_json, to_jsonable_python
+from starlette.background import BackgroundTask
+
+from .negotiation import MSGPACK_MEDIA_TYPE, response_media_type
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON response serialized straight to bytes by the Pydantic core serializer.
+
+    Endpoints return this response directly (declaring the schema with
+    `response_model` for the docs) so FastAPI skips revalidating and
+    re-encoding the content. Pydantic models, lists of models and plain JSON
+    types are all serialized in a single pass.
+
+    On routes negotiating the response format (see `MsgPackRoute`), the
+    content is encoded as MessagePack instead when the client asked for it,
+    from the same JSON compatible representation.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        content: Any,  # noqa: ANN401
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+        exclude: IncEx | None = None,
+    ) -> None:
+        """Initialize response.
+
+        Args:
+        ----
+            content (Any): Pydantic model(s) or JSON compatible object.
+            status_code (int): HTTP status code.
+            headers (Optional[Mapping[str, str]]): Extra response headers.
+            media_type (Optional[str]): Response media type.
+            background (Optional[BackgroundTask]): Task to run after responding.
+            exclude (Optional[IncEx]): Fields to leave out of the serialized content.
+
+        """
+        self.exclude = exclude
+        if media_type is None and response_media_type.get() == MSGPACK_MEDIA_TYPE:
+            media_type = MSGPACK_MEDIA_TYPE
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: Any) -> bytes:  # noqa: ANN401
+        """Serialize content to JSON (or negotiated MessagePack) bytes.
+
+        Args:
+        ----
+            content (Any): Pydantic model(s) or JSON compatible object.
+
+        Returns:
+        -------
+            bytes: Encoded content.
+
+        """
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            body: bytes = msgpack.packb(
+                to_jsonable_python(content, exclude=self.exclude)
+            )
+            return body
+        return to_json(content, exclude=self.exclude)
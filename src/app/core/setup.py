@@ -1,43 +1,80 @@
 from contextlib import asynccontextmanager
-from typing import Any, AsyncContextManager, AsyncGenerator, Callable
+from typing import Any, AsyncContextManager, AsyncGenerator, Callable, Sequence
 
 from fastapi import APIRouter, FastAPI
 
-from .config import AppSettings, DatabaseSettings
-from .db.database import Base
+from ..utils.version_utils import get_app_version
+from .config import (
+    AppSettings,
+    CompressionSettings,
+    DatabaseSettings,
+    LoggingSettings,
+    PostgresSettings,
+)
 from .db.database import async_engine as engine
-
-
-# Function to create database tables
-async def create_tables() -> None:
-    """Create SQL tables."""
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+from .db.database import read_engine
+from .db.statements import HotQuery, statement_cache
+from .logger import configure_logging, stop_logging
+from .middleware.compression import CompressionMiddleware
+from .middleware.query_stats import QueryStatsMiddleware
+from .middleware.read_your_writes import ReadYourWritesMiddleware
+from .responses import PydanticJSONResponse
 
 
 # Lifespan factory to manage app lifecycle events
 def lifespan_factory(
-    settings: DatabaseSettings | AppSettings,
-    create_tables_on_start: bool = True,
+    settings: DatabaseSettings | AppSettings | CompressionSettings | LoggingSettings,
+    warm_queries: Sequence[HotQuery] = (),
 ) -> Callable[[FastAPI], AsyncContextManager[Any]]:
-    """Create a lifespan async context manager for a FastAPI app."""
+    """Create a lifespan async context manager for a FastAPI app.
+
+    The database schema is managed by migrations (`alembic upgrade head`) run
+    once before the app starts, so startup does no schema work. Startup only
+    starts the logging thread and, if enabled, prepares the hot SQL statements
+    on the pooled Postgres connections.
+    """
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[Any, None]:
-
-        if isinstance(settings, DatabaseSettings) and create_tables_on_start:
-            await create_tables()
+        log_listener = None
+        if isinstance(settings, LoggingSettings):
+            log_listener = configure_logging(settings.LOG_JSON, settings.LOG_LEVEL)
+
+        if (
+            isinstance(settings, PostgresSettings)
+            and settings.POSTGRES_WARM_STATEMENTS
+            and warm_queries
+        ):
+            engines = {"primary": engine}
+            if read_engine is not engine:
+                engines["read"] = read_engine
+            for name, warm_engine in engines.items():
+                await statement_cache.warm(
+                    warm_engine,
+                    warm_queries,
+                    settings.POSTGRES_POOL_SIZE,
+                    name=name,
+                    timeout=settings.POSTGRES_WARM_TIMEOUT,
+                )
 
         yield
 
+        if isinstance(settings, DatabaseSettings):
+            await engine.dispose()
+            if read_engine is not engine:
+                await read_engine.dispose()
+
+        if log_listener is not None:
+            stop_logging(log_listener)
+
     return lifespan
 
 
 # Function to create the FastAPI app
 def create_application(
     router: APIRouter,
-    settings: DatabaseSettings | AppSettings,
-    create_tables_on_start: bool = True,
+    settings: DatabaseSettings | AppSettings | CompressionSettings | LoggingSettings,
+    warm_queries: Sequence[HotQuery] = (),
     **kwargs: Any,  # noqa: ANN401
 ) -> FastAPI:
     """Create and configure a FastAPI application based on the provided settings.
@@ -53,9 +90,12 @@ def create_application(
         It determines the configuration applied:
 
         - AppSettings: Configures basic app metadata like name, description, contact, and license info.
-        - DatabaseSettings: Adds event handlers for initializing database tables during startup.
+        - DatabaseSettings: Tracks SQL queries per request and closes pooled database connections on shutdown.
+        - PostgresSettings: Warms prepared statements on startup (if enabled) and, with a read replica, pins clients to the primary right after they write.
+        - CompressionSettings: Adds negotiated gzip/zstd compression for large responses.
+        - LoggingSettings: Logs through a queue written by a background thread while the app runs.
 
-    create_tables_on_start (bool): A flag to indicate whether to create database tables on application startup. Defaults to True.
+    warm_queries (Sequence[HotQuery]): Hot queries whose statements are prepared on the pooled connections at startup, with PostgresSettings.POSTGRES_WARM_STATEMENTS.
 
     **kwargs (Any): Additional keyword arguments passed directly to the FastAPI constructor.
 
@@ -73,7 +113,7 @@ def create_application(
     if isinstance(settings, AppSettings):
         to_update = {
             "title": settings.APP_NAME,
-            "version": settings.APP_VERSION,
+            "version": settings.APP_VERSION or get_app_version(),
             "description": settings.APP_DESCRIPTION,
             "contact": {"name": settings.CONTACT_NAME, "email": settings.CONTACT_EMAIL},
             "license_info": {
@@ -83,9 +123,34 @@ def create_application(
         }
         kwargs.update(to_update)
 
-    lifespan = lifespan_factory(settings, create_tables_on_start=create_tables_on_start)
+    # Serialize responses once, straight to bytes
+    kwargs.setdefault("default_response_class", PydanticJSONResponse)
+
+    lifespan = lifespan_factory(settings, warm_queries)
 
     app = FastAPI(lifespan=lifespan, **kwargs)
     app.include_router(router)
 
+    # --- application created ---
+    if isinstance(settings, DatabaseSettings):
+        app.add_middleware(
+            QueryStatsMiddleware,
+            debug_headers=isinstance(settings, AppSettings) and settings.DEBUG,
+        )
+
+    if isinstance(settings, PostgresSettings) and settings.POSTGRES_READ_URI:
+        app.add_middleware(
+            ReadYourWritesMiddleware,
+            max_age=settings.POSTGRES_READ_AFTER_WRITE_SECONDS,
+        )
+
+    if isinstance(settings, CompressionSettings):
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            cache_size=settings.COMPRESSION_CACHE_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+        )
+
     return app
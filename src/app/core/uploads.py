@@ -0,0 +1,286 @@
+from collections.abc import AsyncIterator
+from typing import Any
+
+import ijson
+import msgpack
+from fastapi import HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from ijson.common import ObjectBuilder
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from ..schemas.template_host_schema import TemplateHostBaseSchema, validate_hosts
+from ..schemas.template_range_schema import TemplateRangeBaseSchema
+from .negotiation import MsgPackRequest
+
+# JSON path prefixes (ijson notation) of the hosts nested in a range template
+HOSTS_PREFIX = "vpcs.item.subnets.item.hosts"
+HOST_PREFIX = f"{HOSTS_PREFIX}.item"
+
+# Hosts parsed before they are validated together and their JSON released
+HOST_CHUNK_SIZE = 1000
+
+_host_list_adapter = TypeAdapter(list[TemplateHostBaseSchema])
+
+
+def _too_large(max_size: int) -> HTTPException:
+    """Build the error for a request body over the size limit."""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Template is larger than the {max_size} byte limit.",
+    )
+
+
+class LimitedRequestStream:
+    """File-like reader over a request body that enforces a maximum size.
+
+    The declared Content-Length is checked before anything is read, and the
+    bytes actually received are counted as the body streams in, so an
+    oversized upload is rejected without being buffered.
+    """
+
+    def __init__(self, request: Request, max_size: int) -> None:
+        """Initialize limited request stream.
+
+        Args:
+        ----
+            request (Request): Request whose body to read.
+            max_size (int): Max number of body bytes accepted.
+
+        """
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_size:
+            raise _too_large(max_size)
+
+        self.max_size = max_size
+        self.size = 0
+        self._chunks: AsyncIterator[bytes] = request.stream()
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read the next chunk of the body as received.
+
+        Args:
+        ----
+            size (int): Zero to read nothing (used by parsers to probe the
+                stream type). Otherwise chunks are returned as they arrive.
+
+        Returns:
+        -------
+            bytes: Next non-empty chunk. Empty at the end of the body.
+
+        """
+        if size == 0:
+            return b""
+
+        async for chunk in self._chunks:
+            if not chunk:
+                continue
+            self.size += len(chunk)
+            if self.size > self.max_size:
+                raise _too_large(self.max_size)
+            return chunk
+        return b""
+
+
+async def read_body(stream: LimitedRequestStream) -> bytes:
+    """Read a whole request body, still bounded by the stream size limit.
+
+    Args:
+    ----
+        stream (LimitedRequestStream): Request body.
+
+    Returns:
+    -------
+        bytes: Request body.
+
+    """
+    body = bytearray()
+    while chunk := await stream.read():
+        body += chunk
+    return bytes(body)
+
+
+class _HostChunks:
+    """Validates the hosts of a range template chunk by chunk while parsing."""
+
+    def __init__(self, chunk_size: int) -> None:
+        self.chunk_size = chunk_size
+        self.vpc_index = -1
+        self.subnet_index = -1
+        self.host_index = 0
+        self.pending: list[Any] = []
+        self.errors: list[ErrorDetails] = []
+
+    def flush(self, builder: ObjectBuilder) -> None:
+        """Validate the pending hosts and add them to the range being built."""
+        if not self.pending:
+            return
+
+        first_index = self.host_index - len(self.pending)
+        try:
+            hosts = validate_hosts(self.pending, _host_list_adapter.validate_python)
+        except ValidationError as e:
+            for error in e.errors(include_url=False):
+                index, *loc = error["loc"]
+                error["loc"] = (
+                    "body",
+                    "vpcs",
+                    self.vpc_index,
+                    "subnets",
+                    self.subnet_index,
+                    "hosts",
+                    first_index + int(index),
+                    *loc,
+                )
+                self.errors.append(error)
+        else:
+            # Validated hosts are added as values, the builder keeps them as is
+            for host in hosts:
+                builder.event("host", host)
+        self.pending = []
+
+
+async def parse_range_template(
+    stream: LimitedRequestStream, chunk_size: int = HOST_CHUNK_SIZE
+) -> TemplateRangeBaseSchema:
+    """Parse and validate a range template from a streamed request body.
+
+    The body is parsed incrementally. Hosts are validated in chunks as they
+    are parsed, keeping only the host objects, so the whole JSON document is
+    never held in memory. The range is validated once all hosts are in,
+    for the range-wide checks (CIDRs, host counts, unique hostnames).
+
+    Args:
+    ----
+        stream (LimitedRequestStream): Request body.
+        chunk_size (int): Number of hosts validated together.
+
+    Returns:
+    -------
+        TemplateRangeBaseSchema: Validated range template.
+
+    """
+    builder = ObjectBuilder()
+    host_builder: ObjectBuilder | None = None
+    in_hosts = False
+    chunks = _HostChunks(chunk_size)
+
+    try:
+        async for prefix, event, value in ijson.parse_async(stream, use_float=True):
+            if in_hosts and prefix.startswith(HOST_PREFIX):
+                if host_builder is None:
+                    if event not in ("start_map", "start_array"):
+                        chunks.pending.append(value)
+                        chunks.host_index += 1
+                        continue
+                    host_builder = ObjectBuilder()
+
+                host_builder.event(event, value)
+                if prefix == HOST_PREFIX and event in ("end_map", "end_array"):
+                    chunks.pending.append(host_builder.value)
+                    chunks.host_index += 1
+                    host_builder = None
+                    if len(chunks.pending) >= chunks.chunk_size:
+                        chunks.flush(builder)
+                continue
+
+            if prefix == "vpcs.item" and event == "start_map":
+                chunks.vpc_index += 1
+                chunks.subnet_index = -1
+            elif prefix == "vpcs.item.subnets.item" and event == "start_map":
+                chunks.subnet_index += 1
+            elif prefix == HOSTS_PREFIX and event == "start_array":
+                in_hosts = True
+                chunks.host_index = 0
+            elif prefix == HOSTS_PREFIX and event == "end_array":
+                chunks.flush(builder)
+                in_hosts = False
+
+            builder.event(event, value)
+    except ijson.JSONError as e:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body",),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": str(e)},
+                }
+            ]
+        ) from e
+
+    if chunks.errors:
+        raise RequestValidationError(chunks.errors)
+
+    return _validate_range_template(builder.value)
+
+
+async def parse_msgpack_range_template(
+    stream: LimitedRequestStream,
+) -> TemplateRangeBaseSchema:
+    """Parse and validate a range template from a MessagePack request body.
+
+    MessagePack bodies are compact and decoded in a single native call, so
+    the body is read whole (still bounded by the stream size limit) rather
+    than parsed incrementally.
+
+    Args:
+    ----
+        stream (LimitedRequestStream): Request body.
+
+    Returns:
+    -------
+        TemplateRangeBaseSchema: Validated range template.
+
+    """
+    try:
+        document = msgpack.unpackb(await read_body(stream))
+    except (ValueError, msgpack.UnpackException) as e:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "msgpack_invalid",
+                    "loc": ("body",),
+                    "msg": "MessagePack decode error",
+                    "input": {},
+                    "ctx": {"error": str(e)},
+                }
+            ]
+        ) from e
+
+    return _validate_range_template(document)
+
+
+async def read_range_template(
+    request: Request, max_size: int
+) -> TemplateRangeBaseSchema:
+    """Parse and validate a range template body in the format it was sent.
+
+    Args:
+    ----
+        request (Request): Request with a JSON or MessagePack range template.
+        max_size (int): Max number of body bytes accepted.
+
+    Returns:
+    -------
+        TemplateRangeBaseSchema: Validated range template.
+
+    """
+    stream = LimitedRequestStream(request, max_size)
+    if isinstance(request, MsgPackRequest):
+        return await parse_msgpack_range_template(stream)
+    return await parse_range_template(stream)
+
+
+def _validate_range_template(document: Any) -> TemplateRangeBaseSchema:  # noqa: ANN401
+    """Run the range-wide validation, reporting errors against the body."""
+    try:
+        return TemplateRangeBaseSchema.model_validate(document)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in e.errors(include_url=False)
+            ]
+        ) from e
@@ -1,9 +1,12 @@
 import logging
+import uuid
+from collections.abc import Sequence
+from itertools import batched
 
-from sqlalchemy import inspect
+from sqlalchemy import insert
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import load_only
 
 from ..models.template_host_model import TemplateHostModel
 from ..schemas.template_host_schema import (
@@ -12,13 +15,24 @@ from ..schemas.template_host_schema import (
     TemplateHostSchema,
 )
 from ..schemas.template_subnet_schema import TemplateSubnetID
+from ..utils.single_flight_utils import SingleFlight
+from ..utils.uuid_utils import generate_uuid
 
 logger = logging.getLogger(__name__)
 
+# Hosts inserted per statement when adding the hosts of a subnet
+HOST_INSERT_CHUNK_SIZE = 1000
+
+# Concurrent read-only lookups of the same template in the same database
+# share one in-flight query
+_host_template_lookups: SingleFlight[
+    tuple[Engine | Connection, uuid.UUID], TemplateHostSchema | None
+] = SingleFlight()
+
 
 async def get_host_template_headers(
     db: AsyncSession, standalone_only: bool = True
-) -> list[TemplateHostModel]:
+) -> list[TemplateHostSchema]:
     """Get list of host template headers.
 
     Args:
@@ -29,26 +43,22 @@ async def get_host_template_headers(
 
     Returns:
     -------
-        list[TemplateHostModel]: List of host template models.
+        list[TemplateHostSchema]: List of host template headers.
 
     """
-    mapped_host_model = inspect(TemplateHostModel)
-    main_columns = [
-        getattr(TemplateHostModel, attr.key) for attr in mapped_host_model.column_attrs
+    # Select plain header columns to skip ORM identity map bookkeeping
+    header_columns = [
+        TemplateHostModel.__table__.c[field]
+        for field in TemplateHostSchema.model_fields
     ]
 
     # Build the query: filter for rows where subnet_id is null if standalone_only is True
+    stmt = select(*header_columns)
     if standalone_only:
-        stmt = (
-            select(TemplateHostModel)
-            .where(TemplateHostModel.subnet_id.is_(None))
-            .options(load_only(*main_columns))
-        )
-    else:
-        stmt = select(TemplateHostModel).options(load_only(*main_columns))
+        stmt = stmt.where(TemplateHostModel.subnet_id.is_(None))
 
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return [TemplateHostSchema.model_validate(row) for row in result.mappings()]
 
 
 async def get_host_template(
@@ -67,10 +77,39 @@ async def get_host_template(
 
     """
     stmt = select(TemplateHostModel).filter(TemplateHostModel.id == host_id.id)
+
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
+async def get_host_template_schema(
+    db: AsyncSession, host_id: TemplateHostID
+) -> TemplateHostSchema | None:
+    """Get host template by id (uuid) for a read-only response.
+
+    Concurrent lookups of the same template share one query and its
+    result, a schema detached from any session that must not be modified.
+
+    Args:
+    ----
+        db (Session): Database connection.
+        host_id (TemplateHostID): ID of the host.
+
+    Returns:
+    -------
+        Optional[TemplateHostSchema]: Host template if it exists in database.
+
+    """
+
+    async def fetch() -> TemplateHostSchema | None:
+        host_model = await get_host_template(db, host_id)
+        if host_model is None:
+            return None
+        return TemplateHostSchema.model_validate(host_model, from_attributes=True)
+
+    return await _host_template_lookups.do((db.get_bind(), host_id.id), fetch)
+
+
 async def create_host_template(
     db: AsyncSession,
     template_host: TemplateHostBaseSchema,
@@ -104,6 +143,39 @@ async def create_host_template(
     return host_obj
 
 
+async def insert_host_templates(
+    db: AsyncSession,
+    template_hosts: Sequence[TemplateHostBaseSchema],
+    subnet_id: TemplateSubnetID,
+    chunk_size: int = HOST_INSERT_CHUNK_SIZE,
+) -> int:
+    """Insert the hosts of a subnet in chunks, without building ORM objects.
+
+    The subnet must already be flushed. Nothing is committed.
+
+    Args:
+    ----
+        db (Session): Database connection.
+        template_hosts (Sequence[TemplateHostBaseSchema]): Hosts of the subnet.
+        subnet_id (TemplateSubnetID): Subnet ID to link the hosts to.
+        chunk_size (int): Max number of hosts inserted per statement.
+
+    Returns:
+    -------
+        int: Number of hosts inserted.
+
+    """
+    for chunk in batched(template_hosts, chunk_size):
+        await db.execute(
+            insert(TemplateHostModel),
+            [
+                {"id": generate_uuid(), "subnet_id": subnet_id.id, **host.model_dump()}
+                for host in chunk
+            ],
+        )
+    return len(template_hosts)
+
+
 async def delete_host_template(db: AsyncSession, host_model: TemplateHostModel) -> bool:
     """Delete a standalone host template.
 
@@ -1,24 +1,38 @@
 import logging
+import uuid
 
-from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import load_only, selectinload
 
 from ..models.template_range_model import TemplateRangeModel
 from ..models.template_subnet_model import TemplateSubnetModel
 from ..models.template_vpc_model import TemplateVPCModel
+from ..schemas.template_host_schema import TemplateHostBaseSchema
 from ..schemas.template_range_schema import (
     TemplateRangeBaseSchema,
+    TemplateRangeHeaderSchema,
     TemplateRangeID,
     TemplateRangeSchema,
 )
-from .crud_vpc_templates import create_vpc_template
+from ..schemas.template_subnet_schema import TemplateSubnetID
+from ..utils.depth_utils import clear_unloaded, nested_load_option
+from ..utils.single_flight_utils import SingleFlight
+from ..utils.uuid_utils import generate_uuid
+from .crud_host_templates import HOST_INSERT_CHUNK_SIZE, insert_host_templates
 
 logger = logging.getLogger(__name__)
 
+# Concurrent read-only lookups of the same template (and depth) in the same
+# database share one in-flight query
+_range_template_lookups: SingleFlight[
+    tuple[Engine | Connection, uuid.UUID, int | None], TemplateRangeSchema | None
+] = SingleFlight()
 
-async def get_range_template_headers(db: AsyncSession) -> list[TemplateRangeModel]:
+
+async def get_range_template_headers(
+    db: AsyncSession,
+) -> list[TemplateRangeHeaderSchema]:
     """Get list of range template headers.
 
     Args:
@@ -27,23 +41,22 @@ async def get_range_template_headers(db: AsyncSession) -> list[TemplateRangeMode
 
     Returns:
     -------
-        list[TemplateRangeModel]: List of range template objects.
+        list[TemplateRangeHeaderSchema]: List of range template headers.
 
     """
-    # Dynamically select non-nested columns/attributes
-    mapped_range_model = inspect(TemplateRangeModel)
-    main_columns = [
-        getattr(TemplateRangeModel, attr.key)
-        for attr in mapped_range_model.column_attrs
+    # Select plain header columns to skip ORM identity map bookkeeping
+    header_columns = [
+        TemplateRangeModel.__table__.c[field]
+        for field in TemplateRangeHeaderSchema.model_fields
     ]
 
-    stmt = select(TemplateRangeModel).options(load_only(*main_columns))
+    stmt = select(*header_columns)
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return [TemplateRangeHeaderSchema.model_validate(row) for row in result.mappings()]
 
 
 async def get_range_template(
-    db: AsyncSession, range_id: TemplateRangeID
+    db: AsyncSession, range_id: TemplateRangeID, depth: int | None = None
 ) -> TemplateRangeModel | None:
     """Get range template by id (uuid).
 
@@ -51,58 +64,121 @@ async def get_range_template(
     ----
         db (Session): Database connection.
         range_id (TemplateRangeID): ID of the range.
+        depth (Optional[int]): Number of nested levels (VPCs, subnets, hosts) to
+            load. Excluded levels are left empty. Defaults to loading all levels.
 
     Returns:
     -------
         Optional[OpenLabsRange]: Range template if it exists in database.
 
     """
-    # Eagerly fetch relationships to make single query
+    # Eagerly fetch only the requested relationships (one query per level)
+    relationships = [
+        TemplateRangeModel.vpcs,
+        TemplateVPCModel.subnets,
+        TemplateSubnetModel.hosts,
+    ]
     stmt = (
         select(TemplateRangeModel)
-        .options(
-            selectinload(TemplateRangeModel.vpcs)
-            .selectinload(TemplateVPCModel.subnets)
-            .selectinload(TemplateSubnetModel.hosts)
-        )
+        .options(nested_load_option(relationships, depth))
         .filter(TemplateRangeModel.id == range_id.id)
     )
+
     result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    range_model = result.scalar_one_or_none()
+    if range_model:
+        clear_unloaded(range_model, relationships, depth)
+
+    return range_model
+
+
+async def get_range_template_schema(
+    db: AsyncSession, range_id: TemplateRangeID, depth: int | None = None
+) -> TemplateRangeSchema | None:
+    """Get range template by id (uuid) for a read-only response.
+
+    Concurrent lookups of the same template (and depth) share one query and its
+    result, a schema detached from any session that must not be modified.
+
+    Args:
+    ----
+        db (Session): Database connection.
+        range_id (TemplateRangeID): ID of the range.
+        depth (Optional[int]): Number of nested levels to load, see
+            `get_range_template()`. Defaults to loading all levels.
+
+    Returns:
+    -------
+        Optional[TemplateRangeSchema]: Range template if it exists in database.
+
+    """
+
+    async def fetch() -> TemplateRangeSchema | None:
+        range_model = await get_range_template(db, range_id, depth)
+        if range_model is None:
+            return None
+        return TemplateRangeSchema.model_validate(range_model, from_attributes=True)
+
+    return await _range_template_lookups.do((db.get_bind(), range_id.id, depth), fetch)
 
 
 async def create_range_template(
-    db: AsyncSession, range_template: TemplateRangeBaseSchema
+    db: AsyncSession,
+    range_template: TemplateRangeBaseSchema,
+    host_chunk_size: int = HOST_INSERT_CHUNK_SIZE,
 ) -> TemplateRangeModel:
     """Create and add a new range template to the database.
 
+    Range, VPC and subnet rows are added through the ORM, hosts (the bulk of
+    a large range) are inserted in chunks without building ORM objects.
+
     Args:
     ----
         db (Session): Database connection.
         range_template (TemplateRangeSchema): Dictionary containing OpenLabsRange data.
+        host_chunk_size (int): Max number of hosts inserted per statement.
 
     Returns:
     -------
         OpenLabsRange: The newly created range template.
 
     """
-    range_template = TemplateRangeSchema(**range_template.model_dump())
     range_dict = range_template.model_dump(exclude={"vpcs"})
-
-    # Create the Range object (No commit yet)
+    range_dict.setdefault("id", generate_uuid())
     range_obj = TemplateRangeModel(**range_dict)
     db.add(range_obj)  # Stage the range
 
-    # Build range ID
-    range_id = TemplateRangeID(id=range_obj.id)
-
-    # Create VPCs and associate them with the range (No commit yet)
-    vpc_objects = [
-        await create_vpc_template(db, vpc_data, range_id)
-        for vpc_data in range_template.vpcs
-    ]
-    # range_obj.vpcs = vpc_objects
-    db.add_all(vpc_objects)  # Stage VPCs
+    # Stage VPCs and subnets, hosts are inserted in chunks once they exist
+    subnet_hosts: list[tuple[TemplateSubnetID, list[TemplateHostBaseSchema]]] = []
+    for vpc in range_template.vpcs:
+        vpc_obj = TemplateVPCModel(
+            id=generate_uuid(),
+            range_id=range_obj.id,
+            **vpc.model_dump(exclude={"subnets"}),
+        )
+        db.add(vpc_obj)
+
+        # Counters for headers, so listings never count the nested templates
+        vpc_obj.subnet_count = len(vpc.subnets)
+        vpc_obj.host_count = sum(len(subnet.hosts) for subnet in vpc.subnets)
+
+        for subnet in vpc.subnets:
+            subnet_obj = TemplateSubnetModel(
+                id=generate_uuid(),
+                vpc_id=vpc_obj.id,
+                host_count=len(subnet.hosts),
+                **subnet.model_dump(exclude={"hosts"}),
+            )
+            db.add(subnet_obj)
+            subnet_hosts.append((TemplateSubnetID(id=subnet_obj.id), subnet.hosts))
+
+    range_obj.vpc_count = len(range_template.vpcs)
+    range_obj.subnet_count = len(subnet_hosts)
+    range_obj.host_count = sum(len(hosts) for _, hosts in subnet_hosts)
+
+    await db.flush()
+    for subnet_id, hosts in subnet_hosts:
+        await insert_host_templates(db, hosts, subnet_id, host_chunk_size)
 
     # Commit everything in one transaction
     await db.commit()
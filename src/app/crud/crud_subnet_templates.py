@@ -1,25 +1,34 @@
 import logging
+import uuid
 
-from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import load_only, selectinload
 
 from ..models.template_subnet_model import TemplateSubnetModel
 from ..schemas.template_subnet_schema import (
     TemplateSubnetBaseSchema,
+    TemplateSubnetHeaderSchema,
     TemplateSubnetID,
     TemplateSubnetSchema,
 )
 from ..schemas.template_vpc_schema import TemplateVPCID
+from ..utils.depth_utils import clear_unloaded, nested_load_option
+from ..utils.single_flight_utils import SingleFlight
 from .crud_host_templates import create_host_template
 
 logger = logging.getLogger(__name__)
 
+# Concurrent read-only lookups of the same template (and depth) in the same
+# database share one in-flight query
+_subnet_template_lookups: SingleFlight[
+    tuple[Engine | Connection, uuid.UUID, int | None], TemplateSubnetSchema | None
+] = SingleFlight()
+
 
 async def get_subnet_template_headers(
     db: AsyncSession, standalone_only: bool = True
-) -> list[TemplateSubnetModel]:
+) -> list[TemplateSubnetHeaderSchema]:
     """Get list of subnet template headers.
 
     Args:
@@ -30,32 +39,26 @@ async def get_subnet_template_headers(
 
     Returns:
     -------
-        list[TemplateSubnetModel]: List of subnet template models.
+        list[TemplateSubnetHeaderSchema]: List of subnet template headers.
 
     """
-    # Dynamically select non-nested columns/attributes
-    mapped_subnet_model = inspect(TemplateSubnetModel)
-    main_columns = [
-        getattr(TemplateSubnetModel, attr.key)
-        for attr in mapped_subnet_model.column_attrs
+    # Select plain header columns to skip ORM identity map bookkeeping
+    header_columns = [
+        TemplateSubnetModel.__table__.c[field]
+        for field in TemplateSubnetHeaderSchema.model_fields
     ]
 
     # Build the query: filter for rows where vpc_id is null if standalone_only is True
+    stmt = select(*header_columns)
     if standalone_only:
-        stmt = (
-            select(TemplateSubnetModel)
-            .where(TemplateSubnetModel.vpc_id.is_(None))
-            .options(load_only(*main_columns))
-        )
-    else:
-        stmt = select(TemplateSubnetModel).options(load_only(*main_columns))
+        stmt = stmt.where(TemplateSubnetModel.vpc_id.is_(None))
 
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return [TemplateSubnetHeaderSchema.model_validate(row) for row in result.mappings()]
 
 
 async def get_subnet_template(
-    db: AsyncSession, subnet_id: TemplateSubnetID
+    db: AsyncSession, subnet_id: TemplateSubnetID, depth: int | None = None
 ) -> TemplateSubnetModel | None:
     """Get subnet template by id (uuid).
 
@@ -63,19 +66,60 @@ async def get_subnet_template(
     ----
         db (Session): Database connection.
         subnet_id (TemplateSubnetID): UUID of the VPC.
+        depth (Optional[int]): Number of nested levels (hosts) to load. Excluded
+            levels are left empty. Defaults to loading all levels.
 
     Returns:
     -------
         Optional[OpenLabsSubnet]: TemplateSubnetModel if it exists in database.
 
     """
+    # Eagerly fetch only the requested relationships (one query per level)
+    relationships = [TemplateSubnetModel.hosts]
     stmt = (
         select(TemplateSubnetModel)
-        .options(selectinload(TemplateSubnetModel.hosts))
+        .options(nested_load_option(relationships, depth))
         .filter(TemplateSubnetModel.id == subnet_id.id)
     )
+
     result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    subnet_model = result.scalar_one_or_none()
+    if subnet_model:
+        clear_unloaded(subnet_model, relationships, depth)
+
+    return subnet_model
+
+
+async def get_subnet_template_schema(
+    db: AsyncSession, subnet_id: TemplateSubnetID, depth: int | None = None
+) -> TemplateSubnetSchema | None:
+    """Get subnet template by id (uuid) for a read-only response.
+
+    Concurrent lookups of the same template (and depth) share one query and its
+    result, a schema detached from any session that must not be modified.
+
+    Args:
+    ----
+        db (Session): Database connection.
+        subnet_id (TemplateSubnetID): ID of the subnet.
+        depth (Optional[int]): Number of nested levels to load, see
+            `get_subnet_template()`. Defaults to loading all levels.
+
+    Returns:
+    -------
+        Optional[TemplateSubnetSchema]: Subnet template if it exists in database.
+
+    """
+
+    async def fetch() -> TemplateSubnetSchema | None:
+        subnet_model = await get_subnet_template(db, subnet_id, depth)
+        if subnet_model is None:
+            return None
+        return TemplateSubnetSchema.model_validate(subnet_model, from_attributes=True)
+
+    return await _subnet_template_lookups.do(
+        (db.get_bind(), subnet_id.id, depth), fetch
+    )
 
 
 async def create_subnet_template(
@@ -109,6 +153,7 @@ async def create_subnet_template(
         await create_host_template(db, host_data, TemplateSubnetID(id=subnet_obj.id))
         for host_data in template_subnet.hosts
     ]
+    subnet_obj.host_count = len(host_objects)
 
     # Commit if we are parent object
     if vpc_id:
@@ -1,26 +1,35 @@
 import logging
+import uuid
 
-from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import load_only, selectinload
 
 from ..models.template_subnet_model import TemplateSubnetModel
 from ..models.template_vpc_model import TemplateVPCModel
 from ..schemas.template_range_schema import TemplateRangeID
 from ..schemas.template_vpc_schema import (
     TemplateVPCBaseSchema,
+    TemplateVPCHeaderSchema,
     TemplateVPCID,
     TemplateVPCSchema,
 )
+from ..utils.depth_utils import clear_unloaded, nested_load_option
+from ..utils.single_flight_utils import SingleFlight
 from .crud_subnet_templates import create_subnet_template
 
 logger = logging.getLogger(__name__)
 
+# Concurrent read-only lookups of the same template (and depth) in the same
+# database share one in-flight query
+_vpc_template_lookups: SingleFlight[
+    tuple[Engine | Connection, uuid.UUID, int | None], TemplateVPCSchema | None
+] = SingleFlight()
+
 
 async def get_vpc_template_headers(
     db: AsyncSession, standalone_only: bool = True
-) -> list[TemplateVPCModel]:
+) -> list[TemplateVPCHeaderSchema]:
     """Get list of VPC template headers.
 
     Args:
@@ -31,32 +40,26 @@ async def get_vpc_template_headers(
 
     Returns:
     -------
-        list[TemplateVPCModel]: List of VPC template models.
+        list[TemplateVPCHeaderSchema]: List of VPC template headers.
 
     """
-    # Dynamically select non-nested columns/attributes
-    mapped_vpc_model = inspect(TemplateVPCModel)
-    main_columns = [
-        getattr(TemplateVPCModel, attr.key) for attr in mapped_vpc_model.column_attrs
+    # Select plain header columns to skip ORM identity map bookkeeping
+    header_columns = [
+        TemplateVPCModel.__table__.c[field]
+        for field in TemplateVPCHeaderSchema.model_fields
     ]
 
     # Build the query: filter for rows where range_id is null if standalone_only is True
+    stmt = select(*header_columns)
     if standalone_only:
-        stmt = (
-            select(TemplateVPCModel)
-            .where(TemplateVPCModel.range_id.is_(None))
-            .options(load_only(*main_columns))
-        )
-    else:
-        stmt = select(TemplateVPCModel).options(load_only(*main_columns))
+        stmt = stmt.where(TemplateVPCModel.range_id.is_(None))
 
-    # Execute query and return results
     result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return [TemplateVPCHeaderSchema.model_validate(row) for row in result.mappings()]
 
 
 async def get_vpc_template(
-    db: AsyncSession, vpc_id: TemplateVPCID
+    db: AsyncSession, vpc_id: TemplateVPCID, depth: int | None = None
 ) -> TemplateVPCModel | None:
     """Get VPC template by id (uuid).
 
@@ -64,23 +67,58 @@ async def get_vpc_template(
     ----
         db (Session): Database connection.
         vpc_id (TemplateVPCID): ID of the range.
+        depth (Optional[int]): Number of nested levels (subnets, hosts) to load.
+            Excluded levels are left empty. Defaults to loading all levels.
 
     Returns:
     -------
         Optional[OpenLabsVPC]: TemplateVPCModel if it exists in database.
 
     """
+    # Eagerly fetch only the requested relationships (one query per level)
+    relationships = [TemplateVPCModel.subnets, TemplateSubnetModel.hosts]
     stmt = (
         select(TemplateVPCModel)
-        .options(
-            selectinload(TemplateVPCModel.subnets).selectinload(
-                TemplateSubnetModel.hosts
-            )
-        )
+        .options(nested_load_option(relationships, depth))
         .filter(TemplateVPCModel.id == vpc_id.id)
     )
+
     result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    vpc_model = result.scalar_one_or_none()
+    if vpc_model:
+        clear_unloaded(vpc_model, relationships, depth)
+
+    return vpc_model
+
+
+async def get_vpc_template_schema(
+    db: AsyncSession, vpc_id: TemplateVPCID, depth: int | None = None
+) -> TemplateVPCSchema | None:
+    """Get VPC template by id (uuid) for a read-only response.
+
+    Concurrent lookups of the same template (and depth) share one query and its
+    result, a schema detached from any session that must not be modified.
+
+    Args:
+    ----
+        db (Session): Database connection.
+        vpc_id (TemplateVPCID): ID of the VPC.
+        depth (Optional[int]): Number of nested levels to load, see
+            `get_vpc_template()`. Defaults to loading all levels.
+
+    Returns:
+    -------
+        Optional[TemplateVPCSchema]: VPC template if it exists in database.
+
+    """
+
+    async def fetch() -> TemplateVPCSchema | None:
+        vpc_model = await get_vpc_template(db, vpc_id, depth)
+        if vpc_model is None:
+            return None
+        return TemplateVPCSchema.model_validate(vpc_model, from_attributes=True)
+
+    return await _vpc_template_lookups.do((db.get_bind(), vpc_id.id, depth), fetch)
 
 
 async def create_vpc_template(
@@ -114,6 +152,8 @@ async def create_vpc_template(
         await create_subnet_template(db, subnet_data, TemplateVPCID(id=vpc_obj.id))
         for subnet_data in vpc_template.subnets
     ]
+    vpc_obj.subnet_count = len(subnet_objects)
+    vpc_obj.host_count = sum(subnet.host_count for subnet in subnet_objects)
 
     # Commit if we are parent
     if range_id:
@@ -0,0 +1,28 @@
+import uuid
+
+from ..core.db.statements import HotQuery
+from ..schemas.template_host_schema import TemplateHostID
+from ..schemas.template_range_schema import TemplateRangeID
+from ..schemas.template_subnet_schema import TemplateSubnetID
+from ..schemas.template_vpc_schema import TemplateVPCID
+from .crud_host_templates import get_host_template, get_host_template_headers
+from .crud_range_templates import get_range_template, get_range_template_headers
+from .crud_subnet_templates import get_subnet_template, get_subnet_template_headers
+from .crud_vpc_templates import get_vpc_template, get_vpc_template_headers
+
+# Looked up to prepare the ID lookup statements without matching any rows
+_NIL_ID = uuid.UUID(int=0)
+
+# Statements run by (nearly) every request: header listings and ID lookups.
+# Nested levels are loaded with IN lists sized to the parents found, so their
+# statements vary per request and are left to be cached on first use.
+HOT_QUERIES: list[HotQuery] = [
+    get_range_template_headers,
+    get_vpc_template_headers,
+    get_subnet_template_headers,
+    get_host_template_headers,
+    lambda db: get_range_template(db, TemplateRangeID(id=_NIL_ID)),
+    lambda db: get_vpc_template(db, TemplateVPCID(id=_NIL_ID)),
+    lambda db: get_subnet_template(db, TemplateSubnetID(id=_NIL_ID)),
+    lambda db: get_host_template(db, TemplateHostID(id=_NIL_ID)),
+]
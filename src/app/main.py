@@ -1,5 +1,6 @@
 from .api import router
 from .core.config import settings
 from .core.setup import create_application
+from .crud.hot_queries import HOT_QUERIES
 
-app = create_application(router=router, settings=settings, create_tables_on_start=True)
+app = create_application(router=router, settings=settings, warm_queries=HOT_QUERIES)
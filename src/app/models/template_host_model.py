@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Enum, ForeignKey, Integer, String
+from sqlalchemy import Enum, ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -14,6 +14,14 @@ class TemplateHostModel(Base, TemplateModelMixin):
     """SQLAlchemy ORM model for template host."""
 
     __tablename__ = "host_templates"
+    __table_args__ = (
+        # Small index of only the standalone templates listed by the headers queries
+        Index(
+            "ix_host_templates_standalone",
+            "id",
+            postgresql_where=text("subnet_id IS NULL"),
+        ),
+    )
 
     hostname: Mapped[str] = mapped_column(String, nullable=False)
     os: Mapped[OpenLabsOS] = mapped_column(Enum(OpenLabsOS), nullable=False)
@@ -28,6 +36,7 @@ class TemplateHostModel(Base, TemplateModelMixin):
         ForeignKey("subnet_templates.id", ondelete="CASCADE"),
         nullable=True,
         default=None,
+        index=True,
     )
 
     tags: Mapped[list[str]] = mapped_column(ARRAY(String), default_factory=list)
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Enum, String
+from sqlalchemy import Boolean, Enum, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..core.db.database import Base
@@ -18,6 +18,17 @@ class TemplateRangeModel(Base, TemplateModelMixin):
     vnc: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     vpn: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
+    # Number of nested templates, maintained when the range is created
+    vpc_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    subnet_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    host_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+
     # One-to-many relationship with VPCs
     vpcs = relationship(
         "TemplateVPCModel", back_populates="range", cascade="all, delete-orphan"
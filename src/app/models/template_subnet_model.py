@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import CIDR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,14 @@ class TemplateSubnetModel(Base, TemplateModelMixin):
     """SQLAlchemy ORM model for template subnet objects."""
 
     __tablename__ = "subnet_templates"
+    __table_args__ = (
+        # Small index of only the standalone templates listed by the headers queries
+        Index(
+            "ix_subnet_templates_standalone",
+            "id",
+            postgresql_where=text("vpc_id IS NULL"),
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String, nullable=False)
     cidr: Mapped[uuid.UUID] = mapped_column(CIDR, nullable=False)
@@ -22,6 +30,12 @@ class TemplateSubnetModel(Base, TemplateModelMixin):
         ForeignKey("vpc_templates.id", ondelete="CASCADE"),
         nullable=True,
         default=None,
+        index=True,
+    )
+
+    # Number of nested templates, maintained when the subnet is created
+    host_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
     )
 
     # Relationship with VPC
@@ -1,7 +1,7 @@
 import uuid
 from ipaddress import IPv4Network
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, Integer, String, text
 from sqlalchemy.dialects.postgresql import CIDR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,6 +13,14 @@ class TemplateVPCModel(Base, TemplateModelMixin):
     """SQLAlchemy ORM model for template vpc objects."""
 
     __tablename__ = "vpc_templates"
+    __table_args__ = (
+        # Small index of only the standalone templates listed by the headers queries
+        Index(
+            "ix_vpc_templates_standalone",
+            "id",
+            postgresql_where=text("range_id IS NULL"),
+        ),
+    )
 
     name: Mapped[str] = mapped_column(String, nullable=False)
     cidr: Mapped[IPv4Network] = mapped_column(CIDR, nullable=False)
@@ -23,6 +31,15 @@ class TemplateVPCModel(Base, TemplateModelMixin):
         ForeignKey("range_templates.id", ondelete="CASCADE"),
         nullable=True,
         default=None,
+        index=True,
+    )
+
+    # Number of nested templates, maintained when the VPC is created
+    subnet_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    host_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
     )
 
     # Relationship with Range
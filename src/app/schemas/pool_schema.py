@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+
+
+class PoolStatsSchema(BaseModel):
+    """Database connection pool statistics for this worker process."""
+
+    size: int = Field(..., description="Configured number of pooled connections")
+    checked_in: int = Field(..., description="Idle connections in the pool")
+    checked_out: int = Field(..., description="Connections currently in use")
+    overflow: int = Field(
+        ...,
+        description="Connections open beyond the pool size (negative while the pool is filling)",
+    )
+    checkouts: int = Field(..., description="Total successful checkouts")
+    timeouts: int = Field(
+        ..., description="Total checkouts that timed out waiting for a connection"
+    )
+    wait_time_avg: float = Field(
+        ..., description="Average seconds spent waiting to check out a connection"
+    )
+    wait_time_max: float = Field(
+        ..., description="Longest seconds spent waiting to check out a connection"
+    )
+    hold_time_avg: float = Field(
+        ..., description="Average seconds a connection was held before check in"
+    )
+    hold_time_max: float = Field(
+        ..., description="Longest seconds a connection was held before check in"
+    )
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+
+
+class RouteQueryStatsSchema(BaseModel):
+    """SQL statements issued by requests to one route in this worker process."""
+
+    route: str = Field(
+        ...,
+        description="Route path template",
+        examples=["/api/v1/templates/ranges/{range_id}"],
+    )
+    requests: int = Field(default=0, description="Requests handled")
+    queries: int = Field(default=0, description="Total SQL statements executed")
+    query_time: float = Field(
+        default=0.0, description="Total seconds spent executing SQL statements"
+    )
+    max_queries: int = Field(
+        default=0, description="Most SQL statements executed by a single request"
+    )
@@ -0,0 +1,20 @@
+from pydantic import BaseModel, Field
+
+
+class StatementCacheStatsSchema(BaseModel):
+    """Prepared statement cache settings and warm-up of this worker process."""
+
+    cache_size: int = Field(
+        ..., description="Prepared statements cached per connection (0 if disabled)"
+    )
+    transaction_pooling: bool = Field(
+        ...,
+        description="Connected through a transaction pooling proxy (no statement cache)",
+    )
+    warmed_connections: dict[str, int] = Field(
+        default_factory=dict,
+        description="Pooled connections the hot statements were prepared on, per engine",
+    )
+    warmed_statements: int = Field(
+        default=0, description="Hot statements prepared per warmed connection"
+    )
@@ -1,16 +1,48 @@
 import uuid
+from collections.abc import Callable, Iterable, Sequence
+from contextvars import ContextVar
+from itertools import chain
+from typing import Any
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    ValidationError,
     ValidationInfo,
     field_validator,
 )
 
 from ..enums.operating_systems import OS_SIZE_THRESHOLD, OpenLabsOS
 from ..enums.specs import OpenLabsSpec
-from ..validators.network import is_valid_disk_size, is_valid_hostname
+from ..utils.uuid_utils import generate_uuid
+from ..validators.network import (
+    are_valid_disk_sizes,
+    are_valid_hostnames,
+    is_valid_disk_size,
+    is_valid_hostname,
+)
+
+# Set while a subnet checks the rules of all its hosts in one pass, so the
+# per-host field validators only run for standalone hosts and error reports
+batched_host_validation: ContextVar[bool] = ContextVar(
+    "batched_host_validation", default=False
+)
+
+
+def has_valid_tags(tags: Iterable[str]) -> bool:
+    """Check that no tag is empty.
+
+    Args:
+    ----
+        tags (Iterable[str]): Tags of one or more hosts.
+
+    Returns:
+    -------
+        bool: True if every tag has text. False otherwise.
+
+    """
+    return all(map(str.strip, tags))
 
 
 class TemplateHostBaseSchema(BaseModel):
@@ -56,7 +88,10 @@ class TemplateHostBaseSchema(BaseModel):
             list[str]: List of non-empty tags.
 
         """
-        if any(tag.strip() == "" for tag in tags):
+        if batched_host_validation.get():
+            return tags
+
+        if not has_valid_tags(tags):
             msg = "Tags must not be empty"
             raise ValueError(msg)
         return tags
@@ -76,6 +111,9 @@ class TemplateHostBaseSchema(BaseModel):
             str: Valid hostname for VM.
 
         """
+        if batched_host_validation.get():
+            return hostname
+
         if not is_valid_hostname(hostname):
             msg = f"Invalid hostname: {hostname}"
             raise ValueError(msg)
@@ -97,6 +135,9 @@ class TemplateHostBaseSchema(BaseModel):
             int: Valid disk size for VM.
 
         """
+        if batched_host_validation.get():
+            return size
+
         os: OpenLabsOS | None = info.data.get("os")
 
         if os is None:
@@ -109,11 +150,68 @@ class TemplateHostBaseSchema(BaseModel):
         return size
 
 
+def are_valid_hosts(hosts: Sequence[TemplateHostBaseSchema]) -> bool:
+    """Check the rules of the host field validators for many hosts in one pass.
+
+    Args:
+    ----
+        hosts (Sequence[TemplateHostBaseSchema]): Hosts validated without
+            their per-host rules.
+
+    Returns:
+    -------
+        bool: True if every host passes every rule. False otherwise.
+
+    """
+    # Each rule maps over all hosts at once rather than looping per host
+    return (
+        are_valid_hostnames([host.hostname for host in hosts])
+        and are_valid_disk_sizes(
+            [host.os for host in hosts], [host.size for host in hosts]
+        )
+        and has_valid_tags(chain.from_iterable([host.tags for host in hosts]))
+    )
+
+
+def validate_hosts(
+    hosts: Any,  # noqa: ANN401
+    handler: Callable[[Any], list[TemplateHostBaseSchema]],
+) -> list[TemplateHostBaseSchema]:
+    """Validate many hosts, checking the host rules of all of them in one pass.
+
+    Hosts are first built without their per-host rules, which are then
+    checked in one pass. Only when a host is invalid are the hosts validated
+    one by one, so errors are reported exactly as for a standalone host.
+
+    Args:
+    ----
+        hosts (Any): Unvalidated hosts.
+        handler (Callable[[Any], list[TemplateHostBaseSchema]]): Validates the
+            list of host objects.
+
+    Returns:
+    -------
+        list[TemplateHostBaseSchema]: Host objects.
+
+    """
+    token = batched_host_validation.set(True)
+    try:
+        validated: list[TemplateHostBaseSchema] | None = handler(hosts)
+    except ValidationError:
+        validated = None
+    finally:
+        batched_host_validation.reset(token)
+
+    if validated is None or not are_valid_hosts(validated):
+        validated = handler(hosts)
+    return validated
+
+
 class TemplateHostID(BaseModel):
     """Identity class for template host object."""
 
     id: uuid.UUID = Field(
-        default_factory=uuid.uuid4, description="Unique object identifier."
+        default_factory=generate_uuid, description="Unique object identifier."
     )
 
     model_config = ConfigDict(from_attributes=True)
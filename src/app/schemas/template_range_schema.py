@@ -3,7 +3,9 @@ import uuid
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from ..enums.providers import OpenLabsProvider
-from .template_vpc_schema import TemplateVPCBaseSchema
+from ..utils.uuid_utils import generate_uuid
+from ..validators.network import find_overlapping_networks
+from .template_vpc_schema import TemplateVPCBaseSchema, TemplateVPCNestedSchema
 
 
 class TemplateRangeBaseSchema(BaseModel):
@@ -45,12 +47,43 @@ class TemplateRangeBaseSchema(BaseModel):
             raise (ValueError(msg))
         return vpcs
 
+    @field_validator("vpcs")
+    @classmethod
+    def validate_vpcs_disjoint(
+        cls, vpcs: list[TemplateVPCBaseSchema]
+    ) -> list[TemplateVPCBaseSchema]:
+        """Check that no two VPC CIDRs overlap.
+
+        Subnets are contained in their VPC and checked against each other by
+        the VPC, so this also rules out overlapping subnets across the range.
+
+        Args:
+        ----
+            cls: OpenLabsRange object.
+            vpcs (list[OpenLabsVPC]): VPC objects.
+
+        Returns:
+        -------
+            list[OpenLabsVPC]: VPC objects.
+
+        """
+        overlaps = find_overlapping_networks([vpc.cidr for vpc in vpcs])
+        if overlaps:
+            conflicts = ", ".join(
+                f"{vpcs[i].name} ({vpcs[i].cidr}) and {vpcs[j].name} ({vpcs[j].cidr})"
+                for i, j in overlaps
+            )
+            msg = f"The following VPCs overlap: {conflicts}"
+            raise ValueError(msg)
+
+        return vpcs
+
 
 class TemplateRangeID(BaseModel):
     """Identity class for the template range object."""
 
     id: uuid.UUID = Field(
-        default_factory=uuid.uuid4, description="Unique range identifier."
+        default_factory=generate_uuid, description="Unique range identifier."
     )
     model_config = ConfigDict(from_attributes=True)
 
@@ -58,6 +91,10 @@ class TemplateRangeID(BaseModel):
 class TemplateRangeSchema(TemplateRangeBaseSchema, TemplateRangeID):
     """Template range object for OpenLabs."""
 
+    vpcs: list[TemplateVPCNestedSchema] = Field(  # type: ignore[assignment]
+        ..., description="Contained VPCs"
+    )
+
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -75,3 +112,6 @@ class TemplateRangeHeaderSchema(TemplateRangeID):
     )
     vnc: bool = Field(default=False, description="Enable automatic VNC configuration")
     vpn: bool = Field(default=False, description="Enable automatic VPN configuration")
+    vpc_count: int = Field(default=0, description="Number of VPCs in the range")
+    subnet_count: int = Field(default=0, description="Number of subnets in the range")
+    host_count: int = Field(default=0, description="Number of hosts in the range")
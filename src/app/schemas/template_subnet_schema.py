@@ -1,45 +1,61 @@
 import uuid
 from ipaddress import IPv4Network
-
-from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
-
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+)
+
+from ..utils.uuid_utils import generate_uuid
 from ..validators.network import max_num_hosts_in_subnet
-from .template_host_schema import TemplateHostBaseSchema
+from .template_host_schema import (
+    TemplateHostBaseSchema,
+    validate_hosts,
+)
 
 
 class TemplateSubnetBaseSchema(BaseModel):
     """Template subnet object for OpenLabs."""
 
-    cidr: IPv4Network = Field(
-        ..., description="CIDR range", examples=["192.168.1.0/24"]
+    cidr: IPv4Network | None = Field(
+        default=None,
+        description="CIDR range. Allocated from free space in the VPC if omitted.",
+        examples=["192.168.1.0/24"],
     )
     name: str = Field(
         ..., description="Subnet name", min_length=1, examples=["example-subnet-1"]
     )
     hosts: list[TemplateHostBaseSchema] = Field(..., description="All hosts in subnet")
 
-    @field_validator("hosts")
+    @field_validator("hosts", mode="wrap")
     @classmethod
-    def validate_unique_hostnames(
-        cls, hosts: list[TemplateHostBaseSchema]
+    def validate_hosts(
+        cls, hosts: Any, handler: ValidatorFunctionWrapHandler  # noqa: ANN401
     ) -> list[TemplateHostBaseSchema]:
-        """Check hostnames are unique.
+        """Check the host rules for all hosts at once and hostnames are unique.
 
         Args:
         ----
             cls: OpenLabsSubnet object.
-            hosts (list[OpenLabsHost]): Host objects.
+            hosts (Any): Unvalidated hosts.
+            handler (ValidatorFunctionWrapHandler): Validates the host objects.
 
         Returns:
         -------
             list[OpenLabsHost]: Host objects.
 
         """
-        hostnames = [host.hostname for host in hosts]
-        if len(hostnames) != len(set(hostnames)):
+        validated = validate_hosts(hosts, handler)
+
+        if len({host.hostname for host in validated}) != len(validated):
             msg = "All hostnames must be unique."
             raise ValueError(msg)
-        return hosts
+        return validated
 
     @field_validator("hosts")
     @classmethod
@@ -59,12 +75,15 @@ class TemplateSubnetBaseSchema(BaseModel):
             list[TemplateHostBaseSchema]: List of host objects.
 
         """
-        subnet_cidr = info.data.get("cidr")
-
-        if not subnet_cidr:
+        if "cidr" not in info.data:
             msg = "Subnet missing CIDR."
             raise ValueError(msg)
 
+        subnet_cidr = info.data["cidr"]
+        if subnet_cidr is None:
+            # Allocated with room for the hosts
+            return hosts
+
         max_num_hosts = max_num_hosts_in_subnet(subnet_cidr)
         num_requested_hosts = len(hosts)
 
@@ -79,13 +98,21 @@ class TemplateSubnetID(BaseModel):
     """Identiy class for tempalte subnet object."""
 
     id: uuid.UUID = Field(
-        default_factory=uuid.uuid4, description="Unique subnet identifier."
+        default_factory=generate_uuid, description="Unique subnet identifier."
     )
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class TemplateSubnetSchema(TemplateSubnetBaseSchema, TemplateSubnetID):
+class TemplateSubnetNestedSchema(TemplateSubnetBaseSchema):
+    """Template subnet as stored in a VPC, with its CIDR allocated."""
+
+    cidr: IPv4Network = Field(
+        ..., description="CIDR range", examples=["192.168.1.0/24"]
+    )
+
+
+class TemplateSubnetSchema(TemplateSubnetNestedSchema, TemplateSubnetID):
     """Template subnet object for OpenLabs."""
 
     model_config = ConfigDict(from_attributes=True)
@@ -100,3 +127,4 @@ class TemplateSubnetHeaderSchema(TemplateSubnetID):
     name: str = Field(
         ..., description="Subnet name", min_length=1, examples=["example-subnet-1"]
     )
+    host_count: int = Field(default=0, description="Number of hosts in the subnet")
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+
+
+class TemplateValidationErrorSchema(BaseModel):
+    """Single validation error of a template."""
+
+    loc: list[str | int] = Field(
+        ...,
+        description="Location of the invalid value in the template",
+        examples=[["vpcs", 0, "subnets", 0, "hosts", 0, "hostname"]],
+    )
+    msg: str = Field(
+        ...,
+        description="Error message",
+        examples=["Value error, Invalid hostname: -example-host"],
+    )
+    type: str = Field(..., description="Error type", examples=["value_error"])
+
+
+class TemplateValidationSchema(BaseModel):
+    """Result of validating a template without saving it."""
+
+    valid: bool = Field(..., description="Template passed all validation")
+    errors: list[TemplateValidationErrorSchema] = Field(
+        default_factory=list, description="Validation errors if invalid"
+    )
@@ -3,7 +3,15 @@ from ipaddress import IPv4Network
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
-from .template_subnet_schema import TemplateSubnetBaseSchema
+from ..utils.cidr_utils import CIDRAllocator, allocate_jump_box_subnet
+from ..utils.uuid_utils import generate_uuid
+from ..validators.network import (
+    DEFAULT_SUBNET_PREFIX,
+    MAX_SUBNET_PREFIX,
+    find_overlapping_networks,
+    min_subnet_prefix,
+)
+from .template_subnet_schema import TemplateSubnetBaseSchema, TemplateSubnetNestedSchema
 
 
 class TemplateVPCBaseSchema(BaseModel):
@@ -67,24 +75,156 @@ class TemplateVPCBaseSchema(BaseModel):
             raise ValueError(msg)
 
         for subnet in subnets:
-            if not subnet.cidr.subnet_of(vpc_cidr):
+            if subnet.cidr and not subnet.cidr.subnet_of(vpc_cidr):
                 msg = f"The following subnet is not contained in the VPC subnet {vpc_cidr}: {subnet.cidr}"
                 raise ValueError(msg)
 
         return subnets
 
+    @field_validator("subnets")
+    @classmethod
+    def validate_subnets_disjoint(
+        cls, subnets: list[TemplateSubnetBaseSchema]
+    ) -> list[TemplateSubnetBaseSchema]:
+        """Check that no two subnet CIDRs overlap.
+
+        Args:
+        ----
+            cls: TemplateVPCBaseSchema object.
+            subnets (list[TemplateSubnetBaseSchema]): Subnet objects.
+
+        Returns:
+        -------
+            list[TemplateSubnetBaseSchema]: List of subnet objects.
+
+        """
+        defined = [subnet for subnet in subnets if subnet.cidr]
+        overlaps = find_overlapping_networks(
+            [subnet.cidr for subnet in defined if subnet.cidr]
+        )
+        if overlaps:
+            conflicts = ", ".join(
+                f"{defined[i].name} ({defined[i].cidr}) and {defined[j].name} ({defined[j].cidr})"
+                for i, j in overlaps
+            )
+            msg = f"The following subnets overlap: {conflicts}"
+            raise ValueError(msg)
+
+        return subnets
+
+    @field_validator("subnets")
+    @classmethod
+    def allocate_subnet_cidrs(
+        cls, subnets: list[TemplateSubnetBaseSchema], info: ValidationInfo
+    ) -> list[TemplateSubnetBaseSchema]:
+        """Assign free blocks of the VPC CIDR to subnets without a CIDR.
+
+        Subnets get a /24 unless their hosts need a larger block. Smaller VPCs,
+        or VPCs without a free /24, give subnets the largest free block that
+        fits their hosts. At least a /28 is left free for the jump box subnet
+        added on deploy.
+
+        Args:
+        ----
+            cls: TemplateVPCBaseSchema object.
+            subnets (list[TemplateSubnetBaseSchema]): Subnet objects.
+            info (ValidationInfo): Info of object currently being validated.
+
+        Returns:
+        -------
+            list[TemplateSubnetBaseSchema]: List of subnet objects, all with a CIDR.
+
+        """
+        vpc_cidr = info.data.get("cidr")
+        unallocated = [subnet for subnet in subnets if subnet.cidr is None]
+        if not vpc_cidr or not unallocated:
+            return subnets
+
+        allocator = CIDRAllocator(vpc_cidr)
+        for subnet in subnets:
+            if subnet.cidr:
+                allocator.reserve(subnet.cidr)
+
+        # Largest blocks first, so smaller ones fill the gaps around them
+        sized = sorted(
+            ((min_subnet_prefix(len(subnet.hosts)), subnet) for subnet in unallocated),
+            key=lambda item: item[0],
+        )
+        for needed_prefix, subnet in sized:
+            prefixlen = max(
+                min(DEFAULT_SUBNET_PREFIX, needed_prefix), vpc_cidr.prefixlen
+            )
+            if prefixlen > needed_prefix:
+                msg = f"Subnet {subnet.name} needs a /{needed_prefix} block, which does not fit in the VPC subnet {vpc_cidr}."
+                raise ValueError(msg)
+            # Leave room for the jump box subnet added on deploy
+            subnet.cidr = allocator.allocate(
+                prefixlen,
+                fallback_prefixlen=needed_prefix,
+                keep_free=MAX_SUBNET_PREFIX,
+            )
+
+        return subnets
+
+    @field_validator("subnets")
+    @classmethod
+    def validate_jump_box_room(
+        cls, subnets: list[TemplateSubnetBaseSchema], info: ValidationInfo
+    ) -> list[TemplateSubnetBaseSchema]:
+        """Check that the VPC has room left for the jump box subnet.
+
+        Deployments add a public subnet for the jump box to every VPC, in the
+        space the template subnets leave free.
+
+        Args:
+        ----
+            cls: TemplateVPCBaseSchema object.
+            subnets (list[TemplateSubnetBaseSchema]): Subnet objects, all with
+                a CIDR.
+            info (ValidationInfo): Info of object currently being validated.
+
+        Returns:
+        -------
+            list[TemplateSubnetBaseSchema]: List of subnet objects.
+
+        """
+        vpc_cidr = info.data.get("cidr")
+        if not vpc_cidr:
+            return subnets
+
+        allocator = CIDRAllocator(vpc_cidr)
+        for subnet in subnets:
+            if subnet.cidr:
+                allocator.reserve(subnet.cidr)
+
+        try:
+            allocate_jump_box_subnet(allocator)
+        except ValueError as e:
+            msg = f"The VPC subnet {vpc_cidr} has no free /{MAX_SUBNET_PREFIX} block left for the jump box subnet."
+            raise ValueError(msg) from e
+
+        return subnets
+
 
 class TemplateVPCID(BaseModel):
     """Identity class for the template VPC object."""
 
     id: uuid.UUID = Field(
-        default_factory=uuid.uuid4, description="Unique VPC identifier."
+        default_factory=generate_uuid, description="Unique VPC identifier."
     )
 
     model_config = ConfigDict(from_attributes=True)
 
 
-class TemplateVPCSchema(TemplateVPCBaseSchema, TemplateVPCID):
+class TemplateVPCNestedSchema(TemplateVPCBaseSchema):
+    """Template VPC as stored in a range, with its subnet CIDRs allocated."""
+
+    subnets: list[TemplateSubnetNestedSchema] = Field(  # type: ignore[assignment]
+        ..., description="Contained subnets"
+    )
+
+
+class TemplateVPCSchema(TemplateVPCNestedSchema, TemplateVPCID):
     """Template VPC object for OpenLabs."""
 
     model_config = ConfigDict(from_attributes=True)
@@ -99,3 +239,5 @@ class TemplateVPCHeaderSchema(TemplateVPCID):
     name: str = Field(
         ..., description="VPC name", min_length=1, examples=["example-vpc-1"]
     )
+    subnet_count: int = Field(default=0, description="Number of subnets in the VPC")
+    host_count: int = Field(default=0, description="Number of hosts in the VPC")
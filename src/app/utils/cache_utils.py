@@ -0,0 +1,86 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded in-process cache that evicts the least recently used entry."""
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize LRU cache.
+
+        Args:
+        ----
+            max_size (int): Max number of entries to keep. Zero disables caching.
+
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: K) -> V | None:
+        """Get cached value and mark it as recently used.
+
+        Args:
+        ----
+            key (K): Cache key.
+
+        Returns:
+        -------
+            Optional[V]: Cached value if it exists.
+
+        """
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value, evicting the least recently used entry when full.
+
+        Args:
+        ----
+            key (K): Cache key.
+            value (V): Value to cache.
+
+        Returns:
+        -------
+            None
+
+        """
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+
+def content_digest(document: Any) -> bytes:  # noqa: ANN401
+    """Hash a JSON document independent of key order and whitespace.
+
+    Args:
+    ----
+        document (Any): Parsed JSON document.
+
+    Returns:
+    -------
+        bytes: SHA-256 digest of the canonical JSON encoding.
+
+    """
+    canonical = json.dumps(
+        document, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode()).digest()
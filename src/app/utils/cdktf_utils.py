@@ -1,7 +1,30 @@
+import os
 import tempfile
+from functools import cache
 
 
 def create_cdktf_dir() -> str:
     """Create temp dir for CDKTF."""
     # /tmp/.openlabs-cdktf-XXXX
     return tempfile.mkdtemp(prefix=".openlabs-cdktf-")
+
+
+@cache
+def get_cdktf_dir(cdktf_dir: str | None = None) -> str:
+    """Get the CDKTF dir, creating it on first use.
+
+    Args:
+    ----
+        cdktf_dir (Optional[str]): Configured CDKTF dir. A new temp dir is
+            created when not set.
+
+    Returns:
+    -------
+        str: Path to the CDKTF dir, the same one for the life of the process.
+
+    """
+    if cdktf_dir is None:
+        return create_cdktf_dir()
+
+    os.makedirs(cdktf_dir, exist_ok=True)
+    return cdktf_dir
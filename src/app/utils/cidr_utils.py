@@ -0,0 +1,209 @@
+import heapq
+from ipaddress import IPv4Address, IPv4Network
+
+from ..validators.network import (
+    DEFAULT_SUBNET_PREFIX,
+    MAX_SUBNET_PREFIX,
+    max_num_hosts_in_subnet,
+)
+
+IPV4_MAX_PREFIX = 32
+
+# Cloud providers reserve the network address, the router, DNS and one
+# future-use address at the start of a subnet, and broadcast at the end
+RESERVED_LEADING_ADDRESSES = 4
+
+
+class CIDRAllocator:
+    """Buddy allocator handing out free CIDR blocks of a network.
+
+    Free space is kept as aligned blocks, per prefix length a set of block
+    start addresses and a min-heap of them to find the lowest (removed blocks
+    are dropped from the heap lazily). Allocating splits the smallest free
+    block that fits in halves until it has the requested size, so each
+    operation walks at most one level per prefix bit, at O(log n) per level.
+    Among the smallest free blocks that fit, the lowest address is handed out,
+    so allocation is deterministic for the same reservations.
+    """
+
+    def __init__(self, network: IPv4Network) -> None:
+        """Initialize allocator with the whole network free.
+
+        Args:
+        ----
+            network (IPv4Network): Address space to allocate blocks from.
+
+        """
+        self.network = network
+        self._free: list[set[int]] = [set() for _ in range(IPV4_MAX_PREFIX + 1)]
+        self._heaps: list[list[int]] = [[] for _ in range(IPV4_MAX_PREFIX + 1)]
+        self._add_free(network.prefixlen, int(network.network_address))
+
+    def _add_free(self, prefixlen: int, start: int) -> None:
+        """Add a free block."""
+        self._free[prefixlen].add(start)
+        heapq.heappush(self._heaps[prefixlen], start)
+
+    def _remove_free(self, prefixlen: int, start: int) -> bool:
+        """Remove a free block if it exists, leaving its heap entry to be dropped."""
+        blocks = self._free[prefixlen]
+        if start in blocks:
+            blocks.remove(start)
+            return True
+        return False
+
+    def _pop_lowest_free(self, prefixlen: int) -> int:
+        """Remove and return the lowest free block of a non-empty level."""
+        heap = self._heaps[prefixlen]
+        while (start := heapq.heappop(heap)) not in self._free[prefixlen]:
+            pass  # Removed by reserve()
+        self._free[prefixlen].remove(start)
+        return start
+
+    def _split(self, start: int, prefixlen: int, target: IPv4Network) -> None:
+        """Split a removed free block down to the target, freeing the other halves."""
+        target_start = int(target.network_address)
+        for child_prefixlen in range(prefixlen + 1, target.prefixlen + 1):
+            half = 1 << (IPV4_MAX_PREFIX - child_prefixlen)
+            if target_start >= start + half:
+                self._add_free(child_prefixlen, start)
+                start += half
+            else:
+                self._add_free(child_prefixlen, start + half)
+
+    def reserve(self, block: IPv4Network) -> None:
+        """Mark a block as used, e.g. a subnet with a user-defined CIDR.
+
+        Args:
+        ----
+            block (IPv4Network): Block to reserve.
+
+        Returns:
+        -------
+            None
+
+        """
+        if not block.subnet_of(self.network):
+            msg = f"{block} is not contained in {self.network}."
+            raise ValueError(msg)
+
+        start = int(block.network_address)
+        for prefixlen in range(block.prefixlen, self.network.prefixlen - 1, -1):
+            mask = (1 << IPV4_MAX_PREFIX) - (1 << (IPV4_MAX_PREFIX - prefixlen))
+            if self._remove_free(prefixlen, start & mask):
+                self._split(start & mask, prefixlen, block)
+                return
+
+        msg = f"{block} overlaps a block that is already in use."
+        raise ValueError(msg)
+
+    def _count_free(self, max_prefixlen: int) -> int:
+        """Count the free blocks at least as large as a given size."""
+        return sum(
+            len(self._free[prefixlen])
+            for prefixlen in range(self.network.prefixlen, max_prefixlen + 1)
+        )
+
+    def _allocate(self, prefixlen: int, keep_free: int | None) -> IPv4Network | None:
+        """Allocate a free block of a given size if one is left."""
+        # Smallest free block that fits, to keep large blocks whole
+        for free_prefixlen in range(prefixlen, self.network.prefixlen - 1, -1):
+            blocks = self._free[free_prefixlen]
+            if (
+                blocks
+                and keep_free is not None
+                and free_prefixlen == prefixlen <= keep_free
+                and self._count_free(keep_free) < 2  # noqa: PLR2004
+            ):
+                # Taking the last large enough block whole, split a larger one
+                continue
+            if blocks:
+                start = self._pop_lowest_free(free_prefixlen)
+                block = IPv4Network((start, prefixlen))
+                self._split(start, free_prefixlen, block)
+                return block
+        return None
+
+    def allocate(
+        self,
+        prefixlen: int,
+        fallback_prefixlen: int | None = None,
+        keep_free: int | None = None,
+    ) -> IPv4Network:
+        """Allocate a free block of a given size.
+
+        Args:
+        ----
+            prefixlen (int): Prefix length of the block to allocate.
+            fallback_prefixlen (Optional[int]): Longest prefix length (smallest
+                block) to fall back to when no block of the given size is free.
+            keep_free (Optional[int]): Prefix length of a block that must stay
+                free after the allocation (e.g. room for a later subnet).
+
+        Returns:
+        -------
+            IPv4Network: Allocated block.
+
+        """
+        if fallback_prefixlen is None:
+            fallback_prefixlen = prefixlen
+        if (
+            not self.network.prefixlen
+            <= prefixlen
+            <= fallback_prefixlen
+            <= IPV4_MAX_PREFIX
+        ):
+            msg = f"A /{prefixlen} block does not fit in {self.network}."
+            raise ValueError(msg)
+
+        for block_prefixlen in range(prefixlen, fallback_prefixlen + 1):
+            block = self._allocate(block_prefixlen, keep_free)
+            if block:
+                return block
+
+        msg = f"No free /{fallback_prefixlen} block left in {self.network}."
+        raise ValueError(msg)
+
+
+def allocate_jump_box_subnet(allocator: CIDRAllocator) -> IPv4Network:
+    """Allocate the public jump box subnet of a VPC from its free space.
+
+    The jump box subnet is a /24, or the whole VPC if smaller, falling back
+    to smaller blocks down to the minimum subnet size when space is short.
+
+    Args:
+    ----
+        allocator (CIDRAllocator): Allocator of the VPC, with the template
+            subnets reserved.
+
+    Returns:
+    -------
+        IPv4Network: Jump box subnet.
+
+    """
+    prefixlen = max(DEFAULT_SUBNET_PREFIX, allocator.network.prefixlen)
+    return allocator.allocate(prefixlen, fallback_prefixlen=MAX_SUBNET_PREFIX)
+
+
+def host_addresses(subnet: IPv4Network, count: int) -> list[IPv4Address]:
+    """Assign the first usable addresses of a subnet to a number of hosts.
+
+    Addresses are computed from the subnet's integer range rather than by
+    iterating ``subnet.hosts()``, so large subnets are filled in one pass.
+
+    Args:
+    ----
+        subnet (IPv4Network): Subnet the hosts are deployed in.
+        count (int): Number of hosts to assign addresses to.
+
+    Returns:
+    -------
+        list[IPv4Address]: One private address per host, in order.
+
+    """
+    if count > max_num_hosts_in_subnet(subnet):
+        msg = f"{subnet} has no room for {count} hosts."
+        raise ValueError(msg)
+
+    start = int(subnet.network_address) + RESERVED_LEADING_ADDRESSES
+    return [IPv4Address(address) for address in range(start, start + count)]
@@ -0,0 +1,92 @@
+from typing import Any
+
+from pydantic.main import IncEx
+from sqlalchemy.orm import InstrumentedAttribute, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.interfaces import LoaderOption
+
+
+def nested_load_option(
+    path: list[InstrumentedAttribute[Any]], depth: int | None = None
+) -> LoaderOption:
+    """Build a loader option that eagerly loads a relationship path up to a depth.
+
+    Levels within the depth are loaded with one `selectinload` query each. The
+    first excluded level is set to `raiseload` so it can never trigger a query;
+    use `clear_unloaded()` to give it an empty collection after loading.
+
+    Args:
+    ----
+        path (list[InstrumentedAttribute]): Chain of one-to-many relationships,
+            outermost first.
+        depth (Optional[int]): Number of nested levels to load. None loads all.
+
+    Returns:
+    -------
+        LoaderOption: Loader option for `Select.options()`.
+
+    """
+    head, *tail = path
+    if depth is not None and depth <= 0:
+        return raiseload(head)
+
+    loader = selectinload(head)
+    for level, relationship in enumerate(tail, start=1):
+        if depth is not None and level >= depth:
+            return loader.raiseload(relationship)
+        loader = loader.selectinload(relationship)
+    return loader
+
+
+def clear_unloaded(
+    instance: object, path: list[InstrumentedAttribute[Any]], depth: int | None = None
+) -> None:
+    """Set the first relationship level past a depth to an empty collection.
+
+    The empty collection is set as committed state, so no query is issued and
+    the session does not treat it as a change.
+
+    Args:
+    ----
+        instance (object): Loaded ORM instance at the root of the path.
+        path (list[InstrumentedAttribute]): Chain of one-to-many relationships,
+            outermost first.
+        depth (Optional[int]): Number of nested levels that were loaded.
+
+    Returns:
+    -------
+        None
+
+    """
+    if depth is None or depth >= len(path):
+        return
+
+    level = [instance]
+    for relationship in path[:depth]:
+        level = [child for obj in level for child in getattr(obj, relationship.key)]
+
+    for obj in level:
+        set_committed_value(obj, path[depth].key, [])
+
+
+def nested_exclude(fields: list[str], depth: int | None = None) -> IncEx | None:
+    """Build a serializer exclude spec that drops nested levels past a depth.
+
+    Args:
+    ----
+        fields (list[str]): Chain of nested list field names, outermost first.
+        depth (Optional[int]): Number of nested levels to keep. None keeps all.
+
+    Returns:
+    -------
+        Optional[IncEx]: Exclude spec for Pydantic serialization. None if nothing
+            is excluded.
+
+    """
+    if depth is None or depth >= len(fields):
+        return None
+
+    exclude: IncEx = {fields[depth]}
+    for field in reversed(fields[:depth]):
+        exclude = {field: {"__all__": exclude}}
+    return exclude
@@ -0,0 +1,35 @@
+def parse_accept(header: str) -> list[tuple[str, float]]:
+    """Parse an Accept style header (Accept, Accept-Encoding) with its weights.
+
+    Args:
+    ----
+        header (str): Header value, e.g. "application/json;q=0.5, */*;q=0.1".
+
+    Returns:
+    -------
+        list[tuple[str, float]]: Lowercase values and their weight (q), in
+            header order. Values without a q parameter weigh 1 and values with
+            an invalid q weigh 0.
+
+    """
+    accepted = []
+    for item in header.split(","):
+        value, *params = item.split(";")
+        value = value.strip().lower()
+        if not value:
+            continue
+
+        weight = 1.0
+        for param in params:
+            name, _, param_value = param.partition("=")
+            if name.strip().lower() != "q":
+                continue
+            try:
+                weight = float(param_value)
+            except ValueError:
+                weight = 0.0
+            if not 0 <= weight <= 1:
+                weight = 0.0
+
+        accepted.append((value, weight))
+    return accepted
@@ -0,0 +1,65 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Coalesce concurrent calls with the same key into one in-flight call.
+
+    The first caller for a key runs the call; callers that arrive while it is
+    in flight wait for and share its result (or exception). Nothing is cached
+    once the call finishes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize single-flight group."""
+        self._calls: dict[K, asyncio.Future[V]] = {}
+
+    def __len__(self) -> int:
+        """Return number of calls in flight."""
+        return len(self._calls)
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """Run a call, or join the in-flight call with the same key.
+
+        If the caller running the call is cancelled, waiting callers retry the
+        call instead of failing with it.
+
+        Args:
+        ----
+            key (K): Identifies calls that are interchangeable.
+            fn (Callable[[], Awaitable[V]]): Call to run if none is in flight.
+
+        Returns:
+        -------
+            V: Result of the shared call.
+
+        """
+        while (call := self._calls.get(key)) is not None:
+            try:
+                # Shield so a waiting caller being cancelled leaves the call alone
+                return await asyncio.shield(call)
+            except asyncio.CancelledError:
+                if not call.cancelled():
+                    raise
+
+        call = asyncio.get_running_loop().create_future()
+        self._calls[key] = call
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as e:
+            call.set_exception(e)
+            # Mark as retrieved so an unshared failure is not reported twice
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -0,0 +1,43 @@
+import os
+import time
+import uuid
+
+from ..core.config import settings
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits are the Unix timestamp in milliseconds and the next 12
+    bits the sub-millisecond fraction, so IDs generated by one process sort
+    in creation order. The remaining 62 bits are random.
+
+    Returns
+    -------
+        uuid.UUID: New UUID7.
+
+    """
+    timestamp_ns = time.time_ns()
+    timestamp_ms, remainder_ns = divmod(timestamp_ns, 1_000_000)
+    sub_ms = remainder_ns * 4096 // 1_000_000
+    rand_b = int.from_bytes(os.urandom(8)) & ((1 << 62) - 1)
+
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76  # Version
+    value |= sub_ms << 64
+    value |= 0b10 << 62  # RFC 9562 variant
+    value |= rand_b
+    return uuid.UUID(int=value)
+
+
+def generate_uuid() -> uuid.UUID:
+    """Generate a new object ID using the configured UUID version.
+
+    Returns
+    -------
+        uuid.UUID: New UUID7 if `UUID_VERSION` is 7, a random UUID4 if it is 4.
+
+    """
+    if settings.UUID_VERSION == 7:  # noqa: PLR2004
+        return uuid7()
+    return uuid.uuid4()
@@ -0,0 +1,102 @@
+import logging
+from functools import cache
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Written at build time (see Dockerfile) so the version is not resolved from git
+VERSION_FILE = Path(__file__).resolve().parents[1] / "VERSION"
+
+# Version last resolved from git, with the commit it was resolved at
+VERSION_CACHE_FILE = Path(__file__).resolve().parents[1] / ".VERSION.cache"
+
+UNKNOWN_VERSION = "0.0.0+unknown"
+
+
+def git_head(root: Path) -> str | None:
+    """Get the commit checked out in a git repo, reading its files (no git).
+
+    Args:
+    ----
+        root (Path): Root dir of the git checkout.
+
+    Returns:
+    -------
+        Optional[str]: Commit hash. None if it cannot be read (e.g. not a
+            git checkout, or a worktree).
+
+    """
+    git_dir = root / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        if not head.startswith("ref: "):
+            return head  # Detached HEAD
+
+        ref = head.removeprefix("ref: ")
+        ref_file = git_dir / ref
+        if ref_file.is_file():
+            return ref_file.read_text(encoding="utf-8").strip()
+
+        # Refs not changed since the last gc are only in packed-refs
+        for line in (git_dir / "packed-refs").read_text(encoding="utf-8").splitlines():
+            commit, _, name = line.partition(" ")
+            if name == ref:
+                return commit
+    except OSError:
+        pass
+    return None
+
+
+def _cached_git_version(commit: str) -> str | None:
+    """Get the version cached for a commit, if any."""
+    try:
+        cached_commit, _, version = VERSION_CACHE_FILE.read_text(
+            encoding="utf-8"
+        ).partition(" ")
+    except OSError:
+        return None
+    return version.strip() if cached_commit == commit and version else None
+
+
+def _cache_git_version(commit: str, version: str) -> None:
+    """Cache the version resolved for a commit for later processes."""
+    try:
+        VERSION_CACHE_FILE.write_text(f"{commit} {version}\n", encoding="utf-8")
+    except OSError as e:
+        logger.debug("Unable to cache app version: %s", e)
+
+
+@cache
+def get_app_version() -> str:
+    """Get the app version, resolved once per process.
+
+    The version file written at build time is used if present. Otherwise the
+    version is derived from the git checkout (latest tagged release), which
+    runs git. That version is cached on disk with the checked out commit, so
+    later processes on the same commit (workers, test runs) skip git.
+
+    Returns
+    -------
+        str: App version.
+
+    """
+    try:
+        return VERSION_FILE.read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        pass
+
+    commit = git_head(Path.cwd())
+    if commit and (version := _cached_git_version(commit)):
+        return version
+
+    try:
+        from setuptools_scm import get_version  # noqa: PLC0415
+
+        version = str(get_version())
+    except (ImportError, LookupError) as e:
+        logger.warning("Unable to resolve app version from git: %s", e)
+        return UNKNOWN_VERSION
+
+    if commit:
+        _cache_git_version(commit, version)
+    return version
@@ -1,34 +1,62 @@
 import logging
 import uuid
 
+from ..core.logger import RateLimitFilter
 
-def is_valid_uuid4(uuid_str: str) -> bool:
-    """Check if the string is a valid UUID4.
+logger = logging.getLogger(__name__)
+# IDs come from clients (and scanners), so a flood of bad IDs is rate limited
+logger.addFilter(RateLimitFilter(rate=10))
+
+# Versions generated for object IDs (see UUID_VERSION setting)
+SUPPORTED_UUID_VERSIONS = (4, 7)
+
+
+def is_valid_uuid(
+    uuid_str: str, versions: tuple[int, ...] = SUPPORTED_UUID_VERSIONS
+) -> bool:
+    """Check if the string is a valid UUID of one of the given versions.
 
     Args:
     ----
         uuid_str (str): String to validate as UUID.
+        versions (tuple[int, ...]): Accepted UUID versions. Defaults to the
+            versions used for object IDs (4 and 7).
 
     Return:
     ------
-        bool: True if string is valid UUID4. False otherwise.
+        bool: True if string is a valid UUID of an accepted version. False otherwise.
 
     """
     try:
         # Attempt to create a UUID object from the string.
         u = uuid.UUID(uuid_str)
     except ValueError as e:
-        logging.error("Failed to parse UUID: %s. Error: %s", uuid_str, e)
+        logger.warning("Failed to parse UUID: %s. Error: %s", uuid_str, e)
         return False
 
-    # Check if the parsed UUID is version 4.
-    uuid_version_4 = 4
-    if u.version != uuid_version_4:
-        logging.error(
-            "UUID version mismatch: expected 4, got %s for UUID: %s",
+    # Check if the parsed UUID is an accepted version.
+    if u.version not in versions:
+        logger.warning(
+            "UUID version mismatch: expected %s, got %s for UUID: %s",
+            " or ".join(str(version) for version in versions),
             u.version,
             uuid_str,
         )
         return False
 
     return True
+
+
+def is_valid_uuid4(uuid_str: str) -> bool:
+    """Check if the string is a valid UUID4.
+
+    Args:
+    ----
+        uuid_str (str): String to validate as UUID.
+
+    Return:
+    ------
+        bool: True if string is valid UUID4. False otherwise.
+
+    """
+    return is_valid_uuid(uuid_str, versions=(4,))
@@ -1,8 +1,26 @@
+import operator
 import re
+from collections.abc import Iterable, Sequence
 from ipaddress import IPv4Network
 
 from ..enums.operating_systems import OS_SIZE_THRESHOLD, OpenLabsOS
 
+# Minimum subnet mask https://aws.amazon.com/vpc/faqs/
+MAX_SUBNET_PREFIX = 28
+
+# Size of subnets allocated without a CIDR, unless they need more room
+DEFAULT_SUBNET_PREFIX = 24
+
+_HOSTNAME_LABEL = r"(?!-)[a-z0-9-]{1,63}(?<!-)"
+
+# Whole hostname in one match, compiled once since every host is checked:
+# at most 253 characters plus one trailing dot, labels of letters, digits and
+# inner hyphens, and a TLD that is not all-numeric.
+_HOSTNAME = re.compile(
+    rf"(?=.{{1,253}}\.?\Z)(?:{_HOSTNAME_LABEL}\.)*(?![0-9]+\.?\Z){_HOSTNAME_LABEL}\.?",
+    re.IGNORECASE,
+)
+
 
 def is_valid_hostname(hostname: str) -> bool:
     """Check if string is a valid hostname based on RRFC 1035.
@@ -16,25 +34,22 @@ def is_valid_hostname(hostname: str) -> bool:
         bool: True if valid hostname. False otherwise.
 
     """
-    max_hostname_length = 253
+    return _HOSTNAME.fullmatch(hostname) is not None
 
-    if not hostname:
-        return False
 
-    if hostname[-1] == ".":
-        # strip exactly one dot from the right, if present
-        hostname = hostname[:-1]
-    if len(hostname) > max_hostname_length:
-        return False
+def are_valid_hostnames(hostnames: Iterable[str]) -> bool:
+    """Check if every string is a valid hostname, see `is_valid_hostname`.
 
-    labels = hostname.split(".")
+    Args:
+    ----
+        hostnames (Iterable[str]): Strings to check.
 
-    # the TLD must be not all-numeric
-    if re.match(r"[0-9]+$", labels[-1]):
-        return False
+    Returns:
+    -------
+        bool: True if all are valid hostnames. False otherwise.
 
-    allowed = re.compile(r"(?!-)[a-z0-9-]{1,63}(?<!-)$", re.IGNORECASE)
-    return all(allowed.match(label) for label in labels)
+    """
+    return all(map(_HOSTNAME.fullmatch, hostnames))
 
 
 def max_num_hosts_in_subnet(subnet: IPv4Network) -> int:
@@ -51,17 +66,35 @@ def max_num_hosts_in_subnet(subnet: IPv4Network) -> int:
     """
     total_addresses = subnet.num_addresses
 
-    # Minimum subnet mask https://aws.amazon.com/vpc/faqs/
-    multi_host_subnet_prefix_max = 28
-
     # If we can fit more than one host on the subnet
     # then subtract reserved addresses
-    if subnet.prefixlen > multi_host_subnet_prefix_max:
+    if subnet.prefixlen > MAX_SUBNET_PREFIX:
         return 0
 
     return total_addresses - 5
 
 
+def min_subnet_prefix(num_hosts: int) -> int:
+    """Get the prefix length of the smallest subnet that fits a number of hosts.
+
+    Args:
+    ----
+        num_hosts (int): Number of hosts the subnet must hold.
+
+    Returns:
+    -------
+        int: Longest prefix length with room for the hosts.
+
+    """
+    prefixlen = MAX_SUBNET_PREFIX
+    while (
+        prefixlen > 0
+        and max_num_hosts_in_subnet(IPv4Network((0, prefixlen))) < num_hosts
+    ):
+        prefixlen -= 1
+    return prefixlen
+
+
 def is_valid_disk_size(os: OpenLabsOS, size: int) -> bool:
     """Check if size for given OS is possible.
 
@@ -76,3 +109,61 @@ def is_valid_disk_size(os: OpenLabsOS, size: int) -> bool:
 
     """
     return size >= OS_SIZE_THRESHOLD[os]
+
+
+def are_valid_disk_sizes(oses: Iterable[OpenLabsOS], sizes: Iterable[int]) -> bool:
+    """Check if every disk size is possible for the OS at the same position.
+
+    Args:
+    ----
+        oses (Iterable[OpenLabsOS]): Operating systems of hosts to check.
+        sizes (Iterable[int]): Sizes of disks requested.
+
+    Returns:
+    -------
+        bool: True if all are possible host sizes. False otherwise.
+
+    """
+    return all(map(operator.ge, sizes, map(OS_SIZE_THRESHOLD.__getitem__, oses)))
+
+
+def find_overlapping_networks(
+    networks: Sequence[IPv4Network],
+) -> list[tuple[int, int]]:
+    """Find every pair of overlapping networks.
+
+    CIDR blocks are either disjoint or nested, so networks sorted by their
+    first address (larger blocks first on ties) form a tree walked with a
+    stack of the blocks still open at each network. Runs in O(n log n) plus
+    the number of pairs reported, instead of comparing every pair.
+
+    Args:
+    ----
+        networks (Sequence[IPv4Network]): Networks to check.
+
+    Returns:
+    -------
+        list[tuple[int, int]]: Sorted index pairs of overlapping networks. The
+            first network of each pair contains (or equals) the second.
+
+    """
+    # Integer [first, last] address bounds, outer blocks before nested ones
+    intervals = sorted(
+        (
+            (int(network.network_address), int(network.broadcast_address), index)
+            for index, network in enumerate(networks)
+        ),
+        key=lambda interval: (interval[0], -interval[1], interval[2]),
+    )
+
+    overlaps: list[tuple[int, int]] = []
+    open_intervals: list[tuple[int, int]] = []  # (last address, index)
+    for first, last, index in intervals:
+        while open_intervals and open_intervals[-1][0] < first:
+            open_intervals.pop()
+
+        # Every open block starts at or before this one and ends after its start
+        overlaps.extend((outer, index) for _, outer in open_intervals)
+        open_intervals.append((last, index))
+
+    return sorted(overlaps)
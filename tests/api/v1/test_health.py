@@ -1,6 +1,14 @@
+import pytest
 from fastapi import status
 from httpx import AsyncClient
 
+from src.app.api.v1 import health
+from src.app.schemas.pool_schema import PoolStatsSchema
+from src.app.core.config import settings
+from src.app.core.db.database import DATABASE_URL, create_pooled_engine
+from src.app.schemas.query_stats_schema import RouteQueryStatsSchema
+from src.app.schemas.statement_cache_schema import StatementCacheStatsSchema
+
 from .config import BASE_ROUTE
 
 
@@ -9,3 +17,52 @@ async def test_ping_check(client: AsyncClient) -> None:
     response = await client.get(f"{BASE_ROUTE}/health/ping")
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"msg": "pong"}
+
+
+async def test_pool_stats(client: AsyncClient) -> None:
+    """Test that the /health/pool endpoint returns connection pool statistics."""
+    response = await client.get(f"{BASE_ROUTE}/health/pool")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json().keys() == {"primary"}
+    assert PoolStatsSchema.model_validate(response.json()["primary"])
+
+
+async def test_pool_stats_read_replica(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the /health/pool endpoint includes the read replica's pool."""
+    read_engine = create_pooled_engine(DATABASE_URL)
+    monkeypatch.setattr(health, "read_engine", read_engine)
+    try:
+        response = await client.get(f"{BASE_ROUTE}/health/pool")
+    finally:
+        await read_engine.dispose()
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json().keys() == {"primary", "read"}
+    assert PoolStatsSchema.model_validate(response.json()["read"]).checkouts == 0
+
+
+async def test_statement_cache_stats(client: AsyncClient) -> None:
+    """Test that the /health/statements endpoint returns the statement cache settings."""
+    response = await client.get(f"{BASE_ROUTE}/health/statements")
+    assert response.status_code == status.HTTP_200_OK
+
+    stats = StatementCacheStatsSchema.model_validate(response.json())
+    assert stats.transaction_pooling == settings.POSTGRES_TRANSACTION_POOLING
+    assert stats.cache_size == settings.POSTGRES_STATEMENT_CACHE_SIZE
+
+
+async def test_query_stats(client: AsyncClient) -> None:
+    """Test that the /health/queries endpoint returns per-route query statistics."""
+    response = await client.get(f"{BASE_ROUTE}/health/ping")
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.get(f"{BASE_ROUTE}/health/queries")
+    assert response.status_code == status.HTTP_200_OK
+
+    routes = {
+        stats.route: stats
+        for stats in map(RouteQueryStatsSchema.model_validate, response.json())
+    }
+    assert routes[f"{BASE_ROUTE}/health/ping"].requests >= 1
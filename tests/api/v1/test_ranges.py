@@ -0,0 +1,47 @@
+import uuid
+
+import pytest
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.core.cdktf.aws import aws
+from src.app.schemas.template_range_schema import TemplateRangeSchema
+
+from .config import BASE_ROUTE
+from .test_templates import valid_range_payload
+
+
+async def test_deploy_releases_db_connection(
+    client: AsyncClient, async_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that deploying a range does not hold a DB connection during terraform."""
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/ranges", json=valid_range_payload
+    )
+    assert response.status_code == status.HTTP_200_OK
+    range_id = response.json()["id"]
+
+    checked_out: list[int] = []
+
+    def fake_create_aws_stack(
+        template_range: TemplateRangeSchema, cdktf_dir: str, range_id: uuid.UUID
+    ) -> str:
+        checked_out.append(async_engine.pool.checkedout())  # type: ignore[attr-defined]
+        return "test-stack"
+
+    def fake_deploy_infrastructure(stack_dir: str, stack_name: str) -> str:
+        checked_out.append(async_engine.pool.checkedout())  # type: ignore[attr-defined]
+        return "terraform.tfstate"
+
+    monkeypatch.setattr(aws, "create_aws_stack", fake_create_aws_stack)
+    monkeypatch.setattr(aws, "deploy_infrastructure", fake_deploy_infrastructure)
+
+    response = await client.post(f"{BASE_ROUTE}/ranges/deploy", json=[{"id": range_id}])
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"deployed": True}
+    assert checked_out == [0, 0]
+
+    # Clean up so template listing tests still start from an empty table
+    response = await client.delete(f"{BASE_ROUTE}/templates/ranges/{range_id}")
+    assert response.status_code == status.HTTP_200_OK
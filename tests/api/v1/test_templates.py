@@ -1,16 +1,24 @@
+import asyncio
 import copy
 import json
 import uuid
 from typing import Any
 
+import msgpack
 import pytest
 from fastapi import status
 from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from src.app.api.v1 import templates as templates_api
+from src.app.core.config import settings
+from src.app.crud import crud_range_templates
 from src.app.models.template_range_model import TemplateRangeModel
 from src.app.schemas.template_host_schema import TemplateHostSchema
 from src.app.schemas.template_subnet_schema import TemplateSubnetHeaderSchema
 
+from ...query_budget import assert_max_queries
 from .config import BASE_ROUTE
 
 ###### Test /template/range #######
@@ -88,7 +96,13 @@ async def test_template_range_get_non_empty_list(client: AsyncClient) -> None:
 
     non_nested_range_dict = copy.deepcopy(valid_range_payload)
     del non_nested_range_dict["vpcs"]
-    assert response_json[0] == {"id": range_template_id, **non_nested_range_dict}
+    assert response_json[0] == {
+        "id": range_template_id,
+        **non_nested_range_dict,
+        "vpc_count": 1,
+        "subnet_count": 1,
+        "host_count": 1,
+    }
 
 
 async def test_template_all_get_non_standalone_templates(client: AsyncClient) -> None:
@@ -100,7 +114,12 @@ async def test_template_all_get_non_standalone_templates(client: AsyncClient) ->
 
     non_nested_vpc_dict = copy.deepcopy(valid_vpc_payload)
     del non_nested_vpc_dict["subnets"]
-    assert response_json[0] == {"id": response_json[0]["id"], **non_nested_vpc_dict}
+    assert response_json[0] == {
+        "id": response_json[0]["id"],
+        **non_nested_vpc_dict,
+        "subnet_count": 1,
+        "host_count": 1,
+    }
 
     response = await client.get(f"{BASE_ROUTE}/templates/subnets?standalone_only=false")
     assert response.status_code == status.HTTP_200_OK
@@ -109,7 +128,11 @@ async def test_template_all_get_non_standalone_templates(client: AsyncClient) ->
 
     non_nested_subnet_dict = copy.deepcopy(valid_subnet_payload)
     del non_nested_subnet_dict["hosts"]
-    assert response_json[0] == {"id": response_json[0]["id"], **non_nested_subnet_dict}
+    assert response_json[0] == {
+        "id": response_json[0]["id"],
+        **non_nested_subnet_dict,
+        "host_count": 1,
+    }
 
     response = await client.get(f"{BASE_ROUTE}/templates/hosts?standalone_only=false")
     assert response.status_code == status.HTTP_200_OK
@@ -133,7 +156,12 @@ async def test_template_vpc_get_non_empty_list(client: AsyncClient) -> None:
 
     non_nested_vpc_dict = copy.deepcopy(valid_vpc_payload)
     del non_nested_vpc_dict["subnets"]
-    assert response_json[0] == {"id": vpc_template_id, **non_nested_vpc_dict}
+    assert response_json[0] == {
+        "id": vpc_template_id,
+        **non_nested_vpc_dict,
+        "subnet_count": 1,
+        "host_count": 1,
+    }
 
 
 async def test_template_subnet_get_non_empty_list(client: AsyncClient) -> None:
@@ -154,7 +182,11 @@ async def test_template_subnet_get_non_empty_list(client: AsyncClient) -> None:
     assert len(response_json) >= 1  # Our subnet template must be in there
 
     # Dynamically build header object to avoid future updates breaking tests
-    concat_dict = {"id": subnet_template_id, **unique_valid_subnet_payload}
+    concat_dict = {
+        "id": subnet_template_id,
+        **unique_valid_subnet_payload,
+        "host_count": 1,
+    }
     subnet_header_obj = TemplateSubnetHeaderSchema(**concat_dict)
 
     expected = json.loads(subnet_header_obj.model_dump_json())
@@ -203,6 +235,56 @@ async def test_template_range_valid_payload(client: AsyncClient) -> None:
     assert str(uuid_obj) == uuid_response
 
 
+async def test_template_range_headers_count_nested_templates(
+    client: AsyncClient,
+) -> None:
+    """Test that range and VPC headers count the templates nested in them."""
+    range_payload = copy.deepcopy(valid_range_payload)
+    range_payload["vpcs"] = [
+        {
+            "cidr": f"10.{v}.0.0/16",
+            "name": f"vpc-{v}",
+            "subnets": [
+                {
+                    "cidr": f"10.{v}.{s}.0/24",
+                    "name": f"subnet-{s}",
+                    "hosts": [
+                        {**valid_host_payload, "hostname": f"host-{h}"}
+                        for h in range(s + 1)
+                    ],
+                }
+                for s in range(v + 1)
+            ],
+        }
+        for v in range(2)
+    ]
+    response = await client.post(f"{BASE_ROUTE}/templates/ranges", json=range_payload)
+    assert response.status_code == status.HTTP_200_OK
+    range_id = response.json()["id"]
+
+    response = await client.get(f"{BASE_ROUTE}/templates/ranges")
+    assert response.status_code == status.HTTP_200_OK
+    (header,) = [header for header in response.json() if header["id"] == range_id]
+    assert header["vpc_count"] == 2  # noqa: PLR2004
+    assert header["subnet_count"] == 3  # noqa: PLR2004
+    assert header["host_count"] == 4  # noqa: PLR2004
+
+    response = await client.get(f"{BASE_ROUTE}/templates/vpcs?standalone_only=false")
+    assert response.status_code == status.HTTP_200_OK
+    vpc_headers = {
+        header["name"]: header
+        for header in response.json()
+        if header["name"] in {"vpc-0", "vpc-1"}
+    }
+    assert vpc_headers["vpc-0"]["subnet_count"] == 1
+    assert vpc_headers["vpc-0"]["host_count"] == 1
+    assert vpc_headers["vpc-1"]["subnet_count"] == 2  # noqa: PLR2004
+    assert vpc_headers["vpc-1"]["host_count"] == 3  # noqa: PLR2004
+
+    response = await client.delete(f"{BASE_ROUTE}/templates/ranges/{range_id}")
+    assert response.status_code == status.HTTP_200_OK
+
+
 async def test_template_range_get_range_invalid_uuid(client: AsyncClient) -> None:
     """Test that we get a 400 when providing an invalid UUID4."""
     response = await client.post(
@@ -262,6 +344,170 @@ async def test_template_range_invalid_vpc_subnet_cidr_contain(
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+async def test_template_range_overlapping_vpcs(client: AsyncClient) -> None:
+    """Test for 422 response listing the VPCs whose CIDRs overlap."""
+    invalid_payload = copy.deepcopy(valid_range_payload)
+    overlapping_vpc = copy.deepcopy(invalid_payload["vpcs"][0])
+    overlapping_vpc["name"] = "example-vpc-2"
+    overlapping_vpc["cidr"] = "192.168.0.0/20"
+    overlapping_vpc["subnets"][0]["cidr"] = "192.168.1.0/24"
+    invalid_payload["vpcs"].append(overlapping_vpc)
+
+    response = await client.post(f"{BASE_ROUTE}/templates/ranges", json=invalid_payload)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert (
+        "example-vpc-1 (192.168.0.0/16) and example-vpc-2 (192.168.0.0/20)"
+        in response.text
+    )
+
+
+async def test_template_range_large_upload(client: AsyncClient) -> None:
+    """Test that a range with more hosts than fit in one insert is stored whole."""
+    num_hosts = 2500
+    range_payload = copy.deepcopy(valid_range_payload)
+    subnet = range_payload["vpcs"][0]["subnets"][0]
+    subnet["cidr"] = "192.168.16.0/20"
+    subnet["hosts"] = [
+        {**valid_host_payload, "hostname": f"host-{i}"} for i in range(num_hosts)
+    ]
+
+    response = await client.post(f"{BASE_ROUTE}/templates/ranges", json=range_payload)
+    assert response.status_code == status.HTTP_200_OK
+    range_id = response.json()["id"]
+
+    response = await client.get(f"{BASE_ROUTE}/templates/ranges/{range_id}")
+    assert response.status_code == status.HTTP_200_OK
+    hosts = response.json()["vpcs"][0]["subnets"][0]["hosts"]
+    assert sorted(host["hostname"] for host in hosts) == sorted(
+        f"host-{i}" for i in range(num_hosts)
+    )
+
+
+async def test_template_range_upload_too_large(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that we get a 413 response for a range over the maximum template size."""
+    monkeypatch.setattr(settings, "MAX_TEMPLATE_SIZE", 100)
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/ranges", json=valid_range_payload
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+async def test_template_range_validate_too_large(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that we get a 413 response validating a range over the maximum size."""
+    monkeypatch.setattr(settings, "MAX_TEMPLATE_SIZE", 100)
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/validate", json=valid_range_payload
+    )
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+async def test_template_range_validate(client: AsyncClient) -> None:
+    """Test that a valid range template is validated without writing anything."""
+    templates_api.validation_cache.clear()
+
+    with assert_max_queries(0):
+        response = await client.post(
+            f"{BASE_ROUTE}/templates/validate", json=valid_range_payload
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"valid": True, "errors": []}
+
+
+async def test_template_range_validate_invalid(client: AsyncClient) -> None:
+    """Test that range-wide errors of an invalid range template are reported."""
+    templates_api.validation_cache.clear()
+    invalid_payload = copy.deepcopy(valid_range_payload)
+    overlapping_vpc = copy.deepcopy(invalid_payload["vpcs"][0])
+    overlapping_vpc["name"] = "example-vpc-2"
+    invalid_payload["vpcs"].append(overlapping_vpc)
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/validate", json=invalid_payload
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    verdict = response.json()
+    assert not verdict["valid"]
+    assert verdict["errors"][0]["loc"] == ["vpcs"]
+    assert (
+        "example-vpc-1 (192.168.0.0/16) and example-vpc-2 (192.168.0.0/16)"
+        in verdict["errors"][0]["msg"]
+    )
+
+
+async def test_template_range_validate_cached(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the same template is validated once, whatever its formatting."""
+    templates_api.validation_cache.clear()
+    validated: list[bytes] = []
+    validate = templates_api.validate_range_template
+
+    def count_validations(body: bytes) -> Any:  # noqa: ANN401
+        validated.append(body)
+        return validate(body)
+
+    monkeypatch.setattr(templates_api, "validate_range_template", count_validations)
+
+    bodies = [
+        json.dumps(valid_range_payload),
+        json.dumps(valid_range_payload, indent=2, sort_keys=True),
+    ]
+    for body in bodies:
+        response = await client.post(
+            f"{BASE_ROUTE}/templates/validate",
+            content=body,
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    assert len(validated) == 1
+    assert len(templates_api.validation_cache) == 1
+
+
+async def test_template_range_validate_invalid_json(client: AsyncClient) -> None:
+    """Test that a body that is not JSON is rejected and not cached."""
+    templates_api.validation_cache.clear()
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/validate",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["errors"][0]["type"] == "json_invalid"
+    assert len(templates_api.validation_cache) == 0
+
+
+async def test_template_range_validate_msgpack(client: AsyncClient) -> None:
+    """Test that MessagePack bodies share cached verdicts with JSON bodies."""
+    templates_api.validation_cache.clear()
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/validate",
+        content=json.dumps(valid_range_payload),
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/validate",
+        content=msgpack.packb(valid_range_payload),
+        headers={
+            "Content-Type": "application/msgpack",
+            "Accept": "application/msgpack",
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert msgpack.unpackb(response.content) == {"valid": True, "errors": []}
+    assert len(templates_api.validation_cache) == 1
+
+
 async def test_template_range_empty_tag(client: AsyncClient) -> None:
     """Test for a 422 response when a tag is empty."""
     invalid_payload = copy.deepcopy(valid_range_payload)
@@ -333,6 +579,196 @@ async def test_template_range_get_range(client: AsyncClient) -> None:
     assert response.json() == expected_response
 
 
+async def test_template_range_msgpack(client: AsyncClient) -> None:
+    """Test that ranges can be uploaded and retrieved as MessagePack."""
+    msgpack_headers = {
+        "Content-Type": "application/msgpack",
+        "Accept": "application/msgpack",
+    }
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/ranges",
+        content=msgpack.packb(valid_range_payload),
+        headers=msgpack_headers,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/msgpack"
+    range_id = msgpack.unpackb(response.content)["id"]
+
+    response = await client.get(
+        f"{BASE_ROUTE}/templates/ranges/{range_id}", headers=msgpack_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert "Accept" in response.headers["vary"]
+    assert msgpack.unpackb(response.content) == {"id": range_id, **valid_range_payload}
+
+    # Same template as JSON by default
+    response = await client.get(f"{BASE_ROUTE}/templates/ranges/{range_id}")
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"id": range_id, **valid_range_payload}
+
+
+async def test_template_range_msgpack_invalid(client: AsyncClient) -> None:
+    """Test that invalid MessagePack range uploads get JSON validation errors."""
+    invalid_payload = copy.deepcopy(valid_range_payload)
+    invalid_payload["vpcs"][0]["subnets"][0]["hosts"][0]["hostname"] = "-invalid"
+
+    for body, error_type in [
+        (msgpack.packb(invalid_payload), "value_error"),
+        (b"\xc1", "msgpack_invalid"),
+    ]:
+        response = await client.post(
+            f"{BASE_ROUTE}/templates/ranges",
+            content=body,
+            headers={
+                "Content-Type": "application/msgpack",
+                "Accept": "application/msgpack",
+            },
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert response.json()["detail"][0]["type"] == error_type
+
+
+async def test_template_range_get_range_depth(
+    client: AsyncClient, async_engine: AsyncEngine
+) -> None:
+    """Test that the depth parameter limits both the range response and its queries."""
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/ranges", json=valid_range_payload
+    )
+    assert response.status_code == status.HTTP_200_OK
+    range_id = response.json()["id"]
+
+    statements: list[str] = []
+
+    def count_statement(*args: Any) -> None:  # noqa: ANN401
+        statements.append(args[2])
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        for depth in range(4):
+            statements.clear()
+            response = await client.get(
+                f"{BASE_ROUTE}/templates/ranges/{range_id}?depth={depth}"
+            )
+            assert response.status_code == status.HTTP_200_OK
+            # One query for the range plus one per loaded level
+            assert len(statements) == depth + 1
+
+            expected_response = {"id": range_id, **copy.deepcopy(valid_range_payload)}
+            if depth == 0:
+                del expected_response["vpcs"]
+            for vpc in expected_response.get("vpcs", []):
+                if depth == 1:
+                    del vpc["subnets"]
+                for subnet in vpc.get("subnets", []):
+                    if depth == 2:  # noqa: PLR2004
+                        del subnet["hosts"]
+            assert response.json() == expected_response
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+
+
+async def test_template_range_get_range_concurrent(
+    client: AsyncClient, async_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that concurrent requests for the same range share their queries."""
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/ranges", json=valid_range_payload
+    )
+    assert response.status_code == status.HTTP_200_OK
+    range_id = response.json()["id"]
+
+    statements: list[str] = []
+
+    def count_statement(*args: Any) -> None:  # noqa: ANN401
+        statements.append(args[2])
+
+    requests = 10
+
+    # Hold the first lookup until every request has joined it, so they overlap
+    all_joined = asyncio.Event()
+    lookups = crud_range_templates._range_template_lookups
+    lookup, joined = lookups.do, 0
+
+    async def join_lookup(key: Any, fn: Any) -> Any:  # noqa: ANN401
+        nonlocal joined
+        joined += 1
+        if joined == requests:
+            all_joined.set()
+        return await lookup(key, fn)
+
+    get_range_template = crud_range_templates.get_range_template
+
+    async def held_get_range_template(*args: Any) -> Any:  # noqa: ANN401
+        await all_joined.wait()
+        return await get_range_template(*args)
+
+    monkeypatch.setattr(lookups, "do", join_lookup)
+    monkeypatch.setattr(
+        crud_range_templates, "get_range_template", held_get_range_template
+    )
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        responses = await asyncio.gather(
+            *[
+                client.get(f"{BASE_ROUTE}/templates/ranges/{range_id}")
+                for _ in range(requests)
+            ]
+        )
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+
+    expected_response = {"id": range_id, **valid_range_payload}
+    for response in responses:
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == expected_response
+
+    # One query for the range and one per nested level, shared by all requests
+    assert len(statements) == 4  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    ("route", "max_queries"),
+    [
+        ("ranges/{range_id}", 4),
+        ("vpcs/{vpc_id}", 3),
+        ("subnets/{subnet_id}", 2),
+        ("hosts/{host_id}", 1),
+        ("ranges", 1),
+        ("vpcs", 1),
+        ("subnets", 1),
+        ("hosts", 1),
+    ],
+)
+async def test_template_get_query_budget(
+    client: AsyncClient, route: str, max_queries: int
+) -> None:
+    """Test that template lookups stay within their SQL statement budget."""
+    ids: dict[str, str] = {}
+    for template_type, payload in (
+        ("range", valid_range_payload),
+        ("vpc", valid_vpc_payload),
+        ("subnet", valid_subnet_payload),
+        ("host", valid_host_payload),
+    ):
+        response = await client.post(
+            f"{BASE_ROUTE}/templates/{template_type}s", json=payload
+        )
+        assert response.status_code == status.HTTP_200_OK
+        ids[f"{template_type}_id"] = response.json()["id"]
+
+    with assert_max_queries(max_queries):
+        response = await client.get(f"{BASE_ROUTE}/templates/{route.format(**ids)}")
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_template_range_get_range_invalid_depth(client: AsyncClient) -> None:
+    """Test that we get a 422 error when requesting a depth deeper than a range."""
+    response = await client.get(f"{BASE_ROUTE}/templates/ranges/{uuid.uuid4()}?depth=4")
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 async def test_template_range_get_nonexistent_range(client: AsyncClient) -> None:
     """Test that we get a 404 error when requesting an nonexistent range in the database."""
     nonexistent_range_id = uuid.uuid4()
@@ -560,6 +996,32 @@ async def test_template_vpc_valid_payload(client: AsyncClient) -> None:
     assert str(uuid_obj) == uuid_response
 
 
+async def test_template_vpc_msgpack(client: AsyncClient) -> None:
+    """Test that schema validated bodies can be sent as MessagePack."""
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/vpcs",
+        content=msgpack.packb(valid_vpc_payload),
+        headers={"Content-Type": "application/msgpack"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    vpc_id = response.json()["id"]
+
+    response = await client.get(
+        f"{BASE_ROUTE}/templates/vpcs/{vpc_id}",
+        headers={"Accept": "application/msgpack"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert msgpack.unpackb(response.content) == {"id": vpc_id, **valid_vpc_payload}
+
+    # Undecodable bodies are rejected
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/vpcs",
+        content=b"\xc1",
+        headers={"Content-Type": "application/msgpack"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 async def test_template_vpc_get_vpc_invalid_uuid(client: AsyncClient) -> None:
     """Test that we get a 400 when providing an invalid UUID4."""
     response = await client.post(f"{BASE_ROUTE}/templates/vpcs", json=valid_vpc_payload)
@@ -609,6 +1071,99 @@ async def test_template_vpc_invalid_vpc_subnet_cidr_contain(
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+async def test_template_vpc_overlapping_subnets(client: AsyncClient) -> None:
+    """Test that we get a 422 response listing the subnets whose CIDRs overlap."""
+    invalid_payload = copy.deepcopy(valid_vpc_payload)
+    overlapping_subnet = copy.deepcopy(invalid_payload["subnets"][0])
+    overlapping_subnet["name"] = "example-subnet-2"
+    overlapping_subnet["cidr"] = "192.168.1.128/25"
+    invalid_payload["subnets"].append(overlapping_subnet)
+
+    response = await client.post(f"{BASE_ROUTE}/templates/vpcs", json=invalid_payload)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert (
+        "example-subnet-1 (192.168.1.0/24) and example-subnet-2 (192.168.1.128/25)"
+        in response.text
+    )
+
+
+async def test_template_vpc_allocate_subnet_cidrs(client: AsyncClient) -> None:
+    """Test that subnets without a CIDR get free blocks of the VPC allocated."""
+    payload = copy.deepcopy(valid_vpc_payload)
+    small_subnet = copy.deepcopy(payload["subnets"][0])
+    small_subnet["name"] = "example-subnet-2"
+    del small_subnet["cidr"]
+    large_subnet = copy.deepcopy(payload["subnets"][0])
+    large_subnet["name"] = "example-subnet-3"
+    large_subnet["hosts"] = [
+        {**large_subnet["hosts"][0], "hostname": f"example-host-{i}"}
+        for i in range(300)
+    ]
+    del large_subnet["cidr"]
+    payload["subnets"].extend([small_subnet, large_subnet])
+
+    response = await client.post(f"{BASE_ROUTE}/templates/vpcs", json=payload)
+    assert response.status_code == status.HTTP_200_OK
+    vpc_id = response.json()["id"]
+
+    response = await client.get(f"{BASE_ROUTE}/templates/vpcs/{vpc_id}")
+    assert response.status_code == status.HTTP_200_OK
+    cidrs = {subnet["name"]: subnet["cidr"] for subnet in response.json()["subnets"]}
+    assert cidrs == {
+        "example-subnet-1": "192.168.1.0/24",  # Kept as defined
+        "example-subnet-2": "192.168.0.0/24",
+        "example-subnet-3": "192.168.2.0/23",  # Too many hosts for a /24
+    }
+
+
+async def test_template_vpc_allocate_subnet_cidrs_vpc_full(client: AsyncClient) -> None:
+    """Test that we get a 422 response when no free block fits a subnet."""
+    invalid_payload = copy.deepcopy(valid_vpc_payload)
+    invalid_payload["cidr"] = "192.168.1.0/24"
+    extra_subnet = copy.deepcopy(invalid_payload["subnets"][0])
+    extra_subnet["name"] = "example-subnet-2"
+    del extra_subnet["cidr"]
+    invalid_payload["subnets"].append(extra_subnet)
+
+    response = await client.post(f"{BASE_ROUTE}/templates/vpcs", json=invalid_payload)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "example-subnet-2" in response.text
+
+
+async def test_template_vpc_allocate_subnet_cidrs_small_vpc(
+    client: AsyncClient,
+) -> None:
+    """Test that an allocated subnet leaves room for the jump box in a /24 VPC."""
+    payload = copy.deepcopy(valid_vpc_payload)
+    payload["cidr"] = "192.168.1.0/24"
+    del payload["subnets"][0]["cidr"]
+
+    response = await client.post(f"{BASE_ROUTE}/templates/vpcs", json=payload)
+    assert response.status_code == status.HTTP_200_OK
+    vpc_id = response.json()["id"]
+
+    response = await client.get(f"{BASE_ROUTE}/templates/vpcs/{vpc_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["subnets"][0]["cidr"] == "192.168.1.0/25"
+
+
+async def test_template_vpc_no_room_for_jump_box(client: AsyncClient) -> None:
+    """Test that we get a 422 response when subnets leave no room for the jump box."""
+    invalid_payload = copy.deepcopy(valid_vpc_payload)
+    invalid_payload["cidr"] = "192.168.1.0/24"
+    invalid_payload["subnets"][0]["cidr"] = "192.168.1.0/24"
+
+    response = await client.post(f"{BASE_ROUTE}/templates/vpcs", json=invalid_payload)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "jump box" in response.text
+
+    # Same VPC in a range
+    invalid_range = copy.deepcopy(valid_range_payload)
+    invalid_range["vpcs"][0] = invalid_payload
+    response = await client.post(f"{BASE_ROUTE}/templates/ranges", json=invalid_range)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 async def test_template_vpc_get_vpc(client: AsyncClient) -> None:
     """Test that we can retrieve the correct VPC after saving it in the database."""
     response = await client.post(f"{BASE_ROUTE}/templates/vpcs", json=valid_vpc_payload)
@@ -624,6 +1179,25 @@ async def test_template_vpc_get_vpc(client: AsyncClient) -> None:
     assert response.json() == expected_response
 
 
+async def test_template_vpc_get_vpc_depth(client: AsyncClient) -> None:
+    """Test that the depth parameter limits the nested levels in the VPC response."""
+    response = await client.post(f"{BASE_ROUTE}/templates/vpcs", json=valid_vpc_payload)
+    assert response.status_code == status.HTTP_200_OK
+    vpc_id = response.json()["id"]
+
+    response = await client.get(f"{BASE_ROUTE}/templates/vpcs/{vpc_id}?depth=0")
+    assert response.status_code == status.HTTP_200_OK
+    expected_response = {"id": vpc_id, **valid_vpc_payload}
+    del expected_response["subnets"]
+    assert response.json() == expected_response
+
+    response = await client.get(f"{BASE_ROUTE}/templates/vpcs/{vpc_id}?depth=1")
+    assert response.status_code == status.HTTP_200_OK
+    subnets = response.json()["subnets"]
+    assert len(subnets) == len(valid_vpc_payload["subnets"])
+    assert all("hosts" not in subnet for subnet in subnets)
+
+
 async def test_template_vpc_get_nonexistent_vpc(client: AsyncClient) -> None:
     """Test that we get a 404 error when requesting a nonexistent vpc in the database."""
     nonexistent_vpc_id = uuid.uuid4()
@@ -794,6 +1368,18 @@ async def test_template_subnet_valid_payload(client: AsyncClient) -> None:
     assert str(uuid_obj) == uuid_response
 
 
+async def test_template_subnet_standalone_missing_cidr(client: AsyncClient) -> None:
+    """Test that we get a 422 response for a standalone subnet without a CIDR."""
+    invalid_payload = copy.deepcopy(valid_subnet_payload)
+    del invalid_payload["cidr"]
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/subnets", json=invalid_payload
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "need a CIDR" in response.text
+
+
 async def test_template_subnet_get_subnet_invalid_uuid(client: AsyncClient) -> None:
     """Test that we get a 400 when providing an invalid UUID4."""
     response = await client.post(
@@ -844,6 +1430,47 @@ async def test_template_subnet_too_many_hosts(client: AsyncClient) -> None:
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+async def test_template_subnet_invalid_hosts(client: AsyncClient) -> None:
+    """Test that invalid hosts of a subnet are reported like standalone hosts."""
+    invalid_payload = copy.deepcopy(valid_subnet_payload)
+    valid_host = invalid_payload["hosts"][0]
+    invalid_payload["hosts"] = [
+        valid_host,
+        {**valid_host, "hostname": "-invalid-host"},
+        {**valid_host, "hostname": "example-host-3", "os": "windows_2016", "size": 8},
+        {**valid_host, "hostname": "example-host-4", "tags": ["web", " "]},
+    ]
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/subnets", json=invalid_payload
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    errors = [(error["loc"], error["msg"]) for error in response.json()["detail"]]
+    assert errors == [
+        (
+            ["body", "hosts", 1, "hostname"],
+            "Value error, Invalid hostname: -invalid-host",
+        ),
+        (
+            ["body", "hosts", 2, "size"],
+            "Value error, Disk size 8GB too small for OS: windows_2016. Minimum disk size: 32GB",
+        ),
+        (["body", "hosts", 3, "tags"], "Value error, Tags must not be empty"),
+    ]
+
+
+async def test_template_subnet_duplicate_hostnames(client: AsyncClient) -> None:
+    """Test that we get a 422 response when hostnames in a subnet repeat."""
+    invalid_payload = copy.deepcopy(valid_subnet_payload)
+    invalid_payload["hosts"].append(copy.deepcopy(invalid_payload["hosts"][0]))
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/subnets", json=invalid_payload
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert "All hostnames must be unique." in response.text
+
+
 async def test_template_subnet_get_subnet(client: AsyncClient) -> None:
     """Test that we can retrieve the correct subnet after saving it in the database."""
     response = await client.post(
@@ -861,6 +1488,21 @@ async def test_template_subnet_get_subnet(client: AsyncClient) -> None:
     assert response.json() == expected_response
 
 
+async def test_template_subnet_get_subnet_depth(client: AsyncClient) -> None:
+    """Test that depth=0 leaves the hosts out of the subnet response."""
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/subnets", json=valid_subnet_payload
+    )
+    assert response.status_code == status.HTTP_200_OK
+    subnet_id = response.json()["id"]
+
+    response = await client.get(f"{BASE_ROUTE}/templates/subnets/{subnet_id}?depth=0")
+    assert response.status_code == status.HTTP_200_OK
+    expected_response = {"id": subnet_id, **valid_subnet_payload}
+    del expected_response["hosts"]
+    assert response.json() == expected_response
+
+
 async def test_template_subnet_get_nonexistent_subnet(client: AsyncClient) -> None:
     """Test that we get a 404 error when requesting a nonexistent subnet in the database."""
     nonexistent_subnet_id = uuid.uuid4()
@@ -1002,6 +1644,24 @@ async def test_template_host_valid_payload(client: AsyncClient) -> None:
     assert str(uuid_obj) == uuid_response
 
 
+async def test_template_host_uuid7_ids(
+    client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that templates get UUID7 IDs when configured and can be fetched by them."""
+    monkeypatch.setattr(settings, "UUID_VERSION", 7)
+
+    response = await client.post(
+        f"{BASE_ROUTE}/templates/hosts", json=valid_host_payload
+    )
+    assert response.status_code == status.HTTP_200_OK
+    host_id = response.json()["id"]
+    assert uuid.UUID(host_id).version == 7  # noqa: PLR2004
+
+    response = await client.get(f"{BASE_ROUTE}/templates/hosts/{host_id}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"id": host_id, **valid_host_payload}
+
+
 async def test_template_host_get_host_invalid_uuid(client: AsyncClient) -> None:
     """Test that we get a 400 when providing an invalid UUID4."""
     response = await client.post(
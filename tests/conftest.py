@@ -15,7 +15,7 @@ from sqlalchemy.ext.asyncio import (
 )
 from testcontainers.postgres import PostgresContainer
 
-from src.app.core.db.database import Base, async_get_db
+from src.app.core.db.database import Base, async_get_db, async_get_read_db
 from src.app.main import app
 
 logger = logging.getLogger(__name__)
@@ -62,20 +62,45 @@ def postgres_container() -> Generator[str, None, None]:
     logger.info("Postgres test container stopped.")
 
 
-@pytest.fixture(scope="session", autouse=True)
-def create_db_schema(postgres_container: str) -> None:
+@pytest.fixture(scope="session")
+def replica_postgres_container() -> Generator[str, None, None]:
+    """Get connection string to a second Postgres container standing in for a read replica.
+
+    Nothing is replicated to it, so tests can tell which database served a query.
+
+    Returns
+    -------
+        Generator[str, None, None]: Async connection string to replica database.
+
+    """
+    logger.info("Starting replica Postgres test container...")
+    with PostgresContainer("postgres:17") as container:
+        container.start()
+
+        async_url = container.get_connection_url().replace("psycopg2", "asyncpg")
+        create_schema(async_url)
+
+        container_up_msg = f"Replica test container up => {async_url}"
+        logger.info(container_up_msg)
+
+        yield async_url
+
+    logger.info("Replica Postgres test container stopped.")
+
+
+def create_schema(async_url: str) -> None:
     """Create database schema synchronously (using psycopg2 driver).
 
     Args:
     ----
-        postgres_container (str): Postgres container connection string.
+        async_url (str): Async Postgres connection string.
 
     Returns:
     -------
         None
 
     """
-    sync_url = postgres_container.replace("asyncpg", "psycopg2")
+    sync_url = async_url.replace("asyncpg", "psycopg2")
 
     create_schema_msg = f"Creating schema with sync engine => {sync_url}"
     logger.info(create_schema_msg)
@@ -93,6 +118,22 @@ def create_db_schema(postgres_container: str) -> None:
         logger.info("Sync engine disposed after schema creation.")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def create_db_schema(postgres_container: str) -> None:
+    """Create database schema in the test database.
+
+    Args:
+    ----
+        postgres_container (str): Postgres container connection string.
+
+    Returns:
+    -------
+        None
+
+    """
+    create_schema(postgres_container)
+
+
 @pytest_asyncio.fixture(scope="function")
 async def async_engine(postgres_container: str) -> AsyncGenerator[AsyncEngine, None]:
     """Create async database engine for the entire test session.
@@ -111,6 +152,26 @@ async def async_engine(postgres_container: str) -> AsyncGenerator[AsyncEngine, N
     await engine.dispose()
 
 
+@pytest_asyncio.fixture(scope="function")
+async def replica_engine(
+    replica_postgres_container: str,
+) -> AsyncGenerator[AsyncEngine, None]:
+    """Create async database engine for the read replica database.
+
+    Args:
+    ----
+        replica_postgres_container (str): Replica Postgres container connection string.
+
+    Returns:
+    -------
+        AsyncGenerator[AsyncEngine, None]: Async replica database engine.
+
+    """
+    engine = create_async_engine(replica_postgres_container, echo=False, future=True)
+    yield engine
+    await engine.dispose()
+
+
 @pytest_asyncio.fixture
 async def client(async_engine: AsyncEngine) -> AsyncGenerator[httpx.AsyncClient, None]:
     """Async client fixture that overrides the DB dependency with async sessions.
@@ -135,6 +196,7 @@ async def client(async_engine: AsyncEngine) -> AsyncGenerator[httpx.AsyncClient,
             yield session
 
     app.dependency_overrides[async_get_db] = _override_async_get_db
+    app.dependency_overrides[async_get_read_db] = _override_async_get_db
 
     # Use httpx's ASGITransport to run requests against the FastAPI app in-memory
     transport = httpx.ASGITransport(app=app)
@@ -1,3 +1,6 @@
+import json
+import uuid
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -58,14 +61,17 @@ cyber_range = TemplateRangeSchema.model_validate(
 )
 
 
-# Function to derive a subnet CIDR from the VPC CIDR
-def modify_cidr(vpc_cidr: str, new_third_octet: int) -> str:
-    """Dervies public subnet with third octet = 99 from the vpc cidr block."""
-    ip_part, prefix = vpc_cidr.split("/")
-    octets = ip_part.split(".")
-    octets[2] = str(new_third_octet)  # Change the third octet
-    octets[3] = "0"  # Explicitly set the fourth octet to 0
-    return f"{'.'.join(octets)}/24"  # Convert back to CIDR
+# Lowest /24 of each VPC not used by its template subnets
+expected_public_subnet_cidrs = {
+    "example-vpc-1": "192.168.0.0/24",
+    "example-vpc-2": "10.10.0.0/24",
+}
+
+# First address after the reserved ones in each VPC's template subnet
+expected_host_ips = {
+    "example-vpc-1": "192.168.1.4",
+    "example-vpc-2": "10.10.1.4",
+}
 
 
 @pytest.fixture(scope="module")
@@ -103,8 +109,7 @@ def test_each_vpc_has_a_public_subnet(synthesized: str) -> None:
     assert Testing.to_have_resource(synthesized, Subnet.TF_RESOURCE_TYPE)
 
     for vpc in cyber_range.vpcs:
-        # Generate the new subnet CIDR with third octet = 99
-        public_subnet_cidr = modify_cidr(str(vpc.cidr), 99)
+        public_subnet_cidr = expected_public_subnet_cidrs[vpc.name]
         assert Testing.to_have_resource_with_properties(
             synthesized,
             Subnet.TF_RESOURCE_TYPE,
@@ -171,3 +176,32 @@ def test_each_subnet_has_at_least_one_ec2_instance(synthesized: str) -> None:
                         "instance_type": str(AWS_SPEC_MAP[host.spec]),
                     },
                 )
+
+
+def test_hosts_have_static_private_ips(synthesized: str) -> None:
+    """Ensure each host gets the first usable private IP of its subnet."""
+    from cdktf import Testing
+    from cdktf_cdktf_provider_aws.instance import Instance
+
+    for vpc in cyber_range.vpcs:
+        assert Testing.to_have_resource_with_properties(
+            synthesized,
+            Instance.TF_RESOURCE_TYPE,
+            {
+                "tags": {"Name": f"example-host-1-{vpc.name}"},
+                "private_ip": expected_host_ips[vpc.name],
+            },
+        )
+
+
+def test_create_aws_stack_writes_host_ips(tmp_path: Path) -> None:
+    """Ensure the host IP map is written next to the synthesized stack."""
+    from src.app.core.cdktf.aws.aws import HOST_IPS_FILE, create_aws_stack
+
+    stack_name = create_aws_stack(cyber_range, str(tmp_path), uuid.uuid4())
+
+    host_ips_file = tmp_path / "stacks" / stack_name / HOST_IPS_FILE
+    assert json.loads(host_ips_file.read_text(encoding="utf-8")) == {
+        vpc_name: {"example-subnet-1": {"example-host-1": host_ip}}
+        for vpc_name, host_ip in expected_host_ips.items()
+    }
@@ -0,0 +1 @@
+"""Database tests for the OpenLabsX API."""
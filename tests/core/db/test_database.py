@@ -0,0 +1,159 @@
+import uuid
+from typing import Any, AsyncGenerator
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import status
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.app.api import router
+from src.app.core.config import Settings
+from src.app.core.db.database import (
+    READ_PRIMARY_COOKIE,
+    async_get_db,
+    async_get_read_db,
+    read_db_dependency,
+)
+from src.app.core.setup import create_application
+
+from ...api.v1.config import BASE_ROUTE
+from ...api.v1.test_templates import valid_range_payload
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "expected_status"),
+    [
+        ("GET", "/health/ping", status.HTTP_200_OK),
+        ("GET", "/templates/ranges/not-a-uuid", status.HTTP_400_BAD_REQUEST),
+        ("GET", "/templates/hosts/not-a-uuid", status.HTTP_400_BAD_REQUEST),
+        ("DELETE", "/templates/vpcs/not-a-uuid", status.HTTP_400_BAD_REQUEST),
+        (
+            "GET",
+            f"/templates/subnets/{uuid.uuid4()}?depth=5",
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+        ),
+        ("POST", "/templates/ranges", status.HTTP_422_UNPROCESSABLE_ENTITY),
+    ],
+)
+async def test_rejected_requests_do_not_checkout_connection(
+    client: AsyncClient,
+    async_engine: AsyncEngine,
+    method: str,
+    path: str,
+    expected_status: int,
+) -> None:
+    """Test that requests answered without the database never use the pool."""
+    checkouts: list[Any] = []
+
+    def count_checkout(*args: Any) -> None:  # noqa: ANN401
+        checkouts.append(args)
+
+    event.listen(async_engine.sync_engine, "checkout", count_checkout)
+    try:
+        response = await client.request(method, f"{BASE_ROUTE}{path}", json={})
+    finally:
+        event.remove(async_engine.sync_engine, "checkout", count_checkout)
+
+    assert response.status_code == expected_status
+    assert not checkouts
+
+
+async def test_db_request_checks_out_connection(
+    client: AsyncClient, async_engine: AsyncEngine
+) -> None:
+    """Test that a request that queries the database checks out one connection."""
+    checkouts: list[Any] = []
+
+    def count_checkout(*args: Any) -> None:  # noqa: ANN401
+        checkouts.append(args)
+
+    event.listen(async_engine.sync_engine, "checkout", count_checkout)
+    try:
+        response = await client.get(f"{BASE_ROUTE}/templates/hosts/{uuid.uuid4()}")
+    finally:
+        event.remove(async_engine.sync_engine, "checkout", count_checkout)
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert len(checkouts) == 1
+
+
+@pytest_asyncio.fixture
+async def replica_client(
+    async_engine: AsyncEngine, replica_engine: AsyncEngine
+) -> AsyncGenerator[AsyncClient, None]:
+    """Async client for an app that reads from a replica database.
+
+    Args:
+    ----
+        async_engine (AsyncEngine): Async primary database engine.
+        replica_engine (AsyncEngine): Async replica database engine.
+
+    Returns:
+    -------
+        AsyncGenerator[AsyncClient, None]: Async client for the app.
+
+    """
+    app = create_application(
+        router=router, settings=Settings(POSTGRES_READ_URI="replica")
+    )
+
+    primary_session = async_sessionmaker(
+        bind=async_engine, expire_on_commit=False, class_=AsyncSession
+    )
+    replica_session = async_sessionmaker(
+        bind=replica_engine, expire_on_commit=False, class_=AsyncSession
+    )
+
+    async def _override_async_get_db() -> AsyncGenerator[AsyncSession, None]:
+        async with primary_session() as session:
+            yield session
+
+    app.dependency_overrides[async_get_db] = _override_async_get_db
+    app.dependency_overrides[async_get_read_db] = read_db_dependency(
+        primary_session, replica_session
+    )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def test_reads_use_replica_until_client_writes(
+    replica_client: AsyncClient,
+) -> None:
+    """Test that GETs read from the replica, except right after the client writes."""
+    response = await replica_client.post(
+        f"{BASE_ROUTE}/templates/ranges", json=valid_range_payload
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert READ_PRIMARY_COOKIE in response.cookies
+    range_id = response.json()["id"]
+
+    # Read-your-writes: the upload is not on the replica
+    response = await replica_client.get(f"{BASE_ROUTE}/templates/ranges/{range_id}")
+    assert response.status_code == status.HTTP_200_OK
+    response = await replica_client.get(f"{BASE_ROUTE}/templates/ranges")
+    assert response.status_code == status.HTTP_200_OK
+
+    # Without the cookie, reads go to the (empty) replica
+    replica_client.cookies.clear()
+    response = await replica_client.get(f"{BASE_ROUTE}/templates/ranges/{range_id}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await replica_client.get(f"{BASE_ROUTE}/templates/ranges")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    # Deletes stay on the primary
+    response = await replica_client.delete(f"{BASE_ROUTE}/templates/ranges/{range_id}")
+    assert response.status_code == status.HTTP_200_OK
+
+
+async def test_failed_writes_do_not_pin_client_to_primary(
+    replica_client: AsyncClient,
+) -> None:
+    """Test that only successful writes set the primary read cookie."""
+    response = await replica_client.post(f"{BASE_ROUTE}/templates/ranges", json={})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert READ_PRIMARY_COOKIE not in response.cookies
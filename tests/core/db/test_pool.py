@@ -0,0 +1,78 @@
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.app.core.db.pool import MeteredAsyncQueuePool
+
+
+@pytest_asyncio.fixture
+async def metered_engine(
+    postgres_container: str,
+) -> AsyncGenerator[AsyncEngine, None]:
+    """Engine using the metered pool with a single connection and no overflow."""
+    engine = create_async_engine(
+        postgres_container,
+        poolclass=MeteredAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    yield engine
+    await engine.dispose()
+
+
+async def test_pool_stats_checkout_and_hold(metered_engine: AsyncEngine) -> None:
+    """Test that checkouts and their hold times are recorded."""
+    pool = metered_engine.pool
+    assert isinstance(pool, MeteredAsyncQueuePool)
+
+    async with metered_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        stats = pool.stats()
+        assert stats.checked_out == 1
+        assert stats.checkouts == 1
+
+    stats = pool.stats()
+    assert stats.checked_out == 0
+    assert stats.checked_in == 1
+    assert stats.hold_time_max > 0
+    assert stats.hold_time_avg == stats.hold_time_max
+    assert stats.wait_time_max > 0
+
+
+async def test_pool_stats_timeout(metered_engine: AsyncEngine) -> None:
+    """Test that checkouts timing out on an exhausted pool are counted."""
+    pool = metered_engine.pool
+    assert isinstance(pool, MeteredAsyncQueuePool)
+
+    async with metered_engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            async with metered_engine.connect():
+                pass
+
+    stats = pool.stats()
+    assert stats.checkouts == 1
+    assert stats.timeouts == 1
+    assert stats.wait_time_max >= 0.1  # noqa: PLR2004
+
+
+async def test_pool_recreate_keeps_metering(metered_engine: AsyncEngine) -> None:
+    """Test that the engine recreates a metered pool with fresh counters on dispose."""
+    async with metered_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    await metered_engine.dispose()
+
+    pool = metered_engine.pool
+    assert isinstance(pool, MeteredAsyncQueuePool)
+    assert pool.stats().checkouts == 0
+
+    async with metered_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+    # Check-ins are recorded once, on the pool the connection came from
+    assert pool.checkins == 1
+    assert len(pool.dispatch.checkin) == 1
@@ -0,0 +1,69 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.core.db.query_stats import QueryStats, RouteQueryMetrics, track_queries
+
+
+async def test_track_queries_counts_statements(async_engine: AsyncEngine) -> None:
+    """Test that statements run through the async driver are counted and timed."""
+    with track_queries() as stats:
+        async with async_engine.connect() as conn:
+            for _ in range(3):
+                await conn.execute(text("SELECT 1"))
+
+    assert stats.count == 3  # noqa: PLR2004
+    assert stats.duration > 0
+
+
+async def test_track_queries_nested(async_engine: AsyncEngine) -> None:
+    """Test that nested trackers each count the statements run inside them."""
+    async with async_engine.connect() as conn:
+        with track_queries() as outer:
+            await conn.execute(text("SELECT 1"))
+            with track_queries() as inner:
+                await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 1"))
+
+        # Statements outside any tracker are ignored
+        await conn.execute(text("SELECT 1"))
+
+    assert inner.count == 1
+    assert outer.count == 3  # noqa: PLR2004
+    assert outer.duration >= inner.duration
+
+
+async def test_track_queries_failed_statement(async_engine: AsyncEngine) -> None:
+    """Test that a failing statement does not break timing of later statements."""
+    async with async_engine.connect() as conn:
+        with track_queries() as stats:
+            try:
+                await conn.execute(text("SELECT * FROM missing_table"))
+            except Exception:  # noqa: BLE001, S110
+                pass
+            await conn.rollback()
+            await conn.execute(text("SELECT 1"))
+
+    assert stats.count == 1
+
+
+def test_route_query_metrics() -> None:
+    """Test that request stats are totalled per route."""
+    metrics = RouteQueryMetrics()
+    for count in (4, 2):
+        stats = QueryStats()
+        for _ in range(count):
+            stats.record(0.5)
+        metrics.record("/v1/templates/ranges/{range_id}", stats)
+    metrics.record("/v1/health/ping", QueryStats())
+
+    ping, ranges = metrics.snapshot()
+    assert ping.route == "/v1/health/ping"
+    assert ping.requests == 1
+    assert ping.queries == 0
+    assert ranges.requests == 2  # noqa: PLR2004
+    assert ranges.queries == 6  # noqa: PLR2004
+    assert ranges.max_queries == 4  # noqa: PLR2004
+    assert ranges.query_time == 3.0  # noqa: PLR2004
+
+    metrics.clear()
+    assert metrics.snapshot() == []
@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.app.core.db.database import statement_connect_args
+from src.app.core.db.statements import StatementCache
+from src.app.crud.hot_queries import HOT_QUERIES
+
+
+async def cached_statements(engine: AsyncEngine, connections: int) -> list[Any]:
+    """Get the prepared statement caches of the engine's pooled connections."""
+    caches: list[Any] = []
+    conns = [await engine.connect() for _ in range(connections)]
+    for conn in conns:
+        raw = await conn.get_raw_connection()
+        caches.append(raw.dbapi_connection._prepared_statement_cache)  # type: ignore[union-attr]
+        await conn.close()
+    return caches
+
+
+async def test_warm_prepares_hot_statements_on_each_connection(
+    postgres_container: str,
+) -> None:
+    """Test that warming fills the statement cache of several pooled connections."""
+    engine = create_async_engine(
+        postgres_container, connect_args=statement_connect_args(100, False)
+    )
+    statement_cache = StatementCache(size=100, transaction_pooling=False)
+    statements: set[str] = set()
+
+    def collect_statement(*args: Any) -> None:  # noqa: ANN401
+        statements.add(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", collect_statement)
+    try:
+        await statement_cache.warm(engine, HOT_QUERIES, connections=2)
+        event.remove(engine.sync_engine, "before_cursor_execute", collect_statement)
+
+        stats = statement_cache.stats()
+        assert stats.warmed_connections == {"primary": 2}
+        assert stats.warmed_statements == len(HOT_QUERIES)
+        assert len(statements) == len(HOT_QUERIES)
+
+        for cache in await cached_statements(engine, connections=2):
+            assert all(statement in cache for statement in statements)
+    finally:
+        await engine.dispose()
+
+
+async def test_warm_skipped_without_statement_cache(async_engine: AsyncEngine) -> None:
+    """Test that nothing is warmed when statements are not cached."""
+    statements: list[str] = []
+
+    def count_statement(*args: Any) -> None:  # noqa: ANN401
+        statements.append(args[2])
+
+    statement_cache = StatementCache(size=100, transaction_pooling=True)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count_statement)
+    try:
+        await statement_cache.warm(async_engine, HOT_QUERIES, connections=2)
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count_statement)
+
+    assert not statements
+    assert statement_cache.stats().cache_size == 0
+    assert statement_cache.stats().warmed_connections == {}
+
+
+async def test_warm_failures_leave_connections_cold(async_engine: AsyncEngine) -> None:
+    """Test that failed and timed out connections are not counted as warmed."""
+
+    async def failing_query(db: AsyncSession) -> None:
+        await db.execute(text("SELECT * FROM missing_table"))
+
+    async def slow_query(db: AsyncSession) -> None:
+        await asyncio.sleep(1)
+
+    statement_cache = StatementCache(size=100, transaction_pooling=False)
+    await statement_cache.warm(async_engine, [failing_query], connections=2)
+    await statement_cache.warm(
+        async_engine, [slow_query], connections=1, name="read", timeout=0.01
+    )
+
+    stats = statement_cache.stats()
+    assert stats.warmed_connections == {"primary": 0, "read": 0}
+    assert stats.warmed_statements == 0
+
+
+async def test_transaction_pooling_mode(postgres_container: str) -> None:
+    """Test that transaction pooling mode runs queries without cached statements."""
+    engine = create_async_engine(
+        postgres_container, connect_args=statement_connect_args(100, True)
+    )
+    try:
+        async with engine.connect() as conn:
+            for _ in range(2):
+                assert await conn.scalar(text("SELECT 1")) == 1
+            async with AsyncSession(bind=conn) as db:
+                for query in HOT_QUERIES:
+                    await query(db)
+
+        (cache,) = await cached_statements(engine, connections=1)
+        assert cache is None
+    finally:
+        await engine.dispose()
@@ -0,0 +1 @@
+"""Middleware tests for the OpenLabsX API."""
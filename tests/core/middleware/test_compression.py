@@ -0,0 +1,149 @@
+import gzip
+from typing import AsyncGenerator
+
+import httpx
+import pytest
+import pytest_asyncio
+import zstandard
+from fastapi import FastAPI, status
+from fastapi.responses import PlainTextResponse, StreamingResponse
+
+from src.app.core.middleware.compression import (
+    CompressionMiddleware,
+    select_encoding,
+)
+
+LARGE_BODY = '{"os": "debian_11", "spec": "tiny", "tags": ["web", "linux"]}' * 100
+
+
+def build_app() -> CompressionMiddleware:
+    """Build a minimal app wrapped in the compression middleware."""
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large() -> PlainTextResponse:
+        return PlainTextResponse(LARGE_BODY)
+
+    @app.get("/small")
+    async def small() -> PlainTextResponse:
+        return PlainTextResponse("pong")
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncGenerator[str, None]:
+            yield LARGE_BODY
+            yield LARGE_BODY
+
+        return StreamingResponse(chunks())
+
+    return CompressionMiddleware(app, minimum_size=500)
+
+
+@pytest_asyncio.fixture
+async def compression() -> (
+    AsyncGenerator[tuple[httpx.AsyncClient, CompressionMiddleware], None]
+):
+    """Client for an app wrapped in the compression middleware."""
+    middleware = build_app()
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c, middleware
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip", "gzip"),
+        ("gzip, deflate, br, zstd", "zstd"),
+        ("zstd;q=0.5, gzip", "gzip"),
+        ("zstd;q=0, gzip;q=0", None),
+        ("zstd;level=1;q=0.5, gzip", "gzip"),
+        ("*", "zstd"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_select_encoding(accept_encoding: str, expected: str | None) -> None:
+    """Test Accept-Encoding negotiation."""
+    assert select_encoding(accept_encoding) == expected
+
+
+async def test_gzip_large_response(
+    compression: tuple[httpx.AsyncClient, CompressionMiddleware],
+) -> None:
+    """Test that large responses are gzip compressed when requested."""
+    client, _ = compression
+    response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == LARGE_BODY
+
+
+async def test_zstd_large_response(
+    compression: tuple[httpx.AsyncClient, CompressionMiddleware],
+) -> None:
+    """Test that large responses are zstd compressed when preferred."""
+    client, _ = compression
+    async with client.stream(
+        "GET", "/large", headers={"Accept-Encoding": "zstd, gzip"}
+    ) as response:
+        raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["content-encoding"] == "zstd"
+    assert int(response.headers["content-length"]) == len(raw)
+    assert zstandard.ZstdDecompressor().decompress(raw) == LARGE_BODY.encode()
+
+
+async def test_no_compression_below_minimum_size(
+    compression: tuple[httpx.AsyncClient, CompressionMiddleware],
+) -> None:
+    """Test that small responses are sent uncompressed."""
+    client, _ = compression
+    response = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == "pong"
+
+
+async def test_no_compression_without_accept_encoding(
+    compression: tuple[httpx.AsyncClient, CompressionMiddleware],
+) -> None:
+    """Test that responses are sent uncompressed when the client does not ask for it."""
+    client, _ = compression
+    response = await client.get("/large", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == LARGE_BODY
+
+
+async def test_streaming_response_passthrough(
+    compression: tuple[httpx.AsyncClient, CompressionMiddleware],
+) -> None:
+    """Test that streaming responses are passed through uncompressed."""
+    client, _ = compression
+    response = await client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == LARGE_BODY * 2
+
+
+async def test_compressed_body_cached(
+    compression: tuple[httpx.AsyncClient, CompressionMiddleware],
+) -> None:
+    """Test that an identical body is only compressed once per encoding."""
+    client, middleware = compression
+
+    for _ in range(3):
+        response = await client.get("/large", headers={"Accept-Encoding": "gzip"})
+        assert response.text == LARGE_BODY
+    assert len(middleware.cache) == 1
+
+    # Cache hits return the stored body instead of recompressing
+    body = LARGE_BODY.encode()
+    assert middleware.compress(body, "gzip") is middleware.compress(body, "gzip")
+    assert gzip.decompress(middleware.compress(body, "gzip")) == body
+
+    response = await client.get("/large", headers={"Accept-Encoding": "zstd"})
+    assert len(middleware.cache) == 2  # noqa: PLR2004
@@ -0,0 +1,106 @@
+import httpx
+from fastapi import APIRouter, FastAPI, status
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.app.core.db.query_stats import RouteQueryMetrics
+from src.app.core.middleware.query_stats import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryStatsMiddleware,
+)
+
+
+def build_app(engine: AsyncEngine) -> FastAPI:
+    """Build a minimal app with an endpoint that runs queries."""
+    app = FastAPI()
+
+    @app.get("/items/{count}")
+    async def items(count: int) -> dict[str, int]:
+        async with engine.connect() as conn:
+            for _ in range(count):
+                await conn.execute(text("SELECT 1"))
+        return {"count": count}
+
+    return app
+
+
+async def test_query_stats_debug_headers(async_engine: AsyncEngine) -> None:
+    """Test that debug mode adds the request's query count and time headers."""
+    middleware = QueryStatsMiddleware(
+        build_app(async_engine), debug_headers=True, metrics=RouteQueryMetrics()
+    )
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.get("/items/3")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers[QUERY_COUNT_HEADER] == "3"
+    assert float(response.headers[QUERY_TIME_HEADER]) > 0
+
+
+async def test_query_stats_no_debug_headers(async_engine: AsyncEngine) -> None:
+    """Test that query headers are left out when not in debug mode."""
+    middleware = QueryStatsMiddleware(
+        build_app(async_engine), metrics=RouteQueryMetrics()
+    )
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.get("/items/1")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert QUERY_COUNT_HEADER not in response.headers
+    assert QUERY_TIME_HEADER not in response.headers
+
+
+async def test_query_stats_route_metrics(async_engine: AsyncEngine) -> None:
+    """Test that requests are totalled under their route template."""
+    metrics = RouteQueryMetrics()
+    middleware = QueryStatsMiddleware(build_app(async_engine), metrics=metrics)
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        await c.get("/items/1")
+        await c.get("/items/2")
+        await c.get("/unknown")  # Unmatched routes are not recorded
+
+    (items,) = metrics.snapshot()
+    assert items.route == "/items/{count}"
+    assert items.requests == 2  # noqa: PLR2004
+    assert items.queries == 3  # noqa: PLR2004
+    assert items.max_queries == 2  # noqa: PLR2004
+
+
+async def test_query_stats_included_router_prefix(async_engine: AsyncEngine) -> None:
+    """Test that routes of included routers are totalled under their full path."""
+    inner = APIRouter(prefix="/items")
+
+    @inner.get("/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        return {"id": item_id}
+
+    outer = APIRouter(prefix="/api/v1")
+    outer.include_router(inner)
+    app = FastAPI()
+    app.include_router(outer)
+
+    metrics = RouteQueryMetrics()
+    transport = httpx.ASGITransport(app=QueryStatsMiddleware(app, metrics=metrics))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        await c.get("/api/v1/items/7")
+
+    (items,) = metrics.snapshot()
+    assert items.route == "/api/v1/items/{item_id}"
+
+
+async def test_query_stats_mounted_app_root_path(async_engine: AsyncEngine) -> None:
+    """Test that routes of mounted apps are totalled under their mount path."""
+    app = FastAPI()
+    app.mount("/sub", build_app(async_engine))
+
+    metrics = RouteQueryMetrics()
+    transport = httpx.ASGITransport(app=QueryStatsMiddleware(app, metrics=metrics))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        await c.get("/sub/items/1")
+
+    (items,) = metrics.snapshot()
+    assert items.route == "/sub/items/{count}"
@@ -0,0 +1,53 @@
+import httpx
+import pytest
+from fastapi import FastAPI, status
+
+from src.app.core.db.database import READ_PRIMARY_COOKIE
+from src.app.core.middleware.read_your_writes import (
+    ReadYourWritesMiddleware,
+    read_only,
+)
+
+
+def build_app() -> FastAPI:
+    """Build a minimal app with read and write endpoints."""
+    app = FastAPI()
+
+    @app.get("/items")
+    async def read_items() -> list[int]:
+        return [1]
+
+    @app.post("/items")
+    async def write_item() -> int:
+        return 1
+
+    @app.post("/items/check")
+    @read_only
+    async def check_item() -> bool:
+        return True
+
+    return app
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "expected_status", "pinned"),
+    [
+        ("GET", "/items", status.HTTP_200_OK, False),
+        ("POST", "/items", status.HTTP_200_OK, True),
+        ("DELETE", "/items", status.HTTP_405_METHOD_NOT_ALLOWED, False),
+        ("POST", "/items/check", status.HTTP_200_OK, False),
+    ],
+)
+async def test_read_primary_cookie_after_writes(
+    method: str, path: str, expected_status: int, pinned: bool
+) -> None:
+    """Test that only successful writes pin the client to the primary."""
+    middleware = ReadYourWritesMiddleware(build_app(), max_age=7)
+    transport = httpx.ASGITransport(app=middleware)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        response = await c.request(method, path)
+
+    assert response.status_code == expected_status
+    assert (READ_PRIMARY_COOKIE in response.cookies) == pinned
+    if pinned:
+        assert "Max-Age=7" in response.headers["set-cookie"]
@@ -0,0 +1,17 @@
+import pytest
+from pydantic import ValidationError
+
+from src.app.core.config import AppSettings
+
+
+@pytest.mark.parametrize("version", [4, 7])
+def test_uuid_version_supported(version: int) -> None:
+    """Test that supported UUID versions are accepted."""
+    assert AppSettings(UUID_VERSION=version).UUID_VERSION == version
+
+
+@pytest.mark.parametrize("version", [1, 5, 8])
+def test_uuid_version_unsupported(version: int) -> None:
+    """Test that unsupported UUID versions are rejected when settings load."""
+    with pytest.raises(ValidationError, match="UUID_VERSION"):
+        AppSettings(UUID_VERSION=version)
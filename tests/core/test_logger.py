@@ -0,0 +1,98 @@
+import json
+import logging
+import time
+from pathlib import Path
+
+import pytest
+
+from src.app.core import logger as app_logger
+from src.app.core.logger import (
+    JSONFormatter,
+    RateLimitFilter,
+    configure_logging,
+    stop_logging,
+)
+
+
+def make_record(msg: str, *args: object, name: str = "test") -> logging.LogRecord:
+    """Build a log record as a logger would."""
+    return logging.LogRecord(name, logging.WARNING, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_filter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that records over the rate are dropped and counted per logger."""
+    now = 100.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    rate_filter = RateLimitFilter(rate=2, period=60)
+
+    assert [rate_filter.filter(make_record("bad id %s", i)) for i in range(5)] == [
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+    # Other loggers have their own limit
+    assert rate_filter.filter(make_record("bad id", name="other"))
+
+    now += 60
+    record = make_record("bad id %s", 5)
+    assert rate_filter.filter(record)
+    assert record.getMessage() == "bad id 5 (3 similar records dropped)"
+
+    record = make_record("bad id %s", 6)
+    assert rate_filter.filter(record)
+    assert record.getMessage() == "bad id 6"
+
+
+def test_json_formatter() -> None:
+    """Test that records are formatted as one JSON object."""
+    entry = json.loads(JSONFormatter().format(make_record("bad id %s", "x")))
+
+    assert entry["level"] == "WARNING"
+    assert entry["logger"] == "test"
+    assert entry["message"] == "bad id x"
+    assert entry["time"].endswith("+00:00")
+
+
+def test_configure_logging_queue(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that records go through the queue to the log file as JSON."""
+    log_file = tmp_path / "logs" / "app.log"
+    monkeypatch.setattr(app_logger, "LOG_FILE_PATH", str(log_file))
+    root = logging.getLogger()
+    root_handlers, root_level = root.handlers[:], root.level
+
+    listener = configure_logging(json_format=True)
+    logging.getLogger("src.app.test").warning("queued %s", "record")
+    stop_logging(listener)
+    root.setLevel(root_level)
+
+    assert root.handlers == root_handlers
+    (line,) = log_file.read_text().splitlines()
+    assert json.loads(line)["message"] == "queued record"
+
+
+def test_configure_logging_json_exception(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that exceptions reach the JSON formatter through the queue."""
+    log_file = tmp_path / "app.log"
+    monkeypatch.setattr(app_logger, "LOG_FILE_PATH", str(log_file))
+    root = logging.getLogger()
+    root_level = root.level
+
+    listener = configure_logging(json_format=True)
+    try:
+        raise ValueError("boom")  # noqa: TRY301
+    except ValueError:
+        logging.getLogger("src.app.test").exception("failed %s", "request")
+    stop_logging(listener)
+    root.setLevel(root_level)
+
+    (line,) = log_file.read_text().splitlines()
+    entry = json.loads(line)
+    assert entry["message"] == "failed request"
+    assert entry["exc_info"].startswith("Traceback")
+    assert "ValueError: boom" in entry["exc_info"]
@@ -0,0 +1,32 @@
+import pytest
+
+from src.app.core.negotiation import is_msgpack, select_media_type
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("", "application/json"),
+        ("*/*", "application/json"),
+        ("application/msgpack", "application/msgpack"),
+        ("application/x-msgpack", "application/msgpack"),
+        ("application/json, application/msgpack", "application/json"),
+        ("application/json;q=0.5, application/msgpack", "application/msgpack"),
+        ("application/msgpack;q=0.8, */*;q=0.1", "application/msgpack"),
+        ("application/msgpack;q=0", "application/json"),
+        ("application/msgpack;v=1;q=0.5, application/json", "application/json"),
+        ("application/json;q=0.5;foo, application/msgpack;q=0.4", "application/json"),
+        ("text/html", "application/json"),
+    ],
+)
+def test_select_media_type(accept: str, expected: str) -> None:
+    """Test that MessagePack is only picked when weighted above JSON."""
+    assert select_media_type(accept) == expected
+
+
+def test_is_msgpack() -> None:
+    """Test MessagePack Content-Type detection."""
+    assert is_msgpack("application/msgpack")
+    assert is_msgpack("Application/X-MsgPack; charset=binary")
+    assert not is_msgpack("application/json")
+    assert not is_msgpack(None)
@@ -0,0 +1,54 @@
+import json
+import uuid
+
+import msgpack
+
+from src.app.core.negotiation import response_media_type
+from src.app.core.responses import PydanticJSONResponse
+from src.app.schemas.template_host_schema import TemplateHostSchema
+from src.app.schemas.template_vpc_schema import TemplateVPCHeaderSchema
+
+host = TemplateHostSchema(
+    id=uuid.uuid4(),
+    hostname="example-host-1",
+    os="debian_11",
+    spec="tiny",
+    size=8,
+    tags=["web", "linux"],
+)
+
+
+def test_render_model() -> None:
+    """Test that a model renders to the same JSON as Pydantic's model_dump_json()."""
+    response = PydanticJSONResponse(host)
+    assert response.body == host.model_dump_json().encode()
+    assert response.media_type == "application/json"
+
+
+def test_render_model_list() -> None:
+    """Test that a list of models with non-native JSON types renders correctly."""
+    vpc_header = TemplateVPCHeaderSchema(
+        id=uuid.uuid4(), cidr="192.168.0.0/16", name="example-vpc-1"
+    )
+    response = PydanticJSONResponse([vpc_header, vpc_header])
+
+    expected = json.loads(vpc_header.model_dump_json())
+    assert json.loads(bytes(response.body)) == [expected, expected]
+
+
+def test_render_plain_json() -> None:
+    """Test that plain JSON compatible content still renders."""
+    response = PydanticJSONResponse({"msg": "pong", "ok": True})
+    assert json.loads(bytes(response.body)) == {"msg": "pong", "ok": True}
+
+
+def test_render_negotiated_msgpack() -> None:
+    """Test that a model renders to MessagePack when it was negotiated."""
+    token = response_media_type.set("application/msgpack")
+    try:
+        response = PydanticJSONResponse(host)
+    finally:
+        response_media_type.reset(token)
+
+    assert response.media_type == "application/msgpack"
+    assert msgpack.unpackb(response.body) == json.loads(host.model_dump_json())
@@ -0,0 +1,148 @@
+import copy
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, status
+
+from src.app.core.uploads import LimitedRequestStream, parse_range_template
+
+MAX_SIZE = 4096
+
+range_payload: dict[str, Any] = {
+    "vpcs": [
+        {
+            "cidr": "192.168.0.0/16",
+            "name": "example-vpc-1",
+            "subnets": [
+                {
+                    "cidr": "192.168.1.0/24",
+                    "name": "example-subnet-1",
+                    "hosts": [
+                        {
+                            "hostname": f"example-host-{i}",
+                            "os": "debian_11",
+                            "spec": "tiny",
+                            "size": 8,
+                            "tags": ["web", "linux"],
+                        }
+                        for i in range(5)
+                    ],
+                },
+                {
+                    "name": "example-subnet-2",
+                    "hosts": [
+                        {
+                            "hostname": "example-host-1",
+                            "os": "debian_11",
+                            "spec": "tiny",
+                            "size": 8,
+                        }
+                    ],
+                },
+            ],
+        }
+    ],
+    "provider": "aws",
+    "name": "example-range-1",
+    "vnc": False,
+    "vpn": False,
+}
+
+
+def build_app() -> FastAPI:
+    """Build a minimal app parsing streamed range templates in chunks of 2 hosts."""
+    app = FastAPI()
+
+    @app.post("/ranges")
+    async def upload_range(request: Request) -> dict[str, Any]:
+        range_template = await parse_range_template(
+            LimitedRequestStream(request, MAX_SIZE), chunk_size=2
+        )
+        return range_template.model_dump(mode="json")
+
+    return app
+
+
+async def post(content: bytes | AsyncIterator[bytes]) -> httpx.Response:
+    """Post a range template body to the minimal app."""
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.post(
+            "/ranges", content=content, headers={"Content-Type": "application/json"}
+        )
+
+
+async def chunked(body: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    """Stream a body in small chunks without a Content-Length."""
+    for start in range(0, len(body), chunk_size):
+        yield body[start : start + chunk_size]
+
+
+async def test_parse_range_template_in_chunks() -> None:
+    """Test that a streamed range is parsed into the same template as in one piece."""
+    response = await post(chunked(json.dumps(range_payload).encode(), 7))
+
+    assert response.status_code == status.HTTP_200_OK
+    parsed = response.json()
+    hosts = [host["hostname"] for host in parsed["vpcs"][0]["subnets"][0]["hosts"]]
+    assert hosts == [f"example-host-{i}" for i in range(5)]
+    # Range-wide validation still ran, allocating the missing subnet CIDR
+    assert parsed["vpcs"][0]["subnets"][1]["cidr"] == "192.168.0.0/24"
+
+
+async def test_parse_range_template_host_errors() -> None:
+    """Test that host errors in later chunks point at the right host."""
+    payload = copy.deepcopy(range_payload)
+    payload["vpcs"][0]["subnets"][0]["hosts"][3]["hostname"] = "-invalid-host"
+    payload["vpcs"][0]["subnets"][1]["hosts"][0]["size"] = 0
+
+    response = await post(json.dumps(payload).encode())
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    errors = [(error["loc"], error["type"]) for error in response.json()["detail"]]
+    assert errors == [
+        (["body", "vpcs", 0, "subnets", 0, "hosts", 3, "hostname"], "value_error"),
+        (["body", "vpcs", 0, "subnets", 1, "hosts", 0, "size"], "greater_than"),
+    ]
+
+
+async def test_parse_range_template_range_errors() -> None:
+    """Test that range-wide errors are reported after all hosts are parsed."""
+    payload = copy.deepcopy(range_payload)
+    payload["vpcs"][0]["subnets"][0]["hosts"][4]["hostname"] = "example-host-0"
+
+    response = await post(json.dumps(payload).encode())
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    (error,) = response.json()["detail"]
+    assert error["loc"] == ["body", "vpcs", 0, "subnets", 0, "hosts"]
+    assert "All hostnames must be unique." in error["msg"]
+
+
+@pytest.mark.parametrize("body", [b"", b'{"vpcs": [', b"not json"])
+async def test_parse_range_template_invalid_json(body: bytes) -> None:
+    """Test that bodies that are not JSON are rejected."""
+    response = await post(body)
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert response.json()["detail"][0]["type"] == "json_invalid"
+
+
+async def test_limited_request_stream_content_length() -> None:
+    """Test that a body declared larger than the limit is rejected up front."""
+    response = await post(b" " * (MAX_SIZE + 1))
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+
+async def test_limited_request_stream_streamed_size() -> None:
+    """Test that a streamed body is rejected once it grows past the limit."""
+    payload = copy.deepcopy(range_payload)
+    payload["name"] = "x" * MAX_SIZE
+
+    response = await post(chunked(json.dumps(payload).encode(), 512))
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
@@ -0,0 +1,179 @@
+import uuid
+from contextlib import asynccontextmanager
+from ipaddress import IPv4Network
+from typing import Any, AsyncGenerator
+
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from src.app.crud.crud_host_templates import (
+    get_host_template,
+    get_host_template_headers,
+)
+from src.app.crud.crud_range_templates import (
+    delete_range_template,
+    get_range_template,
+)
+from src.app.crud.crud_subnet_templates import get_subnet_template_headers
+from src.app.crud.crud_vpc_templates import get_vpc_template_headers
+from src.app.enums.operating_systems import OpenLabsOS
+from src.app.enums.providers import OpenLabsProvider
+from src.app.enums.specs import OpenLabsSpec
+from src.app.models.template_host_model import TemplateHostModel
+from src.app.models.template_range_model import TemplateRangeModel
+from src.app.models.template_subnet_model import TemplateSubnetModel
+from src.app.models.template_vpc_model import TemplateVPCModel
+from src.app.schemas.template_host_schema import TemplateHostID
+from src.app.schemas.template_range_schema import TemplateRangeID
+
+# Seeded hierarchy: ranges -> VPCs -> subnets -> hosts
+RANGES = 2000
+VPCS_PER_RANGE = 2
+SUBNETS_PER_VPC = 2
+HOSTS_PER_SUBNET = 5
+STANDALONE_PER_TABLE = 50
+
+
+def child_rows(
+    parent_key: str, parent_ids: list[uuid.UUID], per_parent: int, **values: Any
+) -> list[dict[str, Any]]:
+    """Build rows for children of each parent plus standalone rows.
+
+    Args:
+    ----
+        parent_key (str): Foreign key column pointing to the parent.
+        parent_ids (list[uuid.UUID]): Parent IDs.
+        per_parent (int): Number of children per parent.
+        **values (Any): Values shared by every row.
+
+    Returns:
+    -------
+        list[dict[str, Any]]: Rows with a fresh ID each.
+
+    """
+    parents: list[uuid.UUID | None] = [
+        parent_id for parent_id in parent_ids for _ in range(per_parent)
+    ]
+    parents += [None] * STANDALONE_PER_TABLE
+    return [{"id": uuid.uuid4(), parent_key: parent, **values} for parent in parents]
+
+
+async def seed_templates(conn: AsyncConnection) -> None:
+    """Insert a large template hierarchy plus standalone templates."""
+    ranges: list[dict[str, Any]] = [
+        {
+            "id": uuid.uuid4(),
+            "name": "plan-range",
+            "provider": OpenLabsProvider.AWS,
+            "vnc": False,
+            "vpn": False,
+        }
+        for _ in range(RANGES)
+    ]
+    vpcs = child_rows(
+        "range_id",
+        [row["id"] for row in ranges],
+        VPCS_PER_RANGE,
+        name="plan-vpc",
+        cidr=IPv4Network("10.0.0.0/16"),
+    )
+    subnets = child_rows(
+        "vpc_id",
+        [row["id"] for row in vpcs if row["range_id"]],
+        SUBNETS_PER_VPC,
+        name="plan-subnet",
+        cidr=IPv4Network("10.0.1.0/24"),
+    )
+    hosts = child_rows(
+        "subnet_id",
+        [row["id"] for row in subnets if row["vpc_id"]],
+        HOSTS_PER_SUBNET,
+        hostname="plan-host",
+        os=OpenLabsOS.DEBIAN_12,
+        spec=OpenLabsSpec.TINY,
+        size=8,
+        tags=[],
+    )
+
+    await conn.execute(insert(TemplateRangeModel), ranges)
+    await conn.execute(insert(TemplateVPCModel), vpcs)
+    await conn.execute(insert(TemplateSubnetModel), subnets)
+    await conn.execute(insert(TemplateHostModel), hosts)
+
+    # Refresh planner statistics so plans reflect the seeded sizes
+    for model in (
+        TemplateRangeModel,
+        TemplateVPCModel,
+        TemplateSubnetModel,
+        TemplateHostModel,
+    ):
+        await conn.execute(text(f"ANALYZE {model.__tablename__}"))
+
+
+@asynccontextmanager
+async def seeded_connection(
+    engine: AsyncEngine,
+) -> AsyncGenerator[AsyncConnection, None]:
+    """Connection with a large seeded dataset that is rolled back afterwards."""
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            await seed_templates(conn)
+            yield conn
+        finally:
+            await trans.rollback()
+
+
+async def test_hot_queries_use_indexes(async_engine: AsyncEngine) -> None:
+    """Test that hierarchy lookups, standalone filters and cascading deletes never seq scan."""
+    async with seeded_connection(async_engine) as conn:
+        await assert_no_seq_scans(conn)
+
+
+async def assert_no_seq_scans(seeded_conn: AsyncConnection) -> None:
+    """Run the hot CRUD queries and check none of their plans use a seq scan."""
+    range_id = await seeded_conn.scalar(text("SELECT id FROM range_templates LIMIT 1"))
+    host_id = await seeded_conn.scalar(
+        text("SELECT id FROM host_templates WHERE subnet_id IS NULL LIMIT 1")
+    )
+
+    statements: list[tuple[str, Any]] = []
+
+    def capture_statement(*args: Any) -> None:  # noqa: ANN401
+        statement, parameters, _, executemany = args[2:]
+        # Batched statements share one plan, so explain the first parameter set
+        statements.append((statement, parameters[0] if executemany else parameters))
+
+    sync_engine = seeded_conn.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture_statement)
+    try:
+        async with AsyncSession(
+            bind=seeded_conn, join_transaction_mode="create_savepoint"
+        ) as db:
+            await get_range_template(db, TemplateRangeID(id=range_id))
+            await get_host_template(db, TemplateHostID(id=host_id))
+            await get_vpc_template_headers(db, standalone_only=True)
+            await get_subnet_template_headers(db, standalone_only=True)
+            await get_host_template_headers(db, standalone_only=True)
+
+        # Fresh session so the cascade loads each level of children itself
+        async with AsyncSession(
+            bind=seeded_conn, join_transaction_mode="create_savepoint"
+        ) as db:
+            range_model = await db.get(TemplateRangeModel, range_id)
+            assert range_model
+            assert await delete_range_template(db, range_model)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture_statement)
+
+    queries = [
+        (statement, parameters)
+        for statement, parameters in statements
+        if statement.lstrip().upper().startswith(("SELECT", "DELETE"))
+    ]
+    assert queries
+
+    for statement, parameters in queries:
+        result = await seeded_conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        plan = "\n".join(row[0] for row in result)
+        assert "Seq Scan" not in plan, f"{statement}\n{plan}"
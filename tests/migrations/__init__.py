@@ -0,0 +1 @@
+"""Database migration tests for the OpenLabsX API."""
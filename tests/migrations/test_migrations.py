@@ -0,0 +1,140 @@
+import uuid
+from typing import Generator
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, make_url, text
+
+from src.app.core.db.database import Base
+
+
+@pytest.fixture
+def empty_database(postgres_container: str) -> Generator[str, None, None]:
+    """Create an empty database next to the test database.
+
+    Returns
+    -------
+        Generator[str, None, None]: Async connection string to the empty database.
+
+    """
+    url = make_url(postgres_container)
+    database = f"migrations_{uuid.uuid4().hex[:8]}"
+
+    admin_engine = create_engine(
+        url.set(drivername="postgresql+psycopg2"), isolation_level="AUTOCOMMIT"
+    )
+    with admin_engine.connect() as conn:
+        conn.execute(text(f'CREATE DATABASE "{database}"'))
+
+    yield url.set(database=database).render_as_string(hide_password=False)
+
+    with admin_engine.connect() as conn:
+        conn.execute(text(f'DROP DATABASE "{database}"'))
+    admin_engine.dispose()
+
+
+def alembic_config(database_url: str) -> Config:
+    """Build an Alembic config for the project migrations."""
+    config = Config("alembic.ini", attributes={"configure_logger": False})
+    config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
+    return config
+
+
+def test_migrations_match_models(empty_database: str) -> None:
+    """Test that upgrading an empty database produces the schema of the models."""
+    command.upgrade(alembic_config(empty_database), "head")
+
+    sync_url = make_url(empty_database).set(drivername="postgresql+psycopg2")
+    engine = create_engine(sync_url)
+    try:
+        with engine.connect() as conn:
+            diff = compare_metadata(MigrationContext.configure(conn), Base.metadata)
+    finally:
+        engine.dispose()
+
+    assert diff == []
+
+
+def test_migrations_downgrade_to_empty(empty_database: str) -> None:
+    """Test that every migration can be reverted."""
+    config = alembic_config(empty_database)
+    command.upgrade(config, "head")
+    command.downgrade(config, "base")
+
+    sync_url = make_url(empty_database).set(drivername="postgresql+psycopg2")
+    engine = create_engine(sync_url)
+    try:
+        with engine.connect() as conn:
+            tables = set(inspect(conn).get_table_names()) - {"alembic_version"}
+            enums = conn.execute(
+                text("SELECT typname FROM pg_type WHERE typtype = 'e'")
+            )
+            assert not tables
+            assert not enums.all()
+    finally:
+        engine.dispose()
+
+
+def test_migration_backfills_nested_template_counters(empty_database: str) -> None:
+    """Test that adding the counters fills them in for existing templates."""
+    config = alembic_config(empty_database)
+    command.upgrade(config, "0002")
+
+    range_id, vpc_id, subnet_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    sync_url = make_url(empty_database).set(drivername="postgresql+psycopg2")
+    engine = create_engine(sync_url)
+    try:
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO range_templates (id, name, provider, vnc, vpn) "
+                    "VALUES (:id, 'range', 'AWS', false, false)"
+                ),
+                {"id": range_id},
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO vpc_templates (id, name, cidr, range_id) "
+                    "VALUES (:id, 'vpc', '10.0.0.0/16', :range_id)"
+                ),
+                {"id": vpc_id, "range_id": range_id},
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO subnet_templates (id, name, cidr, vpc_id) "
+                    "VALUES (:id, 'subnet', '10.0.1.0/24', :vpc_id)"
+                ),
+                {"id": subnet_id, "vpc_id": vpc_id},
+            )
+            for hostname in ("host-1", "host-2"):
+                conn.execute(
+                    text(
+                        "INSERT INTO host_templates "
+                        "(id, hostname, os, spec, size, tags, subnet_id) "
+                        "VALUES (:id, :hostname, 'DEBIAN_11', 'TINY', 8, '{}', "
+                        ":subnet_id)"
+                    ),
+                    {"id": uuid.uuid4(), "hostname": hostname, "subnet_id": subnet_id},
+                )
+
+        command.upgrade(config, "0003")
+
+        with engine.connect() as conn:
+            range_counts = conn.execute(
+                text("SELECT vpc_count, subnet_count, host_count FROM range_templates")
+            ).one()
+            vpc_counts = conn.execute(
+                text("SELECT subnet_count, host_count FROM vpc_templates")
+            ).one()
+            subnet_counts = conn.execute(
+                text("SELECT host_count FROM subnet_templates")
+            ).one()
+    finally:
+        engine.dispose()
+
+    assert tuple(range_counts) == (1, 1, 2)
+    assert tuple(vpc_counts) == (1, 2)
+    assert tuple(subnet_counts) == (2,)
@@ -0,0 +1,27 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from src.app.core.db.query_stats import QueryStats, track_queries
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """Fail if the code in the block executes more SQL statements than budgeted.
+
+    Catches N+1 regressions, e.g. `with assert_max_queries(4): await client.get(...)`.
+
+    Args:
+    ----
+        max_queries (int): Max number of SQL statements allowed.
+
+    Returns:
+    -------
+        Iterator[QueryStats]: Stats of the statements executed in the block.
+
+    """
+    with track_queries() as stats:
+        yield stats
+
+    assert (
+        stats.count <= max_queries
+    ), f"Expected at most {max_queries} queries, got {stats.count}."
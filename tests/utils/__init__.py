@@ -0,0 +1 @@
+"""Utility tests for the OpenLabsX API."""
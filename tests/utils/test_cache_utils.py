@@ -0,0 +1,28 @@
+from src.app.utils.cache_utils import LRUCache, content_digest
+
+
+def test_lru_cache_evicts_least_recently_used() -> None:
+    """Test that the least recently used entry is evicted when full."""
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3  # noqa: PLR2004
+
+
+def test_content_digest_canonical() -> None:
+    """Test that key order does not change the digest but content does."""
+    digest = content_digest({"name": "range", "vpcs": [{"cidr": "10.0.0.0/16"}]})
+
+    assert digest == content_digest(
+        {"vpcs": [{"cidr": "10.0.0.0/16"}], "name": "range"}
+    )
+    assert digest != content_digest(
+        {"name": "range", "vpcs": [{"cidr": "10.1.0.0/16"}]}
+    )
+    assert content_digest([1, 2]) != content_digest([2, 1])
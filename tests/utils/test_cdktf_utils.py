@@ -0,0 +1,24 @@
+import os
+from pathlib import Path
+
+from src.app.utils.cdktf_utils import get_cdktf_dir
+
+
+def test_get_cdktf_dir_created_once() -> None:
+    """Test that the temp CDKTF dir is created on first use and then reused."""
+    get_cdktf_dir.cache_clear()
+
+    cdktf_dir = get_cdktf_dir()
+    assert os.path.isdir(cdktf_dir)
+    assert get_cdktf_dir() == cdktf_dir
+
+    os.rmdir(cdktf_dir)
+    get_cdktf_dir.cache_clear()
+
+
+def test_get_cdktf_dir_configured(tmp_path: Path) -> None:
+    """Test that a configured CDKTF dir is created if missing."""
+    configured = str(tmp_path / "cdktf")
+
+    assert get_cdktf_dir(configured) == configured
+    assert os.path.isdir(configured)
@@ -0,0 +1,155 @@
+from ipaddress import IPv4Address, IPv4Network
+
+import pytest
+
+from src.app.utils.cidr_utils import (
+    CIDRAllocator,
+    allocate_jump_box_subnet,
+    host_addresses,
+)
+
+
+def test_allocate_lowest_free_blocks() -> None:
+    """Test that blocks are handed out lowest address first without overlap."""
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/16"))
+
+    assert allocator.allocate(24) == IPv4Network("10.0.0.0/24")
+    assert allocator.allocate(25) == IPv4Network("10.0.1.0/25")
+    assert allocator.allocate(24) == IPv4Network("10.0.2.0/24")
+    assert allocator.allocate(25) == IPv4Network("10.0.1.128/25")
+
+
+def test_allocate_prefers_smallest_free_block() -> None:
+    """Test that small blocks are cut from leftovers, keeping large blocks whole."""
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/22"))
+    allocator.reserve(IPv4Network("10.0.2.0/24"))
+
+    # 10.0.0.0/23 is free at a lower address, but 10.0.3.0/24 fits exactly
+    assert allocator.allocate(24) == IPv4Network("10.0.3.0/24")
+    assert allocator.allocate(23) == IPv4Network("10.0.0.0/23")
+
+
+def test_allocate_skips_reserved_blocks() -> None:
+    """Test that reserved blocks are never allocated."""
+    allocator = CIDRAllocator(IPv4Network("192.168.0.0/16"))
+    allocator.reserve(IPv4Network("192.168.0.0/24"))
+    allocator.reserve(IPv4Network("192.168.1.128/25"))
+
+    assert allocator.allocate(25) == IPv4Network("192.168.1.0/25")
+    assert allocator.allocate(24) == IPv4Network("192.168.2.0/24")
+
+
+def test_allocate_whole_network() -> None:
+    """Test that a block can be the whole network, once."""
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/24"))
+
+    assert allocator.allocate(24) == IPv4Network("10.0.0.0/24")
+    with pytest.raises(ValueError, match="No free /24 block"):
+        allocator.allocate(24)
+
+
+def test_allocate_fallback_prefix() -> None:
+    """Test falling back to smaller blocks when no block of the size is free."""
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/24"))
+    allocator.reserve(IPv4Network("10.0.0.0/25"))
+
+    assert allocator.allocate(24, fallback_prefixlen=26) == IPv4Network("10.0.0.128/25")
+    with pytest.raises(ValueError, match="No free /26 block"):
+        allocator.allocate(24, fallback_prefixlen=26)
+
+
+def test_allocate_block_larger_than_network() -> None:
+    """Test that blocks larger than the network are rejected."""
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/24"))
+
+    with pytest.raises(ValueError, match="does not fit"):
+        allocator.allocate(16)
+
+
+def test_allocate_keep_free() -> None:
+    """Test that blocks are split rather than taking the last free block whole."""
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/24"))
+    block = allocator.allocate(24, fallback_prefixlen=28, keep_free=28)
+    assert block == IPv4Network("10.0.0.0/25")
+    assert allocate_jump_box_subnet(allocator) == IPv4Network("10.0.0.128/25")
+
+    # Every /24 of a /16, the last one split to keep room
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/16"))
+    blocks = [
+        allocator.allocate(24, fallback_prefixlen=28, keep_free=28) for _ in range(256)
+    ]
+    assert blocks[-1] == IPv4Network("10.0.255.0/25")
+    assert allocate_jump_box_subnet(allocator) == IPv4Network("10.0.255.128/25")
+
+
+def test_reserve_rejects_used_or_outside_blocks() -> None:
+    """Test that blocks overlapping used space or outside the network are rejected."""
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/16"))
+    allocator.reserve(IPv4Network("10.0.1.0/24"))
+
+    with pytest.raises(ValueError, match="already in use"):
+        allocator.reserve(IPv4Network("10.0.1.64/26"))
+    with pytest.raises(ValueError, match="already in use"):
+        allocator.reserve(IPv4Network("10.0.0.0/23"))
+    with pytest.raises(ValueError, match="not contained"):
+        allocator.reserve(IPv4Network("10.1.0.0/24"))
+
+
+def test_allocate_exhausts_network() -> None:
+    """Test that every block of a fully split network is allocated exactly once."""
+    allocator = CIDRAllocator(IPv4Network("172.16.0.0/20"))
+    allocator.reserve(IPv4Network("172.16.5.0/24"))
+
+    blocks = [allocator.allocate(24) for _ in range(15)]
+
+    assert len(set(blocks)) == len(blocks)
+    assert IPv4Network("172.16.5.0/24") not in blocks
+    with pytest.raises(ValueError, match="No free"):
+        allocator.allocate(28)
+
+
+def test_jump_box_subnet_size() -> None:
+    """Test that the jump box gets a /24, small VPCs or free space permitting."""
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/16"))
+    allocator.reserve(IPv4Network("10.0.0.0/24"))
+    assert allocate_jump_box_subnet(allocator) == IPv4Network("10.0.1.0/24")
+
+    # Whole VPC when smaller than a /24
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/26"))
+    assert allocate_jump_box_subnet(allocator) == IPv4Network("10.0.0.0/26")
+
+    # Smaller block when no /24 is free
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/24"))
+    allocator.reserve(IPv4Network("10.0.0.0/25"))
+    assert allocate_jump_box_subnet(allocator) == IPv4Network("10.0.0.128/25")
+
+    allocator = CIDRAllocator(IPv4Network("10.0.0.0/24"))
+    allocator.reserve(IPv4Network("10.0.0.0/24"))
+    with pytest.raises(ValueError, match="No free"):
+        allocate_jump_box_subnet(allocator)
+
+
+def test_host_addresses_skip_reserved() -> None:
+    """Test that hosts get consecutive addresses after the reserved ones."""
+    assert host_addresses(IPv4Network("10.0.1.0/24"), 3) == [
+        IPv4Address("10.0.1.4"),
+        IPv4Address("10.0.1.5"),
+        IPv4Address("10.0.1.6"),
+    ]
+    assert host_addresses(IPv4Network("10.0.1.0/24"), 0) == []
+
+
+def test_host_addresses_fill_subnet() -> None:
+    """Test that a full subnet is assigned every usable address but broadcast."""
+    subnet = IPv4Network("10.0.0.0/16")
+    addresses = host_addresses(subnet, 65531)
+
+    assert addresses[0] == IPv4Address("10.0.0.4")
+    assert addresses[-1] == IPv4Address("10.0.255.254")
+    assert len(set(addresses)) == len(addresses)
+
+
+def test_host_addresses_too_many_hosts() -> None:
+    """Test that more hosts than usable addresses are rejected."""
+    with pytest.raises(ValueError, match="no room for 12 hosts"):
+        host_addresses(IPv4Network("10.0.0.0/28"), 12)
@@ -0,0 +1,20 @@
+import pytest
+
+from src.app.utils.header_utils import parse_accept
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("", []),
+        ("gzip, ZSTD", [("gzip", 1.0), ("zstd", 1.0)]),
+        ("application/msgpack;v=1;q=0.5", [("application/msgpack", 0.5)]),
+        ("application/json;q=0.5;foo", [("application/json", 0.5)]),
+        ("text/html; Q=0.2 , */*;q=0.1", [("text/html", 0.2), ("*/*", 0.1)]),
+        ("gzip;q=high, zstd;q=2", [("gzip", 0.0), ("zstd", 0.0)]),
+        ("gzip,, ;q=1", [("gzip", 1.0)]),
+    ],
+)
+def test_parse_accept(header: str, expected: list[tuple[str, float]]) -> None:
+    """Test that every parameter is parsed and only q sets the weight."""
+    assert parse_accept(header) == expected
@@ -0,0 +1,127 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from src.app.utils.single_flight_utils import SingleFlight
+
+
+async def test_single_flight_shares_concurrent_calls() -> None:
+    """Test that concurrent calls with the same key run the call once."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    tasks = [asyncio.create_task(flight.do("key", fn)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [42] * 5
+    assert calls == 1
+    assert len(flight) == 0
+
+
+async def test_single_flight_different_keys() -> None:
+    """Test that calls with different keys are not coalesced."""
+    flight: SingleFlight[str, str] = SingleFlight()
+    calls: list[str] = []
+
+    def make_fn(key: str) -> Callable[[], Awaitable[str]]:
+        async def fn() -> str:
+            calls.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        return fn
+
+    results = await asyncio.gather(
+        flight.do("a", make_fn("a")), flight.do("b", make_fn("b"))
+    )
+    assert list(results) == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+
+async def test_single_flight_does_not_cache() -> None:
+    """Test that a finished call is run again by the next caller."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("key", fn) == 1
+    assert await flight.do("key", fn) == 2  # noqa: PLR2004
+
+
+async def test_single_flight_shares_exceptions() -> None:
+    """Test that every waiting caller gets the exception raised by the call."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fn() -> int:
+        await release.wait()
+        msg = "boom"
+        raise ValueError(msg)
+
+    tasks = [asyncio.create_task(flight.do("key", fn)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(flight) == 0
+
+
+async def test_single_flight_leader_cancelled() -> None:
+    """Test that waiting callers retry the call when the running caller is cancelled."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    leader = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+    release.set()
+    assert await follower == 2  # noqa: PLR2004
+
+
+async def test_single_flight_follower_cancelled() -> None:
+    """Test that cancelling a waiting caller leaves the shared call running."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def fn() -> int:
+        await release.wait()
+        return 42
+
+    leader = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+
+    follower.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+
+    release.set()
+    assert await leader == 42  # noqa: PLR2004
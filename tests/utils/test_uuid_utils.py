@@ -0,0 +1,41 @@
+import time
+import uuid
+
+import pytest
+
+from src.app.core.config import settings
+from src.app.utils.uuid_utils import generate_uuid, uuid7
+
+
+def test_uuid7_version_and_variant() -> None:
+    """Test that uuid7() generates RFC 9562 version 7 UUIDs."""
+    for _ in range(100):
+        new_uuid = uuid7()
+        assert new_uuid.version == 7  # noqa: PLR2004
+        assert new_uuid.variant == uuid.RFC_4122
+
+
+def test_uuid7_timestamp() -> None:
+    """Test that uuid7() embeds the current Unix time in milliseconds."""
+    before_ms = time.time_ns() // 1_000_000
+    new_uuid = uuid7()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert before_ms <= new_uuid.int >> 80 <= after_ms
+
+
+def test_uuid7_time_ordered() -> None:
+    """Test that uuid7() values sort in creation order (to sub-millisecond precision)."""
+    uuids = [uuid7() for _ in range(1000)]
+    timestamps = [new_uuid.int >> 64 for new_uuid in uuids]
+    assert timestamps == sorted(timestamps)
+    assert len(set(uuids)) == len(uuids)
+
+
+@pytest.mark.parametrize("version", [4, 7])
+def test_generate_uuid_version_setting(
+    monkeypatch: pytest.MonkeyPatch, version: int
+) -> None:
+    """Test that generate_uuid() uses the configured UUID version."""
+    monkeypatch.setattr(settings, "UUID_VERSION", version)
+    assert generate_uuid().version == version
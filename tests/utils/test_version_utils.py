@@ -0,0 +1,97 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.app.utils import version_utils
+from src.app.utils.version_utils import get_app_version
+
+
+@pytest.fixture(autouse=True)
+def clear_version_cache() -> Iterator[None]:
+    """Resolve the version again in every test."""
+    get_app_version.cache_clear()
+    yield
+    get_app_version.cache_clear()
+
+
+def test_version_from_build_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the version written at build time is used without git."""
+    version_file = tmp_path / "VERSION"
+    version_file.write_text("1.2.3\n")
+    monkeypatch.setattr(version_utils, "VERSION_FILE", version_file)
+
+    assert get_app_version() == "1.2.3"
+
+
+def test_version_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the version is only resolved once per process."""
+    version_file = tmp_path / "VERSION"
+    version_file.write_text("1.2.3")
+    monkeypatch.setattr(version_utils, "VERSION_FILE", version_file)
+    assert get_app_version() == "1.2.3"
+
+    version_file.write_text("4.5.6")
+    assert get_app_version() == "1.2.3"
+
+
+def test_version_fallback_without_git(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the fallback version when there is no build file and no git repo."""
+    monkeypatch.setattr(version_utils, "VERSION_FILE", tmp_path / "VERSION")
+    monkeypatch.chdir(tmp_path)
+
+    assert get_app_version() == version_utils.UNKNOWN_VERSION
+
+
+def fake_checkout(root: Path, commit: str) -> None:
+    """Create the git files pointing HEAD at a commit."""
+    (root / ".git" / "refs" / "heads").mkdir(parents=True, exist_ok=True)
+    (root / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (root / ".git" / "refs" / "heads" / "main").write_text(f"{commit}\n")
+
+
+def test_git_head_packed_ref(tmp_path: Path) -> None:
+    """Test that the checked out commit is found in packed refs."""
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (tmp_path / ".git" / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        "abc123 refs/heads/main\n"
+        "def456 refs/tags/v1.0.0\n"
+    )
+
+    assert version_utils.git_head(tmp_path) == "abc123"
+    assert version_utils.git_head(tmp_path / "missing") is None
+
+
+def test_git_version_cached_per_commit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the version resolved from git is reused by later processes."""
+    monkeypatch.setattr(version_utils, "VERSION_FILE", tmp_path / "VERSION")
+    monkeypatch.setattr(version_utils, "VERSION_CACHE_FILE", tmp_path / "cache")
+    monkeypatch.chdir(tmp_path)
+    fake_checkout(tmp_path, "abc123")
+
+    resolved: list[str] = []
+
+    def get_version() -> str:
+        resolved.append("git")
+        return f"1.0.{len(resolved)}"
+
+    monkeypatch.setattr("setuptools_scm.get_version", get_version)
+
+    assert get_app_version() == "1.0.1"
+    get_app_version.cache_clear()
+    assert get_app_version() == "1.0.1"
+    assert len(resolved) == 1
+
+    # Resolved again once another commit is checked out
+    fake_checkout(tmp_path, "def456")
+    get_app_version.cache_clear()
+    assert get_app_version() == "1.0.2"
+    assert (tmp_path / "cache").read_text() == "def456 1.0.2\n"
@@ -1,7 +1,8 @@
 import uuid
 from random import randint
 
-from src.app.validators.id import is_valid_uuid4
+from src.app.utils.uuid_utils import uuid7
+from src.app.validators.id import is_valid_uuid, is_valid_uuid4
 
 
 def test_valid_uuid4() -> None:
@@ -22,3 +23,21 @@ def test_wrong_uuid_version_uuid4() -> None:
     """Test that we get false for the wrong UUID version."""
     uuid3_str = str(uuid.uuid1(randint(0, 100), randint(0, 100)))  # noqa: S311
     assert not is_valid_uuid4(uuid3_str)
+
+
+def test_valid_uuid_versions() -> None:
+    """Test that is_valid_uuid() accepts both UUID4 and UUID7 strings."""
+    assert is_valid_uuid(str(uuid.uuid4()))
+    assert is_valid_uuid(str(uuid7()))
+
+
+def test_invalid_uuid_version() -> None:
+    """Test that is_valid_uuid() rejects UUID versions not used for IDs."""
+    uuid1_str = str(uuid.uuid1(randint(0, 100), randint(0, 100)))  # noqa: S311
+    assert not is_valid_uuid(uuid1_str)
+    assert not is_valid_uuid(str(uuid7()), versions=(4,))
+
+
+def test_uuid4_rejects_uuid7() -> None:
+    """Test that is_valid_uuid4() still only accepts UUID4 strings."""
+    assert not is_valid_uuid4(str(uuid7()))
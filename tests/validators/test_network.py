@@ -2,9 +2,13 @@ from ipaddress import IPv4Network
 
 from src.app.enums.operating_systems import OpenLabsOS
 from src.app.validators.network import (
+    are_valid_disk_sizes,
+    are_valid_hostnames,
+    find_overlapping_networks,
     is_valid_disk_size,
     is_valid_hostname,
     max_num_hosts_in_subnet,
+    min_subnet_prefix,
 )
 
 
@@ -69,6 +73,22 @@ def test_numeric_tld() -> None:
     assert is_valid_hostname("123.example")
 
 
+def test_hostname_with_newline() -> None:
+    """Test hostnames with a trailing newline are invalid."""
+    assert not is_valid_hostname("example\n")
+    assert not is_valid_hostname("example.com.\n")
+
+
+def test_are_valid_hostnames() -> None:
+    """Test checking many hostnames at once."""
+    hostnames = [f"example-host-{i}.example.com" for i in range(1000)]
+    assert are_valid_hostnames(hostnames)
+    assert are_valid_hostnames([])
+
+    hostnames.append("example.123")
+    assert not are_valid_hostnames(hostnames)
+
+
 def test_valid_host_size() -> None:
     """Test host disk size minimums."""
     assert is_valid_disk_size(OpenLabsOS.DEBIAN_11, 10)
@@ -76,6 +96,13 @@ def test_valid_host_size() -> None:
     assert not is_valid_disk_size(OpenLabsOS.WINDOWS_2016, 10)
 
 
+def test_are_valid_disk_sizes() -> None:
+    """Test checking many host disk size minimums at once."""
+    oses = [OpenLabsOS.DEBIAN_11, OpenLabsOS.WINDOWS_2016]
+    assert are_valid_disk_sizes(oses, [10, 32])
+    assert not are_valid_disk_sizes(oses, [10, 10])
+
+
 def test_max_number_of_hosts_in_subnet() -> None:
     """Test max number of hosts in subnet."""
     standard_24_subnet = IPv4Network("192.168.1.0/24")
@@ -90,3 +117,42 @@ def test_max_number_of_hosts_in_subnet() -> None:
     standard_31_subnet = IPv4Network("192.168.1.0/31")
     max_hosts_31_subnet = 0
     assert max_num_hosts_in_subnet(standard_31_subnet) == max_hosts_31_subnet
+
+
+def test_min_subnet_prefix() -> None:
+    """Test the smallest subnet prefix that fits a number of hosts."""
+    assert min_subnet_prefix(0) == 28  # noqa: PLR2004
+    assert min_subnet_prefix(11) == 28  # noqa: PLR2004
+    assert min_subnet_prefix(12) == 27  # noqa: PLR2004
+    assert min_subnet_prefix(251) == 24  # noqa: PLR2004
+    assert min_subnet_prefix(252) == 23  # noqa: PLR2004
+
+
+def test_find_overlapping_networks() -> None:
+    """Test that every overlapping pair is reported, outer network first."""
+    networks = [
+        IPv4Network("10.0.1.0/24"),
+        IPv4Network("10.0.0.0/16"),
+        IPv4Network("10.1.0.0/16"),
+        IPv4Network("10.0.1.128/25"),
+        IPv4Network("10.0.2.0/24"),
+        IPv4Network("10.1.0.0/16"),
+    ]
+
+    assert find_overlapping_networks(networks) == [
+        (0, 3),
+        (1, 0),
+        (1, 3),
+        (1, 4),
+        (2, 5),
+    ]
+
+
+def test_find_overlapping_networks_disjoint() -> None:
+    """Test that adjacent and disjoint networks do not overlap."""
+    networks = [
+        IPv4Network(f"10.0.{i}.{j * 16}/28") for i in range(256) for j in range(16)
+    ]
+
+    assert not find_overlapping_networks(networks)
+    assert not find_overlapping_networks([])